@@ -34,6 +34,7 @@ from .service_manager import (
     get_service_status,
     list_services,
     check_critical_services,
+    clear_service_cache,
 )
 
 __all__ = [
@@ -64,6 +65,7 @@ __all__ = [
     "get_service_status",
     "list_services",
     "check_critical_services",
+    "clear_service_cache",
 ]
 
 __version__ = "1.0.0"
@@ -7,6 +7,7 @@ Eszközök lemezterület elemzéshez, nagy fájlok kereséséhez és
 könyvtár méretek meghatározásához.
 """
 
+import heapq
 import os
 from datetime import datetime
 from pathlib import Path
@@ -172,7 +173,7 @@ def find_large_files(
         raise FileNotFoundError(f"Könyvtár nem található: {path}")
 
     exclude_patterns = exclude_patterns or []
-    large_files = []
+    candidates = []
 
     for entry in path.rglob("*"):
         try:
@@ -185,27 +186,38 @@ def find_large_files(
 
             stat = entry.stat()
             if stat.st_size >= min_size_bytes:
-                # Tulajdonos lekérdezése
-                try:
-                    import pwd
-                    owner = pwd.getpwuid(stat.st_uid).pw_name
-                except (ImportError, KeyError):
-                    owner = str(stat.st_uid)
-
-                large_files.append(
-                    LargeFile(
-                        path=str(entry),
-                        size_bytes=stat.st_size,
-                        modified_time=datetime.fromtimestamp(stat.st_mtime),
-                        owner=owner,
-                    )
-                )
+                candidates.append((entry, stat))
         except (PermissionError, OSError):
             continue
 
-    # Rendezés méret szerint (csökkenő)
-    large_files.sort(key=lambda x: x.size_bytes, reverse=True)
-    return large_files[:max_results]
+    # Rendezés méret szerint (csökkenő, stabil); LargeFile modell és tulajdonos
+    # lekérdezés csak a megtartott találatokhoz készül
+    largest = heapq.nlargest(
+        max_results, candidates, key=lambda candidate: candidate[1].st_size
+    )
+
+    large_files = []
+    for entry, stat in largest:
+        # Tulajdonos lekérdezése
+        try:
+            import pwd
+            owner = pwd.getpwuid(stat.st_uid).pw_name
+        except (ImportError, KeyError):
+            owner = str(stat.st_uid)
+
+        try:
+            large_files.append(
+                LargeFile(
+                    path=str(entry),
+                    size_bytes=stat.st_size,
+                    modified_time=datetime.fromtimestamp(stat.st_mtime),
+                    owner=owner,
+                )
+            )
+        except OSError:
+            continue
+
+    return large_files
 
 
 def get_directory_sizes(
@@ -7,8 +7,10 @@ Eszközök rendszer logok (syslog, auth.log, stb.) elemzéséhez.
 """
 
 import re
+from array import array
 from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Generator, Optional
 
@@ -40,17 +42,213 @@ AUTH_FAILURE_PATTERNS = [
     re.compile(r"Invalid user\s+(\S+)\s+from\s+(\S+)"),
 ]
 
+# Auth minták előszűrője: minden fenti minta tartalmazza valamelyik kulcsszót,
+# így a legtöbb (nem auth) sort egyetlen keresés kiszűri
+_AUTH_KEYWORD_KINDS = {
+    "Accepted": "success",
+    "session opened": "success",
+    "Failed": "failure",
+    "authentication failure": "failure",
+    "Invalid user": "failure",
+}
+_AUTH_KEYWORDS = re.compile("|".join(map(re.escape, _AUTH_KEYWORD_KINDS)))
+
+# Log szint kulcsszavak, prioritási sorrendben (az első találat dönt)
+LEVEL_KEYWORDS = {
+    LogLevel.EMERGENCY: ("emerg", "emergency"),
+    LogLevel.ALERT: ("alert",),
+    LogLevel.CRITICAL: ("crit", "critical"),
+    LogLevel.ERROR: ("err", "error", "failed", "failure"),
+    LogLevel.WARNING: ("warn", "warning"),
+    LogLevel.NOTICE: ("notice",),
+    LogLevel.INFO: ("info",),
+    LogLevel.DEBUG: ("debug",),
+}
+
 # Log szint felismerő minták
 LEVEL_PATTERNS = {
-    LogLevel.EMERGENCY: re.compile(r"\b(emerg|emergency)\b", re.IGNORECASE),
-    LogLevel.ALERT: re.compile(r"\balert\b", re.IGNORECASE),
-    LogLevel.CRITICAL: re.compile(r"\b(crit|critical)\b", re.IGNORECASE),
-    LogLevel.ERROR: re.compile(r"\b(err|error|failed|failure)\b", re.IGNORECASE),
-    LogLevel.WARNING: re.compile(r"\b(warn|warning)\b", re.IGNORECASE),
-    LogLevel.NOTICE: re.compile(r"\bnotice\b", re.IGNORECASE),
-    LogLevel.INFO: re.compile(r"\binfo\b", re.IGNORECASE),
-    LogLevel.DEBUG: re.compile(r"\bdebug\b", re.IGNORECASE),
+    level: re.compile(rf"\b({'|'.join(words)})\b", re.IGNORECASE)
+    for level, words in LEVEL_KEYWORDS.items()
+}
+
+# Kulcsszó -> szint, az egymenetes (szavankénti) kereséshez
+_KEYWORD_LEVELS = {
+    word: level for level, words in LEVEL_KEYWORDS.items() for word in words
+}
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Szint -> fix számláló index az analyze() szintenkénti számlálásához
+_LEVEL_SLOTS = {level: slot for slot, level in enumerate(LogLevel)}
+
+# Számsorozatok a hibaüzenetek normalizálásához
+NUMBER_PATTERN = re.compile(r"\d+")
+
+# Hónap rövidítések a regex nélküli syslog feldolgozáshoz
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
 }
+_DIGITS = frozenset("0123456789")
+# A program név írásjelei (a SYSLOG_PATTERN [\w\-\.\/] osztályából)
+_PROGRAM_PUNCTUATION = str.maketrans("", "", "_-./")
+
+SyslogFields = tuple[datetime, str, str, Optional[int], str]
+
+
+@lru_cache(maxsize=1024)
+def _parse_syslog_timestamp(stamp: str, year: int) -> Optional[datetime]:
+    """
+    "Mmm dd hh:mm:ss" timestamp átalakítása datetime-má strptime nélkül.
+
+    Egy log fájl egymást követő sorai jellemzően ugyanarra a másodpercre
+    esnek, ezért az eredmény cache-elt: a sorok többsége egy dict
+    kereséssel kapja meg a timestamp-et.
+
+    Args:
+        stamp: A sor első 15 karaktere.
+        year: Év a timestamp-hez.
+
+    Returns:
+        datetime, vagy None ha a formátum nem a szabványos fix szélességű.
+
+    Raises:
+        ValueError: Ha a dátum/idő értékek érvénytelenek (pl. Feb 30).
+    """
+    month = _MONTHS.get(stamp[:3])
+    if month is None or stamp[3] != " " or stamp[6] != " ":
+        return None
+    if stamp[9] != ":" or stamp[12] != ":":
+        return None
+    if stamp[4] != " " and stamp[4] not in _DIGITS:
+        return None
+    for i in (5, 7, 8, 10, 11, 13, 14):
+        if stamp[i] not in _DIGITS:
+            return None
+
+    return datetime(
+        year,
+        month,
+        int(stamp[4:6]),
+        int(stamp[7:9]),
+        int(stamp[10:12]),
+        int(stamp[13:15]),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _parse_syslog_header(header: str) -> Optional[tuple[str, str, Optional[int]]]:
+    """
+    A "host program[pid]" fejléc szétbontása.
+
+    Egy folyamat sorai ugyanazt a fejlécet ismétlik (azonos host, program
+    és PID), ezért az eredmény cache-elt: csak az első előfordulást kell
+    ellenőrizni, a többi sor egy dict keresés.
+
+    Args:
+        header: A sor a timestamp utáni szóköztől az első kettőspontig.
+
+    Returns:
+        (hostname, program, pid), vagy None ha nem a szabványos alak.
+    """
+    # Hostname: az első szóközig, whitespace nélkül
+    host_end = header.find(" ")
+    hostname = header[:host_end]
+    if host_end < 0 or hostname.split() != [hostname]:
+        return None
+
+    # Program és opcionális [pid]
+    program = header[host_end + 1 :]
+    pid: Optional[int] = None
+    if program.endswith("]"):
+        bracket = program.find("[")
+        pid_str = program[bracket + 1 : -1]
+        if bracket < 0 or not pid_str.isdecimal():
+            return None
+        pid = int(pid_str)
+        program = program[:bracket]
+    if not program.translate(_PROGRAM_PUNCTUATION).isalnum():
+        return None
+
+    return hostname, program, pid
+
+
+def _scan_syslog_line(line: str, year: int) -> Optional[SyslogFields]:
+    """
+    Syslog sor feldolgozása regex nélkül, fix pozíciók és str.find alapján.
+
+    Csak a szabványos "Mmm dd hh:mm:ss host program[pid]: message" alakot
+    kezeli (egyszeres szóközökkel, angol hónapnévvel). Minden más esetben
+    None-t ad, és a hívó a SYSLOG_PATTERN regex-re esik vissza.
+
+    Args:
+        line: A log sor (strip-elve).
+        year: Év a timestamp-hez.
+
+    Returns:
+        (timestamp, hostname, program, pid, message) vagy None.
+
+    Raises:
+        ValueError: Ha a dátum/idő értékek érvénytelenek (pl. Feb 30).
+    """
+    # Timestamp: "Mmm dd hh:mm:ss" fix 15 karakteren
+    if len(line) < 18 or line[15] != " ":
+        return None
+    timestamp = _parse_syslog_timestamp(line[:15], year)
+    if timestamp is None:
+        return None
+
+    # Fejléc: "host program[pid]" az első (hostname utáni) kettőspontig
+    host_end = line.find(" ", 16)
+    if host_end < 0:
+        return None
+    colon = line.find(":", host_end + 1)
+    if colon < 0:
+        return None
+    header = _parse_syslog_header(line[16:colon])
+    if header is None:
+        return None
+    hostname, program, pid = header
+
+    message = line[colon + 1 :].lstrip()
+    if "\n" in message:
+        return None
+
+    return timestamp, hostname, program, pid, message
+
+
+def _match_syslog_line(line: str, year: int) -> Optional[SyslogFields]:
+    """
+    Syslog sor feldolgozása a SYSLOG_PATTERN regex-szel.
+
+    Lassabb, de megengedőbb út (pl. több szóköz, tab, kisbetűs hónapnév).
+
+    Args:
+        line: A log sor (strip-elve).
+        year: Év a timestamp-hez.
+
+    Returns:
+        (timestamp, hostname, program, pid, message) vagy None.
+    """
+    match = SYSLOG_PATTERN.match(line)
+    if not match:
+        return None
+
+    groups = match.groupdict()
+
+    # Timestamp konvertálása
+    try:
+        timestamp_str = f"{year} {groups['timestamp']}"
+        timestamp = datetime.strptime(timestamp_str, "%Y %b %d %H:%M:%S")
+    except ValueError:
+        return None
+
+    # PID konvertálása
+    pid = int(groups["pid"]) if groups.get("pid") else None
+
+    return timestamp, groups["hostname"], groups["program"], pid, groups["message"]
 
 
 class LogAnalyzer:
@@ -85,45 +283,55 @@ class LogAnalyzer:
         if not line:
             return None
 
-        match = SYSLOG_PATTERN.match(line)
-        if not match:
-            return None
-
-        groups = match.groupdict()
-
-        # Timestamp konvertálása
+        # Gyors út a szabványos formátumra, egyébként regex
         try:
-            timestamp_str = f"{self.year} {groups['timestamp']}"
-            timestamp = datetime.strptime(timestamp_str, "%Y %b %d %H:%M:%S")
+            fields = _scan_syslog_line(line, self.year)
         except ValueError:
             return None
+        if fields is None:
+            fields = _match_syslog_line(line, self.year)
+            if fields is None:
+                return None
 
-        # PID konvertálása
-        pid = int(groups["pid"]) if groups.get("pid") else None
+        timestamp, hostname, program, pid, message = fields
 
         # Log szint detektálása
-        level = self._detect_level(groups["message"])
+        level = self._detect_level(message)
 
         return LogEntry(
             timestamp=timestamp,
-            hostname=groups["hostname"],
-            program=groups["program"],
+            hostname=hostname,
+            program=program,
             pid=pid,
-            message=groups["message"],
+            message=message,
             level=level,
             raw_line=line,
         )
 
-    def _detect_level(self, message: str) -> LogLevel:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _detect_level(message: str) -> LogLevel:
         """
         Log szint detektálása üzenet alapján.
 
+        Az eredmény üzenetenként cache-elt: az ismétlődő log sablonok
+        (pl. ugyanaz a cron/sshd üzenet) nem futtatják újra a mintákat.
+
         Args:
             message: A log üzenet.
 
         Returns:
             Detektált LogLevel.
         """
+        if message.isascii():
+            # Egy menet: szavakra bontás és szótár keresés. ASCII szövegen ez
+            # pontosan a LEVEL_PATTERNS \b...\b + IGNORECASE illesztése.
+            words = _KEYWORD_LEVELS.keys() & _WORD_PATTERN.findall(message.lower())
+            if not words:
+                return LogLevel.INFO
+            found = {_KEYWORD_LEVELS[word] for word in words}
+            return next(level for level in LEVEL_KEYWORDS if level in found)
+
         for level, pattern in LEVEL_PATTERNS.items():
             if pattern.search(message):
                 return level
@@ -164,40 +372,61 @@ class LogAnalyzer:
 
         # Számlálók
         program_counter: Counter[str] = Counter()
-        level_counter: Counter[str] = Counter()
+        # Szintenként egy fix slot (enum .value és dict frissítés nélkül)
+        level_counts = array("Q", bytes(8 * len(_LEVEL_SLOTS)))
         error_messages: Counter[str] = Counter()
 
         # Auth log elemzés
         failed_logins = 0
         successful_logins = 0
 
-        timestamps = []
+        # Időtartomány egy menetben (timestamp lista és min/max bejárás nélkül)
+        time_range_start = time_range_end = entries[0].timestamp
 
         for entry in entries:
             program_counter[entry.program] += 1
-            level_counter[entry.level.value] += 1
-            timestamps.append(entry.timestamp)
+            level_counts[_LEVEL_SLOTS[entry.level]] += 1
+            if entry.timestamp < time_range_start:
+                time_range_start = entry.timestamp
+            elif entry.timestamp > time_range_end:
+                time_range_end = entry.timestamp
 
             # Hiba üzenetek gyűjtése
             if entry.level in (LogLevel.ERROR, LogLevel.CRITICAL, LogLevel.EMERGENCY):
                 # Üzenet normalizálása (számok eltávolítása)
-                normalized = re.sub(r"\d+", "N", entry.message[:100])
+                normalized = NUMBER_PATTERN.sub("N", entry.message[:100])
                 error_messages[normalized] += 1
 
-            # Auth log elemzés
-            for pattern in AUTH_SUCCESS_PATTERNS:
-                if pattern.search(entry.message):
-                    successful_logins += 1
-                    break
-
-            for pattern in AUTH_FAILURE_PATTERNS:
-                if pattern.search(entry.message):
-                    failed_logins += 1
-                    break
+            # Auth log elemzés: csak a kulcsszó szerinti mintacsoport fut
+            auth_kinds = {
+                _AUTH_KEYWORD_KINDS[keyword]
+                for keyword in _AUTH_KEYWORDS.findall(entry.message)
+            }
+            if not auth_kinds:
+                continue
+
+            if "success" in auth_kinds:
+                for pattern in AUTH_SUCCESS_PATTERNS:
+                    if pattern.search(entry.message):
+                        successful_logins += 1
+                        break
+
+            if "failure" in auth_kinds:
+                for pattern in AUTH_FAILURE_PATTERNS:
+                    if pattern.search(entry.message):
+                        failed_logins += 1
+                        break
 
         # Top error üzenetek
         top_errors = [msg for msg, _ in error_messages.most_common(10)]
 
+        # Szint statisztika dict-je csak a ténylegesen előforduló szintekkel
+        level_counter = {
+            level.value: level_counts[slot]
+            for level, slot in _LEVEL_SLOTS.items()
+            if level_counts[slot]
+        }
+
         return LogAnalysisResult(
             total_entries=len(entries),
             error_count=sum(
@@ -206,9 +435,9 @@ class LogAnalyzer:
             ),
             warning_count=level_counter.get(LogLevel.WARNING.value, 0),
             entries_by_program=dict(program_counter),
-            entries_by_level=dict(level_counter),
-            time_range_start=min(timestamps) if timestamps else None,
-            time_range_end=max(timestamps) if timestamps else None,
+            entries_by_level=level_counter,
+            time_range_start=time_range_start,
+            time_range_end=time_range_end,
             top_error_messages=top_errors,
             failed_logins=failed_logins,
             successful_logins=successful_logins,
@@ -7,10 +7,26 @@ Eszközök systemd szolgáltatások lekérdezéséhez és monitorozásához.
 """
 
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from .models import ServiceState, ServiceStatus
 
+# Státusz cache: szolgáltatás neve -> (ServiceStatus, lejárati idő time.monotonic() szerint)
+_status_cache: dict[str, tuple[ServiceStatus, float]] = {}
+
+# Alapértelmezett cache élettartam másodpercben
+_STATUS_TTL = 2.0
+
+# A "systemctl show" által lekérdezett tulajdonságok
+_SHOW_PROPERTIES = "MainPID,MemoryCurrent,Description,LoadState,SubState"
+
+# Az "is-enabled" ezekre az UnitFileState értékekre ad 0 kilépési kódot
+_ENABLED_UNIT_FILE_STATES = frozenset(
+    {"enabled", "enabled-runtime", "alias", "static", "indirect", "generated", "transient"}
+)
+
 
 def _run_systemctl(args: list[str]) -> tuple[str, int]:
     """
@@ -36,12 +52,18 @@ def _run_systemctl(args: list[str]) -> tuple[str, int]:
         return "", -2
 
 
-def get_service_status(service_name: str) -> ServiceStatus:
+def get_service_status(service_name: str, ttl: float = _STATUS_TTL) -> ServiceStatus:
     """
-    Szolgáltatás státusz lekérdezése.
+    Szolgáltatás státusz lekérdezése, rövid TTL-lel cache-elve.
+
+    Egy ellenőrzési menetben (list -> check -> report) ugyanaz a
+    szolgáltatás többször is sorra kerülhet; a cache miatt a systemctl
+    hívások csak egyszer futnak le TTL-enként. A visszaadott objektumot
+    a hívók közösen kapják, nem szabad módosítani.
 
     Args:
         service_name: A szolgáltatás neve (pl. "nginx", "sshd").
+        ttl: Cache élettartam másodpercben (0 = mindig friss lekérdezés).
 
     Returns:
         ServiceStatus objektum a szolgáltatás információival.
@@ -51,25 +73,64 @@ def get_service_status(service_name: str) -> ServiceStatus:
         >>> print(f"State: {status.state}")
         >>> print(f"Active: {status.is_active}")
     """
-    # Alapértelmezett értékek
-    state = ServiceState.UNKNOWN
-    is_enabled = False
-    is_active = False
-    pid = None
-    memory_bytes = None
-    description = None
-    load_state = None
-    sub_state = None
+    now = time.monotonic()
+    cached = _status_cache.get(service_name)
+    if cached is not None and cached[1] > now:
+        return cached[0]
 
-    # is-enabled ellenőrzés
-    stdout, rc = _run_systemctl(["is-enabled", service_name])
-    if rc == 0:
-        is_enabled = True
+    status = _query_service_status(service_name)
+    _status_cache[service_name] = (status, now + ttl)
+    return status
 
-    # is-active ellenőrzés
-    stdout, rc = _run_systemctl(["is-active", service_name])
-    active_status = stdout.strip().lower()
-    is_active = active_status == "active"
+
+def clear_service_cache() -> None:
+    """
+    A get_service_status() által használt státusz cache ürítése.
+
+    Example:
+        >>> clear_service_cache()  # pl. szolgáltatás újraindítása után vagy tesztekben
+    """
+    _status_cache.clear()
+
+
+def _parse_properties(block: str) -> dict[str, str]:
+    """
+    "Kulcs=érték" soros systemctl show kimenet feldolgozása.
+
+    Args:
+        block: Egy unit tulajdonság blokkja.
+
+    Returns:
+        Tulajdonság név -> érték dict.
+    """
+    properties = {}
+    for line in block.strip().split("\n"):
+        if "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        properties[key] = value
+    return properties
+
+
+def _build_status(
+    service_name: str,
+    is_enabled: bool,
+    active_status: str,
+    properties: dict[str, str],
+) -> ServiceStatus:
+    """
+    ServiceStatus összeállítása a systemctl válaszokból.
+
+    Args:
+        service_name: A szolgáltatás neve.
+        is_enabled: Engedélyezett-e a szolgáltatás.
+        active_status: Az aktív állapot (is-active kimenet / ActiveState).
+        properties: A show tulajdonságai (_SHOW_PROPERTIES).
+
+    Returns:
+        ServiceStatus objektum.
+    """
+    active_status = active_status.strip().lower()
 
     # Állapot meghatározása
     if active_status == "active":
@@ -81,45 +142,100 @@ def get_service_status(service_name: str) -> ServiceStatus:
     else:
         state = ServiceState.STOPPED
 
-    # Részletes információ lekérdezése
-    stdout, rc = _run_systemctl([
-        "show", service_name,
-        "--property=MainPID,MemoryCurrent,Description,LoadState,SubState"
-    ])
+    pid = None
+    value = properties.get("MainPID", "")
+    if value.isdigit() and int(value) > 0:
+        pid = int(value)
 
-    if rc == 0:
-        for line in stdout.strip().split("\n"):
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-
-            if key == "MainPID" and value.isdigit():
-                pid_val = int(value)
-                if pid_val > 0:
-                    pid = pid_val
-            elif key == "MemoryCurrent" and value.isdigit():
-                mem_val = int(value)
-                # Reason: [not set] értéknél 18446744073709551615 jön vissza
-                if mem_val < 2**62:
-                    memory_bytes = mem_val
-            elif key == "Description":
-                description = value
-            elif key == "LoadState":
-                load_state = value
-            elif key == "SubState":
-                sub_state = value
+    memory_bytes = None
+    value = properties.get("MemoryCurrent", "")
+    # Reason: [not set] értéknél 18446744073709551615 jön vissza
+    if value.isdigit() and int(value) < 2**62:
+        memory_bytes = int(value)
 
     return ServiceStatus(
         name=service_name,
         state=state,
         is_enabled=is_enabled,
-        is_active=is_active,
+        is_active=active_status == "active",
         pid=pid,
         memory_bytes=memory_bytes,
-        description=description,
-        load_state=load_state,
-        sub_state=sub_state,
+        description=properties.get("Description"),
+        load_state=properties.get("LoadState"),
+        sub_state=properties.get("SubState"),
+    )
+
+
+def _query_service_status(service_name: str) -> ServiceStatus:
+    """
+    Szolgáltatás státusz lekérdezése systemctl-lel (cache nélkül).
+
+    Args:
+        service_name: A szolgáltatás neve.
+
+    Returns:
+        ServiceStatus objektum a szolgáltatás információival.
+    """
+    # is-enabled ellenőrzés
+    _, rc = _run_systemctl(["is-enabled", service_name])
+    is_enabled = rc == 0
+
+    # is-active ellenőrzés
+    active_status, _ = _run_systemctl(["is-active", service_name])
+
+    # Részletes információ lekérdezése
+    stdout, rc = _run_systemctl(
+        ["show", service_name, f"--property={_SHOW_PROPERTIES}"]
     )
+    properties = _parse_properties(stdout) if rc == 0 else {}
+
+    return _build_status(service_name, is_enabled, active_status, properties)
+
+
+def _query_service_statuses(
+    units: list[str], service_names: list[str]
+) -> Optional[list[ServiceStatus]]:
+    """
+    Több szolgáltatás státusza egyetlen "systemctl show" hívással.
+
+    A show a unitok tulajdonságait az argumentumok sorrendjében, üres
+    sorral elválasztott blokkokban adja vissza; az ActiveState és
+    UnitFileState kiváltja a unitonkénti is-active/is-enabled hívást.
+
+    Args:
+        units: Unit nevek (pl. "nginx.service").
+        service_names: A hozzájuk tartozó szolgáltatás nevek.
+
+    Returns:
+        ServiceStatus lista a units sorrendjében, vagy None ha a kimenet
+        nem dolgozható fel (a hívó ekkor unitonként kérdez le).
+    """
+    stdout, rc = _run_systemctl(
+        [
+            "show",
+            f"--property={_SHOW_PROPERTIES},ActiveState,UnitFileState",
+            *units,
+        ]
+    )
+    if rc != 0:
+        return None
+
+    blocks = [block for block in stdout.strip().split("\n\n") if block.strip()]
+    if len(blocks) != len(units):
+        return None
+
+    statuses = []
+    for service_name, block in zip(service_names, blocks):
+        properties = _parse_properties(block)
+        statuses.append(
+            _build_status(
+                service_name,
+                properties.get("UnitFileState") in _ENABLED_UNIT_FILE_STATES,
+                properties.get("ActiveState", ""),
+                properties,
+            )
+        )
+    return statuses
 
 
 def list_services(
@@ -129,6 +245,10 @@ def list_services(
     """
     Szolgáltatások listázása.
 
+    A unitok részletes státusza egyetlen "systemctl show" hívással jön
+    (unitonként három systemctl folyamat helyett), és a get_service_status()
+    cache-ébe is bekerül.
+
     Args:
         filter_state: Szűrés állapot alapján.
         filter_enabled: Szűrés enabled állapot alapján.
@@ -146,6 +266,8 @@ def list_services(
     if rc != 0:
         return services
 
+    units = []
+    service_names = []
     for line in stdout.strip().split("\n"):
         if not line:
             continue
@@ -155,15 +277,26 @@ def list_services(
             continue
 
         unit_name = parts[0]
+        units.append(unit_name)
         # Eltávolítjuk a .service kiterjesztést
         if unit_name.endswith(".service"):
-            service_name = unit_name[:-8]
+            service_names.append(unit_name[:-8])
         else:
-            service_name = unit_name
+            service_names.append(unit_name)
+
+    if not units:
+        return services
 
-        # Részletes státusz lekérdezése
-        status = get_service_status(service_name)
+    # Részletes státusz egy hívással; hiba esetén unitonként
+    statuses = _query_service_statuses(units, service_names)
+    if statuses is None:
+        statuses = [get_service_status(name) for name in service_names]
+    else:
+        expires = time.monotonic() + _STATUS_TTL
+        for status in statuses:
+            _status_cache[status.name] = (status, expires)
 
+    for status in statuses:
         # Szűrés alkalmazása
         if filter_state is not None and status.state != filter_state:
             continue
@@ -205,11 +338,14 @@ def check_critical_services(
             "rsyslog",
         ]
 
-    results = {}
-    for name in service_names:
-        results[name] = get_service_status(name)
+    if not service_names:
+        return {}
 
-    return results
+    # A lekérdezések systemctl folyamatokra várnak (a GIL szabad), így szálakon
+    # párhuzamosan futhatnak; a map a bemenet sorrendjét tartja
+    with ThreadPoolExecutor(max_workers=min(16, len(service_names))) as executor:
+        statuses = executor.map(get_service_status, service_names)
+        return dict(zip(service_names, statuses))
 
 
 def get_failed_services() -> list[ServiceStatus]:
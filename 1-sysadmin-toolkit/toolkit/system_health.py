@@ -7,14 +7,48 @@ Eszközök a rendszer egészségének monitorozásához, beleértve a CPU-t,
 memóriát, lemezt és folyamatokat.
 """
 
+import heapq
+import os
+import re
 import socket
+import sys
 from datetime import datetime
+from functools import cache
 from typing import Optional
 
 import psutil
 
 from .models import DiskUsage, ProcessInfo, SystemHealth
 
+# Linux mount tábla és a kernel által ismert fájlrendszer típusok
+_PROC_MOUNTS = "/proc/self/mounts"
+_PROC_FILESYSTEMS = "/proc/filesystems"
+
+# A mount táblában a szóköz, tab stb. oktális escape-ként szerepel (pl. \040)
+_MOUNT_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+@cache
+def _hostname() -> str:
+    """
+    Gépnév lekérdezése, folyamatonként egyszer.
+
+    Returns:
+        A gép hostname-je.
+    """
+    return socket.gethostname()
+
+
+@cache
+def _cpu_count() -> Optional[int]:
+    """
+    Logikai CPU szám lekérdezése, folyamatonként egyszer.
+
+    Returns:
+        Logikai CPU szám (None, ha nem meghatározható).
+    """
+    return psutil.cpu_count(logical=True)
+
 
 def get_cpu_info() -> dict:
     """
@@ -24,10 +58,12 @@ def get_cpu_info() -> dict:
         CPU információkat tartalmazó dict.
     """
     cpu_freq = psutil.cpu_freq()
+    # A CPU szám futás közben nem változik, ezért gyorsítótárból jön
+    cpu_count = _cpu_count()
     return {
         "cpu_percent": psutil.cpu_percent(interval=1),
-        "cpu_count": psutil.cpu_count(),
-        "cpu_count_logical": psutil.cpu_count(logical=True),
+        "cpu_count": cpu_count,
+        "cpu_count_logical": cpu_count,
         "cpu_freq_mhz": cpu_freq.current if cpu_freq else None,
         "cpu_freq_min": cpu_freq.min if cpu_freq else None,
         "cpu_freq_max": cpu_freq.max if cpu_freq else None,
@@ -58,6 +94,90 @@ def get_memory_info() -> dict:
     }
 
 
+@cache
+def _physical_fstypes() -> frozenset[str]:
+    """
+    Blokkeszközös (nem "nodev") fájlrendszer típusok a /proc/filesystems alapján.
+
+    A psutil.disk_partitions(all=False) szűrésével egyezik: a "nodev"
+    típusok közül csak a zfs marad.
+
+    Returns:
+        Fájlrendszer típusok halmaza.
+    """
+    fstypes = set()
+    with open(_PROC_FILESYSTEMS, encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            if fields[0] != "nodev":
+                fstypes.add(fields[0])
+            elif len(fields) > 1 and fields[1] == "zfs":
+                fstypes.add("zfs")
+    return frozenset(fstypes)
+
+
+def _unescape_mount(field: str) -> str:
+    """Mount tábla mező oktális escape-jeinek feloldása (pl. \\040 -> szóköz)."""
+    if "\\" not in field:
+        return field
+    return _MOUNT_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _read_proc_mounts() -> Optional[list[tuple[str, str, str]]]:
+    """
+    Fizikai partíciók beolvasása közvetlenül a Linux mount táblából.
+
+    Returns:
+        (device, mountpoint, fstype) tuple-ök listája, vagy None, ha a
+        mount tábla nem olvasható (nem Linux rendszer).
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        with open(_PROC_MOUNTS, encoding="utf-8", errors="surrogateescape") as f:
+            lines = f.read().splitlines()
+        fstypes = _physical_fstypes()
+    except OSError:
+        return None
+
+    mounts = []
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        device, mountpoint, fstype = fields[0], fields[1], fields[2]
+        if device == "none" or fstype not in fstypes:
+            continue
+        mounts.append((_unescape_mount(device), _unescape_mount(mountpoint), fstype))
+    return mounts
+
+
+def _statvfs_usage(mountpoint: str) -> tuple[int, int, int, float]:
+    """
+    Lemezhasználat egyetlen statvfs hívással, a psutil.disk_usage számítása szerint.
+
+    Args:
+        mountpoint: Csatolási pont.
+
+    Returns:
+        (total, used, free, percent) tuple; a free és a percent a nem root
+        felhasználó számára elérhető helyre vonatkozik.
+
+    Raises:
+        OSError: Ha a csatolási pont nem érhető el.
+    """
+    st = os.statvfs(mountpoint)
+    total = st.f_blocks * st.f_frsize
+    used = total - st.f_bfree * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    total_user = used + free
+    percent = round(used / total_user * 100, 1) if total_user else 0.0
+    return total, used, free, percent
+
+
 def get_disk_info(exclude_types: Optional[list[str]] = None) -> list[DiskUsage]:
     """
     Lemez partíciók információinak lekérdezése.
@@ -72,6 +192,31 @@ def get_disk_info(exclude_types: Optional[list[str]] = None) -> list[DiskUsage]:
     if exclude_types is None:
         exclude_types = ["tmpfs", "devtmpfs", "squashfs", "overlay"]
 
+    # Linuxon a mount tábla egyszeri olvasása + közvetlen statvfs
+    mounts = _read_proc_mounts()
+    if mounts is not None:
+        disks = []
+        for device, mountpoint, fstype in mounts:
+            if fstype in exclude_types:
+                continue
+            try:
+                total, used, free, percent = _statvfs_usage(mountpoint)
+            except OSError:
+                # Reason: Néhány mountpoint nem elérhető (pl. snap)
+                continue
+            disks.append(
+                DiskUsage(
+                    device=device,
+                    mountpoint=mountpoint,
+                    fstype=fstype,
+                    total_bytes=total,
+                    used_bytes=used,
+                    free_bytes=free,
+                    percent_used=percent,
+                )
+            )
+        return disks
+
     disks = []
     for partition in psutil.disk_partitions(all=False):
         if partition.fstype in exclude_types:
@@ -110,52 +255,71 @@ def get_top_processes(
     Returns:
         ProcessInfo objektumok listája.
     """
-    processes = []
-
+    # A process_iter attrs listája Process.as_dict() hívás (oneshot): a mezők
+    # egy menetben olvasódnak. A cmdline külön /proc olvasás, ezért csak a
+    # top N folyamathoz kérjük le.
+    candidates = []
     for proc in psutil.process_iter(
         ["pid", "name", "username", "status", "cpu_percent", "memory_percent",
-         "memory_info", "create_time", "cmdline"]
+         "memory_info", "create_time"]
     ):
         try:
             pinfo = proc.info
-            if pinfo.get("pid") is None:
-                continue
-
-            # cmdline összeállítása
-            cmdline = pinfo.get("cmdline")
-            cmdline_str = " ".join(cmdline) if cmdline else None
-
-            # memory_info kezelése
-            mem_info = pinfo.get("memory_info")
-            rss = mem_info.rss if mem_info else 0
-
-            # create_time konvertálása
-            create_time = pinfo.get("create_time", 0)
-            create_dt = datetime.fromtimestamp(create_time) if create_time else datetime.now()
-
-            processes.append(
-                ProcessInfo(
-                    pid=pinfo["pid"],
-                    name=pinfo.get("name", "unknown"),
-                    username=pinfo.get("username", "unknown"),
-                    status=pinfo.get("status", "unknown"),
-                    cpu_percent=pinfo.get("cpu_percent", 0.0) or 0.0,
-                    memory_percent=pinfo.get("memory_percent", 0.0) or 0.0,
-                    memory_rss_bytes=rss,
-                    create_time=create_dt,
-                    cmdline=cmdline_str,
-                )
-            )
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             continue
+        if pinfo.get("pid") is not None:
+            candidates.append((proc, pinfo))
+
+    # Rendezés: a heapq.nlargest stabil, mint a sort(reverse=True) + szeletelés
+    sort_field = "memory_percent" if sort_by == "memory" else "cpu_percent"
+    top = heapq.nlargest(
+        count, candidates, key=lambda item: item[1].get(sort_field, 0.0) or 0.0
+    )
+
+    results = []
+    for proc, pinfo in top:
+        try:
+            pinfo["cmdline"] = proc.cmdline()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pinfo["cmdline"] = None
+        results.append(_process_info(pinfo))
 
-    # Rendezés
-    if sort_by == "memory":
-        processes.sort(key=lambda p: p.memory_percent, reverse=True)
-    else:
-        processes.sort(key=lambda p: p.cpu_percent, reverse=True)
+    return results
 
-    return processes[:count]
+
+def _process_info(pinfo: dict) -> ProcessInfo:
+    """
+    ProcessInfo összeállítása egy psutil process_iter info dict-ből.
+
+    Args:
+        pinfo: A psutil Process.info dict.
+
+    Returns:
+        ProcessInfo objektum.
+    """
+    # cmdline összeállítása
+    cmdline = pinfo.get("cmdline")
+    cmdline_str = " ".join(cmdline) if cmdline else None
+
+    # memory_info kezelése
+    mem_info = pinfo.get("memory_info")
+    rss = mem_info.rss if mem_info else 0
+
+    # create_time konvertálása
+    create_time = pinfo.get("create_time", 0)
+    create_dt = datetime.fromtimestamp(create_time) if create_time else datetime.now()
+
+    return ProcessInfo(
+        pid=pinfo["pid"],
+        name=pinfo.get("name", "unknown"),
+        username=pinfo.get("username", "unknown"),
+        status=pinfo.get("status", "unknown"),
+        cpu_percent=pinfo.get("cpu_percent", 0.0) or 0.0,
+        memory_percent=pinfo.get("memory_percent", 0.0) or 0.0,
+        memory_rss_bytes=rss,
+        create_time=create_dt,
+        cmdline=cmdline_str,
+    )
 
 
 def get_system_health() -> SystemHealth:
@@ -200,7 +364,7 @@ def get_system_health() -> SystemHealth:
     process_count = len(psutil.pids())
 
     return SystemHealth(
-        hostname=socket.gethostname(),
+        hostname=_hostname(),
         uptime_seconds=uptime,
         boot_time=boot_time,
         cpu_percent=cpu_info["cpu_percent"],
@@ -42,10 +42,13 @@ from .network_tools import (
     is_host_reachable,
     ping_host,
     ping_hosts,
+    ping_hosts_async,
     # Port scanner
     scan_common_ports,
     scan_port,
     scan_ports,
+    scan_ports_async,
+    scan_ports_selector,
     # DNS
     get_mx_records,
     get_nameservers,
@@ -57,12 +60,14 @@ from .network_tools import (
     cidr_to_netmask,
     get_subnet_hosts,
     ip_in_subnet,
+    ips_in_subnet,
     is_private_ip,
     is_valid_ip,
     iterate_subnet_hosts,
     netmask_to_cidr,
     split_subnet,
     # Network info
+    clear_dns_cache,
     get_active_connections,
     get_default_gateway,
     get_fqdn,
@@ -75,11 +80,13 @@ from .network_tools import (
     reverse_resolve,
     # SNMP (async)
     check_snmp_reachable,
+    close_snmp,
     get_interface_stats,
     get_interfaces,
     get_system_info,
     snmp_get,
     snmp_get_bulk,
+    snmp_get_many,
 )
 
 __all__ = [
@@ -99,10 +106,13 @@ __all__ = [
     # Ping
     "ping_host",
     "ping_hosts",
+    "ping_hosts_async",
     "is_host_reachable",
     # Port scanner
     "scan_port",
     "scan_ports",
+    "scan_ports_async",
+    "scan_ports_selector",
     "scan_common_ports",
     # DNS
     "lookup_dns",
@@ -113,6 +123,7 @@ __all__ = [
     # Subnet
     "calculate_subnet",
     "ip_in_subnet",
+    "ips_in_subnet",
     "get_subnet_hosts",
     "iterate_subnet_hosts",
     "netmask_to_cidr",
@@ -124,6 +135,7 @@ __all__ = [
     "get_local_interfaces",
     "get_interface_by_name",
     "get_default_gateway",
+    "clear_dns_cache",
     "get_active_connections",
     "get_listening_ports",
     "get_interface_io_counters",
@@ -134,8 +146,10 @@ __all__ = [
     # SNMP
     "snmp_get",
     "snmp_get_bulk",
+    "snmp_get_many",
     "get_system_info",
     "get_interfaces",
     "get_interface_stats",
     "check_snmp_reachable",
+    "close_snmp",
 ]
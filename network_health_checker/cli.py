@@ -149,6 +149,9 @@ def scan(
     ports: str = typer.Option("22,80,443,8080", "--ports", "-p", help="Portok (pl. '22,80' vagy '20-25,80,443')"),
     timeout: float = typer.Option(1.0, "--timeout", "-t", help="Timeout portonként"),
     banner: bool = typer.Option(False, "--banner", "-b", help="Banner információ lekérése"),
+    preflight: bool = typer.Option(
+        False, "--preflight/--no-preflight", help="Elérhetőségi próba sok port előtt"
+    ),
 ):
     """
     TCP portok szkennelése.
@@ -159,7 +162,7 @@ def scan(
     """
     console.print(f"\n[bold]Scanning {host}...[/bold]\n")
 
-    results = scan_ports(host, ports, timeout=timeout, grab_banner=banner)
+    results = scan_ports(host, ports, timeout=timeout, grab_banner=banner, preflight=preflight)
 
     table = Table(title=f"Port Scan Results: {host}")
     table.add_column("Port", style="cyan", justify="right")
@@ -5,18 +5,17 @@ Ez a modul tartalmazza a konfigurációs beállításokat, amelyeket
 környezeti változókból vagy .env fájlból tölt be.
 """
 
-import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
-from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# .env fájl betöltése a projekt gyökeréből
+# Projekt gyökér (.env fájl helye)
+# A .env fájlt a pydantic-settings olvassa be az első get_settings() hívásakor,
+# így az import nem jár fájl olvasással.
 PROJECT_ROOT = Path(__file__).parent.parent
-load_dotenv(PROJECT_ROOT / ".env")
 
 
 class Settings(BaseSettings):
@@ -55,24 +54,60 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        # Projekt gyökér .env, majd az aktuális könyvtár .env fájlja (ez utóbbi az erősebb)
+        env_file=(str(PROJECT_ROOT / ".env"), ".env"),
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # A séma felépítése az első példányosításig halasztva
+        defer_build=True,
     )
 
 
+class ResolvedSettings(NamedTuple):
+    """
+    Feloldott, csak olvasható beállítások.
+
+    A Settings értékei betöltés után nem változnak, ezért egy NamedTuple-be
+    fagyasztjuk őket: az attribútum elérés így a tuple gyors útvonalán megy.
+    A mezők megegyeznek a Settings mezőivel.
+    """
+
+    snmp_community: str
+    snmp_version: str
+    snmp_port: int
+    default_timeout: float
+    ping_timeout: float
+    port_scan_timeout: float
+    dns_timeout: float
+    mikrotik_host: Optional[str]
+    ubiquiti_host: Optional[str]
+    omada_host: Optional[str]
+    log_level: str
+
+
+def _load_settings_raw() -> Settings:
+    """
+    Beállítások betöltése környezeti változókból és .env fájlból.
+
+    Returns:
+        Validált Settings objektum
+    """
+    return Settings()
+
+
 @lru_cache()
-def get_settings() -> Settings:
+def get_settings() -> ResolvedSettings:
     """
     Beállítások lekérése (cached).
 
     Az első hívás után cache-eli az eredményt a teljesítmény érdekében.
 
     Returns:
-        Settings objektum a konfigurációval
+        ResolvedSettings a konfigurációval
     """
-    return Settings()
+    settings = _load_settings_raw()
+    return ResolvedSettings(**settings.model_dump())
 
 
 # Gyakran használt szolgáltatás nevek és portok
@@ -3,14 +3,24 @@ Pydantic adatmodellek a Network Health Checker-hez.
 
 Ez a modul tartalmazza az összes adatstruktúrát, amelyeket a hálózati
 eszközök használnak az eredmények tárolására és validálására.
+
+A nagy darabszámban keletkező, belső forrásból származó rekordok
+(PortScanResult, SNMPInterface, ConnectionInfo) validáció nélküli,
+__slots__-os dataclass-ok a kisebb memóriaigény és gyorsabb létrehozás miatt.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Közös konfiguráció a csak olvasható hálózati pillanatkép modellekhez:
+# a már validált példányokat (pl. SNMPInterface lista) nem validáljuk és
+# másoljuk újra, a létrehozás után pedig a modellek nem módosíthatók.
+_SNAPSHOT_CONFIG = ConfigDict(revalidate_instances="never", frozen=True, extra="ignore")
+
 
 class HostStatus(str, Enum):
     """
@@ -41,7 +51,7 @@ class PingResult(BaseModel):
         error_message: Hibaüzenet (ha volt hiba)
     """
 
-    model_config = ConfigDict(ser_json_timedelta="iso8601")
+    model_config = ConfigDict(**_SNAPSHOT_CONFIG, ser_json_timedelta="iso8601")
 
     host: str
     ip_address: Optional[str] = None
@@ -51,7 +61,8 @@ class PingResult(BaseModel):
     error_message: Optional[str] = None
 
 
-class PortScanResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PortScanResult:
     """
     TCP port szkennelés eredménye.
 
@@ -88,6 +99,8 @@ class DNSRecord(BaseModel):
         ttl: Time-to-live másodpercben
     """
 
+    model_config = _SNAPSHOT_CONFIG
+
     query: str
     record_type: str
     values: List[str]
@@ -111,6 +124,8 @@ class SubnetInfo(BaseModel):
         cidr: CIDR prefix hossz
     """
 
+    model_config = _SNAPSHOT_CONFIG
+
     network: str
     netmask: str
     broadcast: str
@@ -120,7 +135,8 @@ class SubnetInfo(BaseModel):
     cidr: int
 
 
-class SNMPInterface(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SNMPInterface:
     """
     SNMP interfész statisztikák.
 
@@ -168,6 +184,8 @@ class NetworkDevice(BaseModel):
         interfaces: Interfészek listája
     """
 
+    model_config = _SNAPSHOT_CONFIG
+
     host: str
     sys_name: Optional[str] = None
     sys_descr: Optional[str] = None
@@ -195,6 +213,8 @@ class NetworkInterface(BaseModel):
         mtu: Maximum Transmission Unit
     """
 
+    model_config = _SNAPSHOT_CONFIG
+
     name: str
     ipv4_address: Optional[str] = None
     ipv4_netmask: Optional[str] = None
@@ -205,26 +225,27 @@ class NetworkInterface(BaseModel):
     mtu: Optional[int] = None
 
 
-class ConnectionInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ConnectionInfo:
     """
     Aktív hálózati kapcsolat információk.
 
     Attributes:
         protocol: Protokoll típusa (tcp, udp)
+        status: Kapcsolat állapota (ESTABLISHED, LISTEN, stb.)
         local_address: Helyi IP cím
         local_port: Helyi port
         remote_address: Távoli IP cím
         remote_port: Távoli port
-        status: Kapcsolat állapota (ESTABLISHED, LISTEN, stb.)
         pid: A kapcsolatot birtokló folyamat PID-je
         process_name: A folyamat neve
     """
 
     protocol: str
+    status: str
     local_address: Optional[str] = None
     local_port: Optional[int] = None
     remote_address: Optional[str] = None
     remote_port: Optional[int] = None
-    status: str
     pid: Optional[int] = None
     process_name: Optional[str] = None
@@ -13,10 +13,16 @@ Modulok:
 """
 
 # Ping monitor exports
-from .ping_monitor import is_host_reachable, ping_host, ping_hosts
+from .ping_monitor import is_host_reachable, ping_host, ping_hosts, ping_hosts_async
 
 # Port scanner exports
-from .port_scanner import scan_common_ports, scan_port, scan_ports
+from .port_scanner import (
+    scan_common_ports,
+    scan_port,
+    scan_ports,
+    scan_ports_async,
+    scan_ports_selector,
+)
 
 # DNS lookup exports
 from .dns_lookup import (
@@ -33,6 +39,7 @@ from .subnet_calculator import (
     cidr_to_netmask,
     get_subnet_hosts,
     ip_in_subnet,
+    ips_in_subnet,
     is_private_ip,
     is_valid_ip,
     iterate_subnet_hosts,
@@ -42,6 +49,7 @@ from .subnet_calculator import (
 
 # Network info exports
 from .network_info import (
+    clear_dns_cache,
     get_active_connections,
     get_default_gateway,
     get_fqdn,
@@ -57,21 +65,26 @@ from .network_info import (
 # SNMP exports (async functions)
 from .snmp_query import (
     check_snmp_reachable,
+    close_snmp,
     get_interface_stats,
     get_interfaces,
     get_system_info,
     snmp_get,
     snmp_get_bulk,
+    snmp_get_many,
 )
 
 __all__ = [
     # Ping
     "ping_host",
     "ping_hosts",
+    "ping_hosts_async",
     "is_host_reachable",
     # Port scanner
     "scan_port",
     "scan_ports",
+    "scan_ports_async",
+    "scan_ports_selector",
     "scan_common_ports",
     # DNS
     "lookup_dns",
@@ -82,6 +95,7 @@ __all__ = [
     # Subnet
     "calculate_subnet",
     "ip_in_subnet",
+    "ips_in_subnet",
     "get_subnet_hosts",
     "iterate_subnet_hosts",
     "netmask_to_cidr",
@@ -93,6 +107,7 @@ __all__ = [
     "get_local_interfaces",
     "get_interface_by_name",
     "get_default_gateway",
+    "clear_dns_cache",
     "get_active_connections",
     "get_listening_ports",
     "get_interface_io_counters",
@@ -103,8 +118,10 @@ __all__ = [
     # SNMP
     "snmp_get",
     "snmp_get_bulk",
+    "snmp_get_many",
     "get_system_info",
     "get_interfaces",
     "get_interface_stats",
     "check_snmp_reachable",
+    "close_snmp",
 ]
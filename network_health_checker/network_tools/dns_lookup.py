@@ -11,15 +11,46 @@ Használat:
     ...     print(f"IP: {record}")
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import dns.exception
+import dns.message
+import dns.query
+import dns.rcode
+import dns.rdatatype
 import dns.resolver
 
 from ..config import DNS_RECORD_TYPES, get_settings
 from ..models import DNSRecord
 
 
+def _format_mx(rdata: Any) -> str:
+    """MX rekord formázása: prioritás + mail szerver."""
+    return f"{rdata.preference} {rdata.exchange}"
+
+
+def _format_soa(rdata: Any) -> str:
+    """SOA rekord részletes formázása."""
+    return (
+        f"mname={rdata.mname} rname={rdata.rname} "
+        f"serial={rdata.serial} refresh={rdata.refresh}"
+    )
+
+
+def _format_srv(rdata: Any) -> str:
+    """SRV rekord formázása."""
+    return f"{rdata.priority} {rdata.weight} {rdata.port} {rdata.target}"
+
+
+# Rekord típus -> formázó függvény
+# A standard rekordok (A, AAAA, TXT, CNAME, NS, PTR) str()-rel formázódnak
+_RDATA_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    "MX": _format_mx,
+    "SOA": _format_soa,
+    "SRV": _format_srv,
+}
+
+
 def lookup_dns(
     domain: str,
     record_type: str = "A",
@@ -72,32 +103,14 @@ def lookup_dns(
         answers = resolver.resolve(domain, record_type)
 
         # Eredmények feldolgozása
-        values: List[str] = []
-        ttl: Optional[int] = None
+        # A formázó egyszer választódik ki, a lista pedig egy lépésben épül fel
+        format_rdata = _RDATA_FORMATTERS.get(record_type, str)
+        values: List[str] = [format_rdata(rdata) for rdata in answers]
 
-        for rdata in answers:
-            # TTL mentése az első rekordból
-            if ttl is None:
-                ttl = answers.rrset.ttl
-
-            # Érték formázása a rekord típus alapján
-            if record_type == "MX":
-                # MX rekordnál prioritás + mail szerver
-                values.append(f"{rdata.preference} {rdata.exchange}")
-            elif record_type == "SOA":
-                # SOA rekord részletes formázása
-                values.append(
-                    f"mname={rdata.mname} rname={rdata.rname} "
-                    f"serial={rdata.serial} refresh={rdata.refresh}"
-                )
-            elif record_type == "SRV":
-                # SRV rekord formázása
-                values.append(
-                    f"{rdata.priority} {rdata.weight} {rdata.port} {rdata.target}"
-                )
-            else:
-                # Standard rekordok (A, AAAA, TXT, CNAME, NS, PTR)
-                values.append(str(rdata))
+        # TTL az RRset-ből (rekordonként azonos, nem kell a ciklusban olvasni)
+        ttl: Optional[int] = None
+        if values and answers.rrset is not None:
+            ttl = answers.rrset.ttl
 
         return DNSRecord(
             query=domain,
@@ -143,11 +156,79 @@ def lookup_dns(
         )
 
 
+def _lookup_any(
+    domain: str,
+    record_types: List[str],
+    timeout: float | None = None,
+) -> Optional[Dict[str, DNSRecord]]:
+    """
+    Összes rekord lekérdezése egyetlen ANY kéréssel.
+
+    Az ANY válasz RRset-jeit típus szerint csoportosítja. Sok szerver
+    (RFC 8482) csak részleges választ ad ANY-re, ezért a hívónak a
+    hiányzó típusokat külön le kell kérdeznie.
+
+    Args:
+        domain: A lekérdezendő domain
+        record_types: A figyelembe vett rekord típusok
+        timeout: Lekérdezési időtúllépés
+
+    Returns:
+        {rekord típus: DNSRecord} a válaszban szereplő típusokra,
+        üres dict ha a domain nem létezik, None ha az ANY nem használható
+    """
+    settings = get_settings()
+    if timeout is None:
+        timeout = settings.dns_timeout
+
+    # A dnspython Resolver nem enged meta-lekérdezést (ANY), ezért a kérést
+    # közvetlenül a rendszer első nameserver-ének küldjük
+    resolver = dns.resolver.Resolver()
+
+    try:
+        nameserver = resolver.nameservers[0]
+        if not isinstance(nameserver, str):
+            # Nem sima UDP/TCP nameserver (pl. DoH) - nincs ANY gyors út
+            return None
+        query = dns.message.make_query(domain, dns.rdatatype.ANY)
+        response, _ = dns.query.udp_with_fallback(query, nameserver, timeout=timeout)
+    except Exception:
+        # Timeout / hálózati hiba - visszaesés típusonkénti lekérdezésre
+        return None
+
+    if response.rcode() == dns.rcode.NXDOMAIN:
+        # Domain nem létezik - a típusonkénti lekérdezés sem adna eredményt
+        return {}
+    if response.rcode() != dns.rcode.NOERROR:
+        # REFUSED / NOTIMP - visszaesés típusonkénti lekérdezésre
+        return None
+
+    records: Dict[str, DNSRecord] = {}
+    for rrset in response.answer:
+        record_type = dns.rdatatype.to_text(rrset.rdtype)
+        if record_type not in record_types or record_type in records:
+            continue
+
+        format_rdata = _RDATA_FORMATTERS.get(record_type, str)
+        values = [format_rdata(rdata) for rdata in rrset]
+        if values:
+            records[record_type] = DNSRecord(
+                query=domain,
+                record_type=record_type,
+                values=values,
+                ttl=rrset.ttl,
+            )
+
+    # Használható RRset nélküli válasz (pl. RFC 8482 HINFO) - nincs gyors út
+    return records or None
+
+
 def lookup_all_records(domain: str, timeout: float | None = None) -> List[DNSRecord]:
     """
     Összes gyakori DNS rekord típus lekérdezése.
 
-    Lekérdezi az A, AAAA, MX, TXT, CNAME és NS rekordokat.
+    Lekérdezi az A, AAAA, MX, TXT, CNAME és NS rekordokat. Először egyetlen
+    ANY kérést próbál; az abban nem szereplő típusokat egyenként kérdezi le.
 
     Args:
         domain: A lekérdezendő domain
@@ -157,9 +238,20 @@ def lookup_all_records(domain: str, timeout: float | None = None) -> List[DNSRec
         DNSRecord lista minden sikeres lekérdezéshez
     """
     record_types = ["A", "AAAA", "MX", "TXT", "CNAME", "NS"]
+
+    # Gyors út: egy körút, ha a szerver teljes ANY választ ad
+    any_records = _lookup_any(domain, record_types, timeout)
+    if any_records == {}:
+        # A domain nem létezik
+        return []
+
     results: List[DNSRecord] = []
 
     for record_type in record_types:
+        if any_records and record_type in any_records:
+            results.append(any_records[record_type])
+            continue
+
         result = lookup_dns(domain, record_type, timeout)
         # Csak azokat adjuk vissza ahol van eredmény
         if result.values:
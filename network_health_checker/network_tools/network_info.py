@@ -12,12 +12,51 @@ Használat:
 """
 
 import socket
-from typing import List, Optional
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import psutil
 
 from ..models import ConnectionInfo, NetworkInterface
 
+# Névfeloldási cache: (típus, név) -> (eredmény, lejárati idő time.monotonic()
+# szerint). Csak sikeres feloldás kerül bele, így egy átmeneti hiba nem ragad be.
+_dns_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+# Alapértelmezett cache élettartam másodpercben
+_DNS_CACHE_TTL = 300.0
+
+# A cache legfeljebb ennyi bejegyzést tart (a legrégebbi esik ki)
+_DNS_CACHE_SIZE = 1024
+
+# IPv6 link-local tartomány (fe80::/10) lehetséges első három hexa számjegye
+_LINK_LOCAL_V6_PREFIXES = ("fe8", "fe9", "fea", "feb")
+
+# A negyedik hexa számjegy bármi lehet (kisbetűsített címre)
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _is_link_local_v6(address: str) -> bool:
+    """
+    Ellenőrzi, hogy egy IPv6 cím link-local (fe80::/10) tartományba esik-e.
+
+    Args:
+        address: IPv6 cím string (opcionálisan %scope utótaggal)
+
+    Returns:
+        True ha a cím link-local
+    """
+    # Az első csoportnak teljes, 4 jegyű csoportnak kell lennie (pl. "fe80:");
+    # a "fe8::1" rövidebb csoport valójában 0fe8::1, ami nem link-local
+    head = address[:5].lower()
+    return (
+        len(head) == 5
+        and head[4] == ":"
+        and head[3] in _HEX_DIGITS
+        and head.startswith(_LINK_LOCAL_V6_PREFIXES)
+    )
+
 
 def get_local_interfaces(include_loopback: bool = False) -> List[NetworkInterface]:
     """
@@ -62,7 +101,7 @@ def get_local_interfaces(include_loopback: bool = False) -> List[NetworkInterfac
                 ipv4_netmask = addr.netmask
             elif addr.family == socket.AF_INET6:
                 # IPv6 cím (első nem link-local)
-                if not addr.address.startswith("fe80:"):
+                if not _is_link_local_v6(addr.address):
                     ipv6_address = addr.address
             elif addr.family == psutil.AF_LINK:
                 # MAC cím
@@ -304,20 +343,26 @@ def get_interface_io_counters(interface: str | None = None) -> dict:
         return {}
 
 
+@lru_cache(maxsize=1)
 def get_hostname() -> str:
     """
     Helyi hostname lekérdezése.
 
+    Az eredmény a folyamat élettartamára cache-elődik.
+
     Returns:
         A gép hostname-je
     """
     return socket.gethostname()
 
 
+@lru_cache(maxsize=1)
 def get_fqdn() -> str:
     """
     Helyi FQDN (Fully Qualified Domain Name) lekérdezése.
 
+    Az eredmény a folyamat élettartamára cache-elődik.
+
     Returns:
         A gép teljes domain neve
     """
@@ -328,6 +373,10 @@ def resolve_hostname(hostname: str) -> Optional[str]:
     """
     Hostname feloldása IP címre.
 
+    getaddrinfo()-t használ, így IPv6-only hostokat is felold.
+    A sikeres eredmények TTL-lel cache-elődnek (lásd clear_dns_cache()),
+    a sikertelen feloldást a következő hívás újrapróbálja.
+
     Args:
         hostname: Feloldandó hostname
 
@@ -339,15 +388,110 @@ def resolve_hostname(hostname: str) -> Optional[str]:
         >>> print(f"Google IP: {ip}")
     """
     try:
-        return socket.gethostbyname(hostname)
+        return _lookup(hostname, socket.AF_UNSPEC)
     except socket.gaierror:
         return None
 
 
+def _resolve(host: str, ttl: float = _DNS_CACHE_TTL) -> str:
+    """
+    Hostname feloldása IPv4 címre, TTL-lel korlátozott cache-eléssel.
+
+    A ping és port szkennelés ugyanazt a hostot sokszor feloldaná;
+    a cache miatt csak az első hívás (és a lejárat utáni) megy ki DNS-re.
+    Ezek AF_INET socketeket használnak, ezért itt IPv4 címet kérünk.
+
+    Args:
+        host: Feloldandó hostname vagy IP cím
+        ttl: Cache élettartam másodpercben
+
+    Returns:
+        IPv4 cím string formában
+
+    Raises:
+        socket.gaierror: Ha a hostname nem oldható fel
+    """
+    return _lookup(host, socket.AF_INET, ttl)
+
+
+def _lookup(host: str, family: int, ttl: float = _DNS_CACHE_TTL) -> str:
+    """
+    Cache-elt getaddrinfo() feloldás (resolve_hostname és _resolve közös útja).
+
+    A sikertelen feloldás nem kerül a cache-be.
+
+    Args:
+        host: Feloldandó hostname vagy IP cím
+        family: Címcsalád (socket.AF_INET vagy socket.AF_UNSPEC)
+        ttl: Cache élettartam másodpercben
+
+    Returns:
+        Az első visszakapott cím
+
+    Raises:
+        socket.gaierror: Ha a hostname nem oldható fel
+    """
+    key = ("ipv4" if family == socket.AF_INET else "addr", host)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    addr_info = socket.getaddrinfo(host, None, family=family, type=socket.SOCK_STREAM)
+    if not addr_info:
+        raise socket.gaierror(socket.EAI_NONAME, f"No address for {host!r}")
+    ip_address = str(addr_info[0][4][0])
+
+    _cache_put(key, ip_address, ttl)
+    return ip_address
+
+
+def _cache_get(key: Tuple[str, str]) -> Optional[str]:
+    """
+    Érvényes (le nem járt) cache bejegyzés lekérése.
+
+    Args:
+        key: (típus, név) kulcs
+
+    Returns:
+        A cache-elt eredmény vagy None
+    """
+    cached = _dns_cache.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+    return None
+
+
+def _cache_put(key: Tuple[str, str], value: str, ttl: float = _DNS_CACHE_TTL) -> None:
+    """
+    Sikeres feloldás eltárolása a cache-ben.
+
+    Args:
+        key: (típus, név) kulcs
+        value: Feloldott érték
+        ttl: Élettartam másodpercben
+    """
+    if key not in _dns_cache and len(_dns_cache) >= _DNS_CACHE_SIZE:
+        # A dict beszúrási sorrendet tart: az első elem a legrégebbi
+        del _dns_cache[next(iter(_dns_cache))]
+    _dns_cache[key] = (value, time.monotonic() + ttl)
+
+
+def clear_dns_cache() -> None:
+    """
+    A névfeloldási cache ürítése (_resolve, resolve_hostname, reverse_resolve).
+
+    Example:
+        >>> clear_dns_cache()  # pl. DNS változás után vagy tesztekben
+    """
+    _dns_cache.clear()
+
+
 def reverse_resolve(ip_address: str) -> Optional[str]:
     """
     IP cím feloldása hostname-re.
 
+    A sikeres eredmények TTL-lel cache-elődnek (lásd clear_dns_cache()).
+
     Args:
         ip_address: Feloldandó IP cím
 
@@ -358,8 +502,16 @@ def reverse_resolve(ip_address: str) -> Optional[str]:
         >>> name = reverse_resolve("8.8.8.8")
         >>> print(f"8.8.8.8 = {name}")
     """
+    key = ("ptr", ip_address)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
     try:
-        hostname, _, _ = socket.gethostbyaddr(ip_address)
-        return hostname
-    except (socket.herror, socket.gaierror):
+        # NI_NAMEREQD: hiba, ha nincs név (ne a numerikus címet kapjuk vissza)
+        hostname, _ = socket.getnameinfo((ip_address, 0), socket.NI_NAMEREQD)
+    except (socket.herror, socket.gaierror, OSError):
         return None
+
+    _cache_put(key, hostname)
+    return hostname
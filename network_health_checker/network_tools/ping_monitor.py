@@ -10,15 +10,31 @@ Használat:
     >>> print(f"Status: {result.status}, Latency: {result.latency_ms}ms")
 """
 
+import asyncio
+import itertools
+import os
 import socket
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import struct
+import time
 from datetime import datetime
-from typing import List
+from statistics import fmean
+from typing import List, Optional, Tuple
 
 from ping3 import ping
 
 from ..config import get_settings
 from ..models import HostStatus, PingResult
+from .network_info import _resolve
+
+# ICMP üzenet típusok
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+
+# Echo request payload (a tartalma nem számít, csak azonosításra)
+_ICMP_PAYLOAD = b"network-health-checker"
+
+# Echo identifier-ek raw socket-ekhez (DGRAM socketnél a kernel felülírja)
+_icmp_ident = itertools.count(os.getpid() & 0xFFFF)
 
 
 def ping_host(
@@ -52,9 +68,9 @@ def ping_host(
     if timeout is None:
         timeout = settings.ping_timeout
 
-    # Hostname feloldása IP címre
+    # Hostname feloldása IP címre (cache-elve)
     try:
-        ip_address = socket.gethostbyname(host)
+        ip_address = _resolve(host)
     except socket.gaierror as e:
         return PingResult(
             host=host,
@@ -63,17 +79,13 @@ def ping_host(
             timestamp=datetime.now(),
         )
 
-    # Ping műveletek végrehajtása
-    latencies: List[float] = []
-    last_error: str | None = None
-
-    for _ in range(count):
+    # Ping műveletek: minden echo egyetlen ICMP socketen
+    try:
+        latencies, last_error = _ping_ip(ip_address, timeout, count, privileged)
+    except PermissionError:
+        # Nem nyitható ICMP socket: ping3 fallback
         try:
-            # FONTOS: ping3 None-t ad timeout esetén, False-t hiba esetén
-            result = ping(ip_address, timeout=timeout, unit="ms")
-
-            if result is not None and result is not False:
-                latencies.append(float(result))
+            latencies, last_error = _ping_ip_ping3(ip_address, timeout, count)
         except PermissionError:
             # Admin jog szükséges raw socket-hez
             return PingResult(
@@ -83,18 +95,151 @@ def ping_host(
                 error_message="Permission denied. Try running with admin privileges.",
                 timestamp=datetime.now(),
             )
+    except OSError as e:
+        # Socket nyitási hiba (nem jogosultság): hibás eredmény
+        return PingResult(
+            host=host,
+            ip_address=ip_address,
+            status=HostStatus.ERROR,
+            error_message=str(e),
+            timestamp=datetime.now(),
+        )
+
+    return _build_result(host, ip_address, latencies, last_error)
+
+
+def _ping_ip(
+    ip_address: str,
+    timeout: float,
+    count: int,
+    privileged: bool = False,
+) -> Tuple[List[float], Optional[str]]:
+    """
+    ICMP echo request-ek küldése egy IP címre, blokkoló módon.
+
+    Egyetlen socketet használ az összes (count) kéréshez, így nincs
+    kérésenkénti socket nyitás/zárás.
+
+    Args:
+        ip_address: Cél IPv4 cím
+        timeout: Válasz időtúllépés kérésenként
+        count: Küldendő echo request-ek száma
+        privileged: Raw socket használata datagram helyett
+
+    Returns:
+        (válaszidők ms-ban, utolsó hibaüzenet) tuple
+
+    Raises:
+        PermissionError: Ha nem nyitható ICMP socket
+    """
+    sock, raw = _open_icmp_socket(privileged)
+    ident = next(_icmp_ident) & 0xFFFF
+    latencies: List[float] = []
+    last_error: str | None = None
+
+    try:
+        # Connect: a kernel csak a cél címről érkező válaszokat adja ide
+        try:
+            sock.connect((ip_address, 0))
+        except OSError as e:
+            # Pl. ENETUNREACH: nincs útvonal, egyetlen echo sem küldhető
+            return latencies, str(e)
+
+        for seq in range(1, count + 1):
+            try:
+                start = time.perf_counter()
+                sock.settimeout(timeout)
+                sock.sendall(_build_echo_request(ident, seq))
+                deadline = start + timeout
+
+                while True:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    sock.settimeout(remaining)
+                    try:
+                        data = sock.recv(1024)
+                    except socket.timeout:
+                        break
+
+                    if _is_echo_reply(data, raw, ident, seq):
+                        latencies.append((time.perf_counter() - start) * 1000)
+                        break
+            except OSError as e:
+                last_error = str(e)
+    finally:
+        sock.close()
+
+    return latencies, last_error
+
+
+def _ping_ip_ping3(
+    ip_address: str,
+    timeout: float,
+    count: int,
+) -> Tuple[List[float], Optional[str]]:
+    """
+    Echo request-ek küldése ping3-mal (fallback, kérésenként új socket).
+
+    Args:
+        ip_address: Cél IPv4 cím
+        timeout: Válasz időtúllépés kérésenként
+        count: Küldendő echo request-ek száma
+
+    Returns:
+        (válaszidők ms-ban, utolsó hibaüzenet) tuple
+
+    Raises:
+        PermissionError: Ha a ping3 sem nyithat ICMP socketet
+    """
+    latencies: List[float] = []
+    last_error: str | None = None
+
+    for _ in range(count):
+        try:
+            # FONTOS: ping3 None-t ad timeout esetén, False-t hiba esetén
+            result = ping(ip_address, timeout=timeout, unit="ms")
+
+            if result is not None and result is not False:
+                # ping3 unit="ms" esetén már float-ot ad
+                latencies.append(result)
+        except PermissionError:
+            raise
         except Exception as e:
             last_error = str(e)
 
-    # Eredmény összeállítása
+    return latencies, last_error
+
+
+def _build_result(
+    host: str,
+    ip_address: str,
+    latencies: List[float],
+    last_error: str | None,
+) -> PingResult:
+    """
+    PingResult összeállítása a mért válaszidőkből.
+
+    Args:
+        host: Az eredeti host
+        ip_address: Feloldott IP cím
+        latencies: Sikeres válaszok ideje milliszekundumban
+        last_error: Utolsó hibaüzenet (ha volt)
+
+    Returns:
+        PingResult a megfelelő státusszal
+    """
+    # Egyetlen időbélyeg, bármelyik ágon is térünk vissza
+    timestamp = datetime.now()
+
     if latencies:
-        avg_latency = sum(latencies) / len(latencies)
+        avg_latency = fmean(latencies)
         return PingResult(
             host=host,
             ip_address=ip_address,
             status=HostStatus.UP,
             latency_ms=round(avg_latency, 2),
-            timestamp=datetime.now(),
+            timestamp=timestamp,
         )
     elif last_error:
         return PingResult(
@@ -102,16 +247,267 @@ def ping_host(
             ip_address=ip_address,
             status=HostStatus.ERROR,
             error_message=last_error,
-            timestamp=datetime.now(),
+            timestamp=timestamp,
         )
     else:
         return PingResult(
             host=host,
             ip_address=ip_address,
             status=HostStatus.TIMEOUT,
+            timestamp=timestamp,
+        )
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """
+    Internet checksum (RFC 1071) számítása.
+
+    Args:
+        data: Az ICMP üzenet bájtjai
+
+    Returns:
+        16 bites checksum
+    """
+    if len(data) % 2:
+        data += b"\x00"
+    total: int = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _build_echo_request(ident: int, seq: int) -> bytes:
+    """
+    ICMP echo request csomag összeállítása.
+
+    Args:
+        ident: Echo identifier
+        seq: Sorszám
+
+    Returns:
+        A küldendő ICMP csomag
+    """
+    header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = _icmp_checksum(header + _ICMP_PAYLOAD)
+    return struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + _ICMP_PAYLOAD
+
+
+def _open_icmp_socket(privileged: bool = False) -> Tuple[socket.socket, bool]:
+    """
+    Nem blokkoló ICMP socket nyitása.
+
+    Először jogosultság nélküli ICMP datagram socketet próbál (Linux,
+    net.ipv4.ping_group_range), ha az nem engedélyezett, raw socketet.
+
+    Args:
+        privileged: Rögtön raw socketet nyit (admin jog szükséges)
+
+    Returns:
+        (socket, raw) tuple, raw=True ha raw socket (IP fejléccel olvas)
+
+    Raises:
+        PermissionError: Ha egyik socket típus sem nyitható meg
+    """
+    if privileged:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+        raw = True
+    else:
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+            raw = False
+        except PermissionError:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+            raw = True
+    sock.setblocking(False)
+    return sock, raw
+
+
+def _is_echo_reply(data: bytes, raw: bool, ident: int, seq: int) -> bool:
+    """
+    Ellenőrzi, hogy a fogadott csomag a mi echo request-ünkre adott válasz-e.
+
+    Args:
+        data: Fogadott bájtok (raw socketnél IP fejléccel)
+        raw: Raw socketről érkezett-e
+        ident: Az elküldött echo identifier
+        seq: Az elküldött sorszám
+
+    Returns:
+        True ha a csomag a várt echo reply
+    """
+    # Raw socket esetén az IP fejlécet át kell ugrani
+    offset = (data[0] & 0x0F) * 4 if raw else 0
+    if len(data) < offset + 8:
+        return False
+    icmp_type, _, _, reply_ident, reply_seq = struct.unpack_from("!BBHHH", data, offset)
+    # DGRAM socketnél a kernel saját identifier-t használ
+    if icmp_type != _ICMP_ECHO_REPLY or reply_seq != seq:
+        return False
+    return not raw or reply_ident == ident
+
+
+async def _ping_ip_async(
+    ip_address: str,
+    timeout: float,
+    count: int,
+) -> Tuple[List[float], Optional[str]]:
+    """
+    ICMP echo request-ek küldése egy IP címre az event loop-on.
+
+    Egyetlen socketet használ az összes (count) kéréshez.
+
+    Args:
+        ip_address: Cél IPv4 cím
+        timeout: Válasz időtúllépés kérésenként
+        count: Küldendő echo request-ek száma
+
+    Returns:
+        (válaszidők ms-ban, utolsó hibaüzenet) tuple
+
+    Raises:
+        PermissionError: Ha nem nyitható ICMP socket
+    """
+    loop = asyncio.get_running_loop()
+    sock, raw = _open_icmp_socket()
+    ident = next(_icmp_ident) & 0xFFFF
+    latencies: List[float] = []
+    last_error: str | None = None
+
+    try:
+        # Connect: a kernel csak a cél címről érkező válaszokat adja ide
+        try:
+            sock.connect((ip_address, 0))
+        except OSError as e:
+            # Pl. ENETUNREACH: nincs útvonal, egyetlen echo sem küldhető
+            return latencies, str(e)
+
+        for seq in range(1, count + 1):
+            try:
+                start = time.perf_counter()
+                await loop.sock_sendall(sock, _build_echo_request(ident, seq))
+                deadline = start + timeout
+
+                while True:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    try:
+                        data = await asyncio.wait_for(loop.sock_recv(sock, 1024), remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+                    if _is_echo_reply(data, raw, ident, seq):
+                        latencies.append((time.perf_counter() - start) * 1000)
+                        break
+            except OSError as e:
+                last_error = str(e)
+    finally:
+        sock.close()
+
+    return latencies, last_error
+
+
+async def _ping_host_async(
+    host: str,
+    timeout: float,
+    count: int,
+) -> PingResult:
+    """
+    Egyetlen host pingelése az event loop-on.
+
+    Args:
+        host: Cél hostname vagy IP cím
+        timeout: Időtúllépés kérésenként
+        count: Ping-ek száma
+
+    Returns:
+        PingResult a ping_host()-tal azonos formában
+    """
+    loop = asyncio.get_running_loop()
+
+    # Hostname feloldása IP címre a közös cache-en át, executor-ban
+    # (nem blokkolja az event loop-ot)
+    try:
+        ip_address = await loop.run_in_executor(None, _resolve, host)
+    except socket.gaierror as e:
+        return PingResult(
+            host=host,
+            status=HostStatus.ERROR,
+            error_message=f"Could not resolve hostname: {host} - {e}",
             timestamp=datetime.now(),
         )
 
+    try:
+        latencies, last_error = await _ping_ip_async(ip_address, timeout, count)
+    except PermissionError:
+        return PingResult(
+            host=host,
+            ip_address=ip_address,
+            status=HostStatus.ERROR,
+            error_message="Permission denied. Try running with admin privileges.",
+            timestamp=datetime.now(),
+        )
+    except OSError as e:
+        # Socket nyitási hiba (nem jogosultság): mint a ping_host()-ban
+        return PingResult(
+            host=host,
+            ip_address=ip_address,
+            status=HostStatus.ERROR,
+            error_message=str(e),
+            timestamp=datetime.now(),
+        )
+    except Exception as e:
+        # Ha valami nagyon elromlik, hibás eredményt adunk vissza
+        return PingResult(
+            host=host,
+            ip_address=ip_address,
+            status=HostStatus.ERROR,
+            error_message=f"Unexpected error: {e}",
+            timestamp=datetime.now(),
+        )
+
+    return _build_result(host, ip_address, latencies, last_error)
+
+
+async def ping_hosts_async(
+    hosts: List[str],
+    timeout: float | None = None,
+    count: int = 1,
+    max_workers: int = 10,
+) -> List[PingResult]:
+    """
+    Több host párhuzamos pingelése asyncio-val.
+
+    Egyetlen event loop-on küldi ki az összes ICMP kérést, így nincs
+    szükség worker folyamatokra vagy szálakra.
+
+    Args:
+        hosts: Pingelendő hostok listája
+        timeout: Időtúllépés host-onként
+        count: Ping-ek száma host-onként
+        max_workers: Egyszerre pingelt hostok maximális száma
+
+    Returns:
+        PingResult lista a hosts sorrendjében
+
+    Example:
+        >>> results = await ping_hosts_async(["8.8.8.8", "1.1.1.1"])
+    """
+    if timeout is None:
+        timeout = get_settings().ping_timeout
+
+    results: List[Optional[PingResult]] = [None] * len(hosts)
+    # Közös iterátor: max_workers worker veszi sorra a hostokat, így nincs
+    # hostonkénti task és szemafor várakozás
+    pending = iter(enumerate(hosts))
+
+    async def worker() -> None:
+        for index, host in pending:
+            results[index] = await _ping_host_async(host, timeout, count)
+
+    await asyncio.gather(*(worker() for _ in range(min(max(1, max_workers), len(hosts)))))
+    return [result for result in results if result is not None]
+
 
 def ping_hosts(
     hosts: List[str],
@@ -122,56 +518,28 @@ def ping_hosts(
     """
     Több host párhuzamos pingelése.
 
-    ProcessPoolExecutor-t használ a párhuzamos végrehajtáshoz,
-    mivel a ping3 library nem thread-safe.
+    Szinkron wrapper a ping_hosts_async() körül: egyetlen asyncio event
+    loop küldi ki az összes ICMP kérést (jogosultság nélküli ICMP
+    datagram socketen, vagy raw socketen ha az nem engedélyezett).
 
     Args:
         hosts: Pingelendő hostok listája
         timeout: Időtúllépés host-onként
         count: Ping-ek száma host-onként
-        max_workers: Párhuzamos worker folyamatok száma
+        max_workers: Egyszerre pingelt hostok maximális száma
 
     Returns:
-        PingResult lista minden host-hoz
+        PingResult lista a hosts sorrendjében
 
     Example:
         >>> hosts = ["8.8.8.8", "1.1.1.1", "google.com"]
         >>> results = ping_hosts(hosts, timeout=2.0)
         >>> for r in results:
         ...     print(f"{r.host}: {r.status}")
-
-    Note:
-        KRITIKUS: A ping3 NEM thread-safe, ezért ProcessPoolExecutor-t
-        használunk ThreadPoolExecutor helyett!
     """
-    results: List[PingResult] = []
-
-    # ProcessPoolExecutor használata threading helyett
-    # Reason: A ping3 library belső állapota nem thread-safe
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Feladatok indítása
-        future_to_host = {
-            executor.submit(ping_host, host, timeout, count): host for host in hosts
-        }
-
-        # Eredmények gyűjtése ahogy elkészülnek
-        for future in as_completed(future_to_host):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                # Ha valami nagyon elromlik, hibás eredményt adunk vissza
-                host = future_to_host[future]
-                results.append(
-                    PingResult(
-                        host=host,
-                        status=HostStatus.ERROR,
-                        error_message=f"Unexpected error: {e}",
-                        timestamp=datetime.now(),
-                    )
-                )
-
-    return results
+    if not hosts:
+        return []
+    return asyncio.run(ping_hosts_async(hosts, timeout, count, max_workers))
 
 
 def is_host_reachable(host: str, timeout: float = 2.0) -> bool:
@@ -10,13 +10,66 @@ Használat:
     >>> print(f"Port 80 is {'open' if result.is_open else 'closed'}")
 """
 
+import asyncio
+import contextlib
+import errno
+import selectors
 import socket
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List
-
-from ..config import get_service_name, get_settings
-from ..models import PortScanResult
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from ..config import COMMON_PORTS, get_settings
+from ..models import HostStatus, PortScanResult
+from .network_info import _resolve
+from .ping_monitor import ping_host
+
+# Port -> szolgáltatásnév: a statikus táblát közvetlenül olvassuk, így a
+# forró ágon portonként egy dict lookup marad (nincs extra függvényhívás)
+_service_name = COMMON_PORTS.get
+
+# Ennél több port (banner nélkül) esetén a scan_ports a selector alapú utat használja
+_SELECTOR_THRESHOLD = 1024
+
+# Ennyi port felett a scan_ports előbb ellenőrzi, hogy a host válaszol-e
+_PREFLIGHT_MIN_PORTS = 100
+
+# Az elérhetőségi próbához használt portok (RST vagy SYN-ACK is elég)
+_PREFLIGHT_PORTS = (80, 443, 22)
+
+# A scan_common_ports által ellenőrzött portok (rendezve)
+_COMMON_SCAN_PORTS = (
+    21,  # FTP
+    22,  # SSH
+    23,  # Telnet
+    25,  # SMTP
+    53,  # DNS
+    80,  # HTTP
+    110,  # POP3
+    143,  # IMAP
+    443,  # HTTPS
+    445,  # SMB
+    993,  # IMAPS
+    995,  # POP3S
+    1433,  # MSSQL
+    3306,  # MySQL
+    3389,  # RDP
+    5432,  # PostgreSQL
+    8080,  # HTTP Proxy
+)
+
+# Banner olvasás felső korlátja bájtban
+_BANNER_MAX_BYTES = 4096
+
+# Egyszerre folyamatban lévő kapcsolódások maximális száma (fájlleíró korlát miatt)
+_SELECTOR_MAX_IN_FLIGHT = 512
+
+# Linuxon a socket már nem-blokkolóként jön létre (nincs külön fcntl hívás)
+_SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0)
+
+# Banner olvasáshoz használt socket pufferméretek bájtban
+_BANNER_RCVBUF = 131072
+_BANNER_SNDBUF = 65536
 
 
 def scan_port(
@@ -24,6 +77,7 @@ def scan_port(
     port: int,
     timeout: float | None = None,
     grab_banner: bool = False,
+    _resolved_ip: str | None = None,
 ) -> PortScanResult:
     """
     Egyetlen TCP port szkennelése.
@@ -36,6 +90,8 @@ def scan_port(
         port: Szkennelendő port száma
         timeout: Kapcsolódási időtúllépés másodpercben
         grab_banner: Ha True, megpróbálja lekérni a banner-t
+        _resolved_ip: Előre feloldott IP cím (scan_ports adja át, így a
+            worker-ek nem oldják fel újra a hostot)
 
     Returns:
         PortScanResult az eredményekkel
@@ -51,12 +107,16 @@ def scan_port(
         timeout = settings.port_scan_timeout
 
     # Szolgáltatás neve a porthoz
-    service_name = get_service_name(port)
+    service_name = _service_name(port)
 
     # Socket létrehozása és időtúllépés beállítása
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.settimeout(timeout)
 
+    if grab_banner:
+        # A puffereket a connect előtt kell beállítani (ablakméret egyeztetés)
+        _tune_banner_socket(sock)
+
     banner: str | None = None
     latency_ms: float | None = None
 
@@ -64,8 +124,9 @@ def scan_port(
         # Kapcsolódási idő mérése
         start_time = time.perf_counter()
 
-        # Kapcsolódás a porthoz
-        result = sock.connect_ex((host, port))
+        # Kapcsolódás a porthoz IP literállal (nincs getaddrinfo a connect-ben)
+        target_ip = _resolved_ip if _resolved_ip is not None else _resolve(host)
+        result = sock.connect_ex((target_ip, port))
         end_time = time.perf_counter()
 
         latency_ms = round((end_time - start_time) * 1000, 2)
@@ -123,13 +184,37 @@ def scan_port(
         sock.close()
 
 
+def _tune_banner_socket(sock: socket.socket) -> None:
+    """
+    Socket beállítása banner olvasáshoz.
+
+    TCP_NODELAY-t kapcsol (a "\\r\\n" próba ne várjon a Nagle algoritmusra),
+    és megnöveli a küldő/fogadó puffereket. Ahol a platform nem engedi,
+    a hibát csendben figyelmen kívül hagyja.
+
+    Args:
+        sock: Még nem csatlakozott TCP socket
+    """
+    options = (
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, _BANNER_RCVBUF),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, _BANNER_SNDBUF),
+    )
+    for level, option, value in options:
+        with contextlib.suppress(OSError):
+            sock.setsockopt(level, option, value)
+
+
 def _grab_banner(sock: socket.socket, timeout: float) -> str | None:
     """
     Banner információ lekérése nyitott portról.
 
+    Több szegmensre tördelt banner esetén sorvégéig (vagy a határidőig)
+    olvas; a darabokat listában gyűjti és egyszer fűzi össze.
+
     Args:
         sock: Nyitott socket kapcsolat
-        timeout: Olvasási időtúllépés
+        timeout: Teljes olvasási időtúllépés
 
     Returns:
         Banner szöveg vagy None
@@ -138,30 +223,229 @@ def _grab_banner(sock: socket.socket, timeout: float) -> str | None:
         sock.settimeout(timeout)
         # Néhány szolgáltatásnak küldeni kell valamit
         sock.send(b"\r\n")
-        banner = sock.recv(1024)
-        return banner.decode("utf-8", errors="ignore").strip()
+
+        chunks: List[bytes] = []
+        received = 0
+        deadline = time.monotonic() + timeout
+
+        while received < _BANNER_MAX_BYTES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+            try:
+                chunk = sock.recv(_BANNER_MAX_BYTES - received)
+            except socket.timeout:
+                break
+            if not chunk:
+                # A távoli fél lezárta a kapcsolatot
+                break
+            chunks.append(chunk)
+            received += len(chunk)
+            if b"\n" in chunk:
+                break
+
+        banner = b"".join(chunks).decode("utf-8", errors="ignore").strip()
+        return banner or None
+    except Exception:
+        return None
+
+
+async def _scan_port_async(
+    host: str,
+    ip_address: str,
+    port: int,
+    timeout: float,
+    grab_banner: bool,
+) -> PortScanResult:
+    """
+    Egyetlen TCP port szkennelése az event loop-on.
+
+    Args:
+        host: Az eredeti host (az eredményben ez szerepel)
+        ip_address: Feloldott IP cím, erre kapcsolódunk
+        port: Szkennelendő port száma
+        timeout: Kapcsolódási (és banner olvasási) időtúllépés
+        grab_banner: Banner lekérés megkísérlése
+
+    Returns:
+        PortScanResult a scan_port()-tal azonos formában
+    """
+    service_name = _service_name(port)
+
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip_address, port), timeout
+        )
+    except (asyncio.TimeoutError, OSError):
+        # Időtúllépés, elutasított kapcsolat vagy elérhetetlen host
+        return PortScanResult(
+            host=host,
+            port=port,
+            is_open=False,
+            service_name=service_name,
+        )
+
+    latency_ms = round((loop.time() - start_time) * 1000, 2)
+    banner: str | None = None
+
+    try:
+        if grab_banner:
+            banner = await _grab_banner_async(reader, writer, timeout)
+    finally:
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+    return PortScanResult(
+        host=host,
+        port=port,
+        is_open=True,
+        service_name=service_name,
+        banner=banner,
+        latency_ms=latency_ms,
+    )
+
+
+async def _grab_banner_async(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    timeout: float,
+) -> str | None:
+    """
+    Banner információ lekérése nyitott kapcsolatról (async változat).
+
+    Args:
+        reader: A kapcsolat olvasó stream-je
+        writer: A kapcsolat író stream-je
+        timeout: Teljes olvasási időtúllépés
+
+    Returns:
+        Banner szöveg vagy None
+    """
+    try:
+        # Néhány szolgáltatásnak küldeni kell valamit
+        writer.write(b"\r\n")
+        await writer.drain()
+
+        loop = asyncio.get_running_loop()
+        chunks: List[bytes] = []
+        received = 0
+        deadline = loop.time() + timeout
+
+        while received < _BANNER_MAX_BYTES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(
+                    reader.read(_BANNER_MAX_BYTES - received), remaining
+                )
+            except asyncio.TimeoutError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+            received += len(chunk)
+            if b"\n" in chunk:
+                break
+
+        banner = b"".join(chunks).decode("utf-8", errors="ignore").strip()
+        return banner or None
     except Exception:
         return None
 
 
+async def scan_ports_async(
+    host: str,
+    ports: List[int] | str,
+    timeout: float | None = None,
+    max_workers: int = 50,
+    grab_banner: bool = False,
+) -> List[PortScanResult]:
+    """
+    Több port párhuzamos szkennelése egyetlen event loop-on.
+
+    Minden port egy asyncio.open_connection() kísérlet; az egyidejű
+    kapcsolódások számát a max_workers korlátozza.
+
+    Args:
+        host: Cél hostname vagy IP cím
+        ports: Port lista vagy port range string (pl. "20-25,80,443")
+        timeout: Időtúllépés portonként
+        max_workers: Egyidejű kapcsolódások maximális száma
+        grab_banner: Banner lekérés megkísérlése
+
+    Returns:
+        PortScanResult lista minden porthoz, port szám szerint rendezve
+
+    Example:
+        >>> results = await scan_ports_async("example.com", "1-1024")
+        >>> open_ports = [r.port for r in results if r.is_open]
+    """
+    settings = get_settings()
+    if timeout is None:
+        timeout = settings.port_scan_timeout
+
+    # Port lista feldolgozása
+    port_list = _parse_ports(ports) if isinstance(ports, str) else sorted(ports)
+
+    # Hostname feloldása egyszer, executor-ban (ne blokkolja az event loop-ot)
+    loop = asyncio.get_running_loop()
+    try:
+        ip_address = await loop.run_in_executor(None, _resolve, host)
+    except socket.gaierror:
+        return [
+            PortScanResult(host=host, port=port, is_open=False, service_name=_service_name(port))
+            for port in port_list
+        ]
+
+    results: List[Optional[PortScanResult]] = [None] * len(port_list)
+    # Közös iterátor: max_workers worker veszi sorra a portokat, így nincs
+    # portonkénti task és szemafor várakozás
+    pending = iter(enumerate(port_list))
+
+    async def worker() -> None:
+        for index, port in pending:
+            results[index] = await _scan_port_async(
+                host, ip_address, port, timeout, grab_banner
+            )
+
+    await asyncio.gather(*(worker() for _ in range(min(max(1, max_workers), len(port_list)))))
+    return [result for result in results if result is not None]
+
+
 def scan_ports(
     host: str,
     ports: List[int] | str,
     timeout: float | None = None,
     max_workers: int = 50,
     grab_banner: bool = False,
+    preflight: bool = False,
 ) -> List[PortScanResult]:
     """
     Több port párhuzamos szkennelése.
 
-    ThreadPoolExecutor-t használ a gyors párhuzamos végrehajtáshoz.
+    Szinkron wrapper a scan_ports_async() körül; nagy, banner nélküli
+    port listáknál a scan_ports_selector()-t használja.
+
+    preflight=True esetén sok port előtt egy elérhetőségi próba fut
+    (_host_responds()); ha a host erre nem válaszol, minden port próba
+    nélkül zártként jön vissza. Egy a próba portokat és az ICMP-t is
+    eldobó (tűzfalazott) host így tévesen kimaradhat, ezért alapból ki van
+    kapcsolva.
 
     Args:
         host: Cél hostname vagy IP cím
         ports: Port lista vagy port range string (pl. "20-25,80,443")
         timeout: Időtúllépés portonként
-        max_workers: Párhuzamos szálak száma
+        max_workers: Egyidejű kapcsolódások maximális száma
+            (a selector alapú út saját korlátot használ)
         grab_banner: Banner lekérés megkísérlése
+        preflight: Előzetes elérhetőségi próba sok port esetén (opt-in)
 
     Returns:
         PortScanResult lista minden porthoz
@@ -174,34 +458,208 @@ def scan_ports(
     # Port lista feldolgozása
     port_list = _parse_ports(ports) if isinstance(ports, str) else ports
 
-    results: List[PortScanResult] = []
+    # Sok port esetén előbb egyetlen gyors próbával ellenőrizzük, hogy a
+    # host egyáltalán válaszol-e; halott hostra N × timeout helyett 1 × timeout
+    if preflight and len(port_list) >= _PREFLIGHT_MIN_PORTS:
+        if timeout is None:
+            timeout = get_settings().port_scan_timeout
+        try:
+            ip_address = _resolve(host)
+        except socket.gaierror:
+            ip_address = None
+        if ip_address is None or not _host_responds(ip_address, min(timeout, 1.0)):
+            return [
+                PortScanResult(
+                    host=host, port=port, is_open=False, service_name=_service_name(port)
+                )
+                for port in sorted(port_list)
+            ]
+
+    # Nagy, banner nélküli szkennelésnél egyetlen szál és selector
+    # olcsóbb, mint portonként egy coroutine és stream pár
+    if not grab_banner and len(port_list) > _SELECTOR_THRESHOLD:
+        return scan_ports_selector(host, port_list, timeout)
+
+    return asyncio.run(scan_ports_async(host, port_list, timeout, max_workers, grab_banner))
+
+
+def _host_responds(ip_address: str, timeout: float) -> bool:
+    """
+    Gyors elérhetőségi próba a szkennelés előtt.
+
+    Néhány gyakori portra párhuzamos nem-blokkoló connect-et indít:
+    SYN-ACK (nyitott) vagy RST (elutasított) egyaránt élő hostot jelez.
+    Ha egyik sem érkezik, egy ICMP ping dönt; ha az nem futtatható
+    (jogosultság), a hostot elérhetőnek tekintjük. Ha a host a próba
+    portokat és az ICMP-t is eldobja, tévesen nem elérhetőnek látszik.
+
+    Args:
+        ip_address: Cél IP cím
+        timeout: A próba időtúllépése
+
+    Returns:
+        False csak akkor, ha a host biztosan nem válaszolt
+    """
+    sockets: List[socket.socket] = []
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            for port in _PREFLIGHT_PORTS:
+                sock = _nonblocking_socket()
+                sockets.append(sock)
+                result = sock.connect_ex((ip_address, port))
+                if result in (0, errno.ECONNREFUSED):
+                    return True
+                if result == errno.EINPROGRESS:
+                    selector.register(sock, selectors.EVENT_WRITE)
+
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj  # type: ignore[assignment]
+                    error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if error in (0, errno.ECONNREFUSED):
+                        return True
+                    selector.unregister(sock)
+    finally:
+        for sock in sockets:
+            sock.close()
+
+    # Nincs TCP válasz (pl. minden port szűrt): ICMP dönt
+    return ping_host(ip_address, timeout=timeout).status != HostStatus.TIMEOUT
+
+
+def scan_ports_selector(
+    host: str,
+    ports: List[int] | str,
+    timeout: float | None = None,
+    max_in_flight: int = _SELECTOR_MAX_IN_FLIGHT,
+) -> List[PortScanResult]:
+    """
+    Több port szkennelése nem-blokkoló connect-tel, egyetlen szálon.
+
+    Minden port egy nem-blokkoló socket, a kapcsolódások befejeződését
+    egy közös selector jelzi (EVENT_WRITE), az eredményt az SO_ERROR adja.
+    Linuxon a DefaultSelector epoll, így egy select() hívás a teljes
+    folyamatban lévő köteg (max_in_flight) eseményeit visszaadja.
+    Banner lekérést nem támogat.
+
+    Args:
+        host: Cél hostname vagy IP cím
+        ports: Port lista vagy port range string (pl. "1-65535")
+        timeout: Időtúllépés portonként
+        max_in_flight: Egyszerre nyitott kapcsolódások maximális száma
+
+    Returns:
+        PortScanResult lista minden porthoz, port szám szerint rendezve
+
+    Example:
+        >>> results = scan_ports_selector("192.168.1.1", "1-65535", timeout=0.5)
+        >>> print([r.port for r in results if r.is_open])
+    """
+    settings = get_settings()
+    if timeout is None:
+        timeout = settings.port_scan_timeout
+
+    port_list = _parse_ports(ports) if isinstance(ports, str) else sorted(ports)
 
-    # ThreadPoolExecutor használata (socket műveletek thread-safe-ek)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Feladatok indítása
-        future_to_port = {
-            executor.submit(scan_port, host, port, timeout, grab_banner): port
+    try:
+        ip_address = _resolve(host)
+    except socket.gaierror:
+        return [
+            PortScanResult(host=host, port=port, is_open=False, service_name=_service_name(port))
             for port in port_list
-        }
+        ]
+
+    # port -> (nyitva?, latency_ms)
+    outcomes: Dict[int, Tuple[bool, float | None]] = {}
+    # Folyamatban lévő kapcsolódások indítási sorrendben (a dict megőrzi);
+    # mivel a timeout azonos, a legelső jár le legkorábban
+    pending: Dict[socket.socket, Tuple[int, float]] = {}
+    remaining_ports = iter(port_list)
+    exhausted = False
+
+    with selectors.DefaultSelector() as selector:
+        while True:
+            # Új kapcsolódások indítása a korlátig
+            while not exhausted and len(pending) < max(1, max_in_flight):
+                port = next(remaining_ports, None)
+                if port is None:
+                    exhausted = True
+                    break
+
+                sock = _nonblocking_socket()
+                start_time = time.perf_counter()
+                result = sock.connect_ex((ip_address, port))
+
+                if result == errno.EINPROGRESS:
+                    selector.register(sock, selectors.EVENT_WRITE)
+                    pending[sock] = (port, start_time)
+                else:
+                    # Azonnali eredmény (pl. loopback)
+                    latency_ms = round((time.perf_counter() - start_time) * 1000, 2)
+                    outcomes[port] = (result == 0, latency_ms if result == 0 else None)
+                    sock.close()
+
+            if not pending:
+                break
+
+            # Várakozás a legkorábbi lejáratig
+            _, (_, first_start) = next(iter(pending.items()))
+            wait = max(0.0, first_start + timeout - time.perf_counter())
+
+            for key, _ in selector.select(wait):
+                sock = key.fileobj  # type: ignore[assignment]
+                port, start_time = pending.pop(sock)
+                selector.unregister(sock)
+                error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if error == 0:
+                    latency_ms = round((time.perf_counter() - start_time) * 1000, 2)
+                    outcomes[port] = (True, latency_ms)
+                else:
+                    outcomes[port] = (False, None)
+                sock.close()
+
+            # Lejárt kapcsolódások: szűrt port vagy elérhetetlen host
+            now = time.perf_counter()
+            while pending:
+                sock, (port, start_time) = next(iter(pending.items()))
+                if start_time + timeout > now:
+                    break
+                del pending[sock]
+                selector.unregister(sock)
+                sock.close()
+                outcomes[port] = (False, None)
+
+    return [
+        PortScanResult(
+            host=host,
+            port=port,
+            is_open=outcomes[port][0],
+            service_name=_service_name(port),
+            latency_ms=outcomes[port][1],
+        )
+        for port in port_list
+    ]
 
-        # Eredmények gyűjtése
-        for future in as_completed(future_to_port):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception:
-                port = future_to_port[future]
-                results.append(
-                    PortScanResult(
-                        host=host,
-                        port=port,
-                        is_open=False,
-                    )
-                )
 
-    # Rendezés port szám szerint
-    results.sort(key=lambda x: x.port)
-    return results
+def _nonblocking_socket() -> socket.socket:
+    """
+    Nem-blokkoló TCP socket létrehozása.
+
+    Ahol elérhető, a SOCK_NONBLOCK flaggel egyetlen rendszerhívás;
+    máshol a setblocking(False) állítja be.
+
+    Returns:
+        Nem-blokkoló AF_INET/SOCK_STREAM socket
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM | _SOCK_NONBLOCK)
+    if not _SOCK_NONBLOCK:
+        sock.setblocking(False)
+    return sock
 
 
 def _parse_ports(ports_str: str) -> List[int]:
@@ -213,25 +671,62 @@ def _parse_ports(ports_str: str) -> List[int]:
     - Tartományok: "20-25"
     - Vegyes: "22,80-90,443"
 
+    Ugyanarra a specifikációra ismételt hívásnál (pl. ismétlődő szkennelés)
+    a feldolgozott eredmény a cache-ből jön; a hívó saját listát kap.
+
     Args:
         ports_str: Port definíció string
 
     Returns:
-        Port számok listája
+        Port számok rendezett, duplikátummentes listája
+
+    Raises:
+        ValueError: Ha a string nem értelmezhető port specifikáció
     """
-    port_list: List[int] = []
+    return list(_parse_port_spec(ports_str))
+
+
+@lru_cache(maxsize=128)
+def _parse_port_spec(ports_str: str) -> Tuple[int, ...]:
+    """
+    Port string feldolgozása, cache-elve (lásd _parse_ports).
+
+    A részeket (start, end) intervallumként rendezi, az átfedőket
+    összevonja, és a kimenetet tartományonként egy extend()-del állítja
+    elő; nincs köztes set és nincs portonkénti rendezés. Az eredmény
+    tuple, így a cache-elt érték nem módosítható.
+
+    Args:
+        ports_str: Port definíció string
+
+    Returns:
+        Port számok rendezett tuple-je
+    """
+    ranges: List[Tuple[int, int]] = []
 
     for part in ports_str.split(","):
         part = part.strip()
         if "-" in part:
             # Port tartomány
-            start, end = part.split("-", 1)
-            port_list.extend(range(int(start), int(end) + 1))
+            low, high = part.split("-", 1)
+            ranges.append((int(low), int(high)))
         else:
             # Egyedi port
-            port_list.append(int(part))
+            port = int(part)
+            ranges.append((port, port))
 
-    return sorted(set(port_list))
+    port_list: List[int] = []
+    last = -1
+
+    for lo, hi in sorted(ranges):
+        # Az előző tartománnyal átfedő rész kihagyása (deduplikálás)
+        if lo <= last:
+            lo = last + 1
+        if hi >= lo:
+            port_list.extend(range(lo, hi + 1))
+            last = hi
+
+    return tuple(port_list)
 
 
 def scan_common_ports(host: str, timeout: float | None = None) -> List[PortScanResult]:
@@ -247,23 +742,4 @@ def scan_common_ports(host: str, timeout: float | None = None) -> List[PortScanR
     Returns:
         PortScanResult lista a gyakori portokhoz
     """
-    common_ports = [
-        21,  # FTP
-        22,  # SSH
-        23,  # Telnet
-        25,  # SMTP
-        53,  # DNS
-        80,  # HTTP
-        110,  # POP3
-        143,  # IMAP
-        443,  # HTTPS
-        445,  # SMB
-        993,  # IMAPS
-        995,  # POP3S
-        1433,  # MSSQL
-        3306,  # MySQL
-        3389,  # RDP
-        5432,  # PostgreSQL
-        8080,  # HTTP Proxy
-    ]
-    return scan_ports(host, common_ports, timeout)
+    return scan_ports(host, list(_COMMON_SCAN_PORTS), timeout)
@@ -10,8 +10,11 @@ Használat:
     >>> print(f"Device: {info.sys_name}")
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import contextlib
+from typing import Any, Dict, List, Optional, Tuple
 
+from pyasn1.type import univ
 from pysnmp.hlapi.v3arch.asyncio import (
     CommunityData,
     ContextData,
@@ -19,13 +22,130 @@ from pysnmp.hlapi.v3arch.asyncio import (
     ObjectType,
     SnmpEngine,
     UdpTransportTarget,
-    bulk_cmd,
+    bulk_walk_cmd,
     get_cmd,
 )
 
 from ..config import SNMP_OIDS, get_settings
 from ..models import NetworkDevice, SNMPInterface
 
+# IF-MIB ifTable oszlopok, amelyeket a get_interfaces() lekérdez
+_IF_COLUMNS = (
+    "ifDescr",
+    "ifType",
+    "ifMtu",
+    "ifSpeed",
+    "ifPhysAddress",
+    "ifOperStatus",
+    "ifInOctets",
+    "ifOutOctets",
+)
+
+# Szöveges ifTable oszlopok; a többi egész típusú, ezeket natívan olvassuk
+_IF_TEXT_COLUMNS = frozenset({"ifDescr"})
+
+# Nyers OctetString-ként olvasott oszlopok (saját formázással)
+_IF_RAW_COLUMNS = frozenset({"ifPhysAddress"})
+
+# Egyszerre futó oszlop walk-ok száma (ne terheljük túl az ügynököt)
+_MAX_CONCURRENT_WALKS = 4
+
+# ifOperStatus értékek
+# 1=up, 2=down, 3=testing, 4=unknown, 5=dormant, 6=notPresent, 7=lowerLayerDown
+_OPER_STATUS_MAP = {
+    "1": "up",
+    "2": "down",
+    "3": "testing",
+    "4": "unknown",
+    "5": "dormant",
+    "6": "notPresent",
+    "7": "lowerLayerDown",
+}
+
+
+# Minden lekérdezés lookupMib=False-szal fut: a válaszokat nem oldjuk fel
+# MIB modulokon keresztül (nincs MIB betöltés/keresés). Emiatt a
+# textual convention-ök display hint-jei (pl. PhysAddress "1x:") sem
+# érvényesülnek, az ilyen értékeket (ifPhysAddress) magunk formázzuk.
+#
+# Megosztott SNMP engine és transport cache. Az engine transport
+# dispatcher-e az event loop-hoz kötődik, ezért loop váltáskor
+# (pl. új asyncio.run()) újra létrehozzuk.
+_engine: Optional[SnmpEngine] = None
+_engine_loop: Optional[asyncio.AbstractEventLoop] = None
+_transports: Dict[Tuple[str, int, float], UdpTransportTarget] = {}
+_transport_lock: Optional[asyncio.Lock] = None
+
+
+def _get_engine() -> SnmpEngine:
+    """
+    Az aktuális event loop-hoz tartozó megosztott SnmpEngine visszaadása.
+
+    Returns:
+        SnmpEngine példány (szükség esetén újonnan létrehozva)
+    """
+    global _engine, _engine_loop
+
+    loop = asyncio.get_running_loop()
+    if _engine is None or _engine_loop is not loop:
+        close_snmp()
+        _engine = SnmpEngine()
+        _engine_loop = loop
+    return _engine
+
+
+async def _get_transport(host: str, port: int, timeout: float) -> UdpTransportTarget:
+    """
+    Cache-elt UDP transport target lekérése (host, port, timeout) szerint.
+
+    Args:
+        host: Cél eszköz IP címe vagy hostname
+        port: SNMP port
+        timeout: Lekérdezési időtúllépés
+
+    Returns:
+        UdpTransportTarget példány
+    """
+    global _transport_lock
+
+    _get_engine()
+    key = (host, port, timeout)
+
+    transport = _transports.get(key)
+    if transport is None:
+        if _transport_lock is None:
+            _transport_lock = asyncio.Lock()
+        async with _transport_lock:
+            # Újraellenőrzés: közben egy másik task létrehozhatta
+            transport = _transports.get(key)
+            if transport is None:
+                transport = await UdpTransportTarget.create((host, port), timeout=timeout)
+                _transports[key] = transport
+    return transport
+
+
+def close_snmp() -> None:
+    """
+    A megosztott SNMP engine és a cache-elt transport-ok lezárása.
+
+    Alkalmazás leállításakor (vagy tesztekben) érdemes meghívni.
+
+    Example:
+        >>> info = asyncio.run(get_system_info("192.168.1.1"))
+        >>> close_snmp()
+    """
+    global _engine, _engine_loop, _transport_lock
+
+    if _engine is not None:
+        # A loop már lezárulhatott, az erőforrások ekkor már felszabadultak
+        with contextlib.suppress(Exception):
+            _engine.close_dispatcher()
+
+    _engine = None
+    _engine_loop = None
+    _transport_lock = None
+    _transports.clear()
+
 
 async def snmp_get(
     host: str,
@@ -33,6 +153,7 @@ async def snmp_get(
     community: str | None = None,
     port: int | None = None,
     timeout: float | None = None,
+    as_str: bool = True,
 ) -> Optional[Any]:
     """
     Egyetlen SNMP OID lekérdezése.
@@ -43,6 +164,8 @@ async def snmp_get(
         community: SNMP community string (None = config default)
         port: SNMP port (None = config default)
         timeout: Lekérdezési időtúllépés
+        as_str: True esetén prettyPrint() szöveg; False esetén az egész
+            típusú értékek (Integer32, Counter, Gauge, TimeTicks) int-ként
 
     Returns:
         Az OID értéke vagy None hiba esetén
@@ -63,11 +186,12 @@ async def snmp_get(
     try:
         # SNMP GET végrehajtása
         iterator = get_cmd(
-            SnmpEngine(),
+            _get_engine(),
             CommunityData(community),
-            await UdpTransportTarget.create((host, port), timeout=timeout),
+            await _get_transport(host, port, timeout),
             ContextData(),
             ObjectType(ObjectIdentity(oid)),
+            lookupMib=False,
         )
 
         error_indication, error_status, error_index, var_binds = await iterator
@@ -82,12 +206,82 @@ async def snmp_get(
 
         # Érték kinyerése
         for name, value in var_binds:
-            return value.prettyPrint()
+            return _convert(value, as_str)
 
     except Exception:
         return None
 
 
+async def snmp_get_many(
+    host: str,
+    oids: List[str],
+    community: str | None = None,
+    port: int | None = None,
+    timeout: float | None = None,
+    as_str: bool = True,
+) -> List[Optional[Any]]:
+    """
+    Több SNMP OID lekérdezése egyetlen GET kéréssel.
+
+    Egy GetRequest PDU több VarBind-ot is hordozhat, így N OID
+    lekérdezése egy hálózati körbefordulás N helyett.
+
+    Args:
+        host: Cél eszköz IP címe vagy hostname
+        oids: Lekérdezendő OID-ok listája
+        community: SNMP community string (None = config default)
+        port: SNMP port (None = config default)
+        timeout: Lekérdezési időtúllépés
+        as_str: False esetén az egész típusú értékek int-ként (lásd snmp_get)
+
+    Returns:
+        Az értékek az oids sorrendjében (hiba esetén mind None)
+
+    Example:
+        >>> descr, name = await snmp_get_many(
+        ...     "192.168.1.1", ["1.3.6.1.2.1.1.1.0", "1.3.6.1.2.1.1.5.0"]
+        ... )
+    """
+    # Konfiguráció betöltése
+    settings = get_settings()
+    if community is None:
+        community = settings.snmp_community
+    if port is None:
+        port = settings.snmp_port
+    if timeout is None:
+        timeout = settings.default_timeout
+
+    values: List[Optional[Any]] = [None] * len(oids)
+    if not oids:
+        return values
+
+    try:
+        # SNMP GET végrehajtása az összes OID-re egyszerre
+        iterator = get_cmd(
+            _get_engine(),
+            CommunityData(community),
+            await _get_transport(host, port, timeout),
+            ContextData(),
+            *[ObjectType(ObjectIdentity(oid)) for oid in oids],
+            lookupMib=False,
+        )
+
+        error_indication, error_status, error_index, var_binds = await iterator
+
+        if error_indication or error_status:
+            # Hálózati, protokoll vagy SNMP hiba
+            return values
+
+        # A válasz VarBind-jai a kérés sorrendjét követik
+        for i, (name, value) in enumerate(var_binds[: len(oids)]):
+            values[i] = _convert(value, as_str)
+
+    except Exception:
+        pass
+
+    return values
+
+
 async def snmp_get_bulk(
     host: str,
     oid: str,
@@ -95,6 +289,8 @@ async def snmp_get_bulk(
     port: int | None = None,
     timeout: float | None = None,
     max_repetitions: int = 25,
+    as_str: bool = True,
+    raw: bool = False,
 ) -> List[tuple]:
     """
     SNMP GETBULK lekérdezés táblázatos adatokhoz.
@@ -109,6 +305,8 @@ async def snmp_get_bulk(
         port: SNMP port
         timeout: Lekérdezési időtúllépés
         max_repetitions: Maximum visszaadandó sorok száma
+        as_str: False esetén az egész típusú értékek int-ként (lásd snmp_get)
+        raw: True esetén a pysnmp érték objektumok átalakítás nélkül
 
     Returns:
         Lista (oid, value) tuple-ökkel
@@ -130,15 +328,23 @@ async def snmp_get_bulk(
     results: List[tuple] = []
 
     try:
-        # SNMP GETBULK végrehajtása
-        iterator = bulk_cmd(
-            SnmpEngine(),
+        # A kért OID egyszer tuple-lé alakítva a ciklus előtt
+        # (szimbolikus vagy hibás OID esetén ValueError: üres lista)
+        base = tuple(int(part) for part in oid.strip(".").split("."))
+        base_len = len(base)
+
+        # SNMP GETBULK walk végrehajtása (a bulk_cmd csak egyetlen
+        # választ ad, a walk a következő oldalakat is lekéri)
+        iterator = bulk_walk_cmd(
+            _get_engine(),
             CommunityData(community),
-            await UdpTransportTarget.create((host, port), timeout=timeout),
+            await _get_transport(host, port, timeout),
             ContextData(),
             0,  # nonRepeaters
             max_repetitions,
             ObjectType(ObjectIdentity(oid)),
+            lexicographicMode=False,
+            lookupMib=False,
         )
 
         async for error_indication, error_status, error_index, var_binds in iterator:
@@ -147,11 +353,14 @@ async def snmp_get_bulk(
 
             for var_bind in var_binds:
                 name, value = var_bind
-                oid_str = str(name)
                 # Ellenőrizzük, hogy még a kért OID alatt vagyunk-e
-                if not oid_str.startswith(oid):
+                # (tuple prefix, így pl. ...1.1 nem illeszkedik ...1.10-re)
+                oid_tuple = name.asTuple()
+                if oid_tuple[:base_len] != base:
                     return results
-                results.append((oid_str, value.prettyPrint()))
+                if not raw:
+                    value = _convert(value, as_str)
+                results.append((".".join(map(str, oid_tuple)), value))
 
     except Exception:
         pass
@@ -182,13 +391,27 @@ async def get_system_info(
         ...     print(f"Uptime: {device.uptime_seconds}s")
     """
     try:
-        # Párhuzamos lekérdezések az összes system OID-re
-        sys_descr = await snmp_get(host, SNMP_OIDS["sysDescr"], community)
-        sys_object_id = await snmp_get(host, SNMP_OIDS["sysObjectID"], community)
-        sys_uptime = await snmp_get(host, SNMP_OIDS["sysUpTime"], community)
-        sys_contact = await snmp_get(host, SNMP_OIDS["sysContact"], community)
-        sys_name = await snmp_get(host, SNMP_OIDS["sysName"], community)
-        sys_location = await snmp_get(host, SNMP_OIDS["sysLocation"], community)
+        # Az összes system OID egyetlen GET kérésben
+        (
+            sys_descr,
+            sys_object_id,
+            sys_uptime,
+            sys_contact,
+            sys_name,
+            sys_location,
+        ) = await snmp_get_many(
+            host,
+            [
+                SNMP_OIDS["sysDescr"],
+                SNMP_OIDS["sysObjectID"],
+                SNMP_OIDS["sysUpTime"],
+                SNMP_OIDS["sysContact"],
+                SNMP_OIDS["sysName"],
+                SNMP_OIDS["sysLocation"],
+            ],
+            community,
+            as_str=False,
+        )
 
         # Ha semmit nem kaptunk, az eszköz nem elérhető
         if all(v is None for v in [sys_descr, sys_name, sys_uptime]):
@@ -196,13 +419,9 @@ async def get_system_info(
 
         # Uptime konvertálása másodpercre (SNMP timeticks = 1/100 sec)
         uptime_seconds: int | None = None
-        if sys_uptime:
-            try:
-                # Az uptime stringből kinyerjük a számot
-                uptime_ticks = int(sys_uptime)
-                uptime_seconds = uptime_ticks // 100
-            except (ValueError, TypeError):
-                pass
+        uptime_ticks = _safe_int(sys_uptime)
+        if uptime_ticks is not None:
+            uptime_seconds = uptime_ticks // 100
 
         return NetworkDevice(
             host=host,
@@ -243,63 +462,56 @@ async def get_interfaces(
 
     try:
         # Interface index-ek lekérése
-        indices = await snmp_get_bulk(host, SNMP_OIDS["ifIndex"], community)
+        indices = await _walk(host, SNMP_OIDS["ifIndex"], community, as_str=False)
+        if not indices:
+            return interfaces
+
+        # Oszloponként egy GETBULK walk, korlátozottan párhuzamosan
+        # (N interfész × 8 GET helyett összesen 8 walk)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WALKS)
+        (
+            descrs,
+            types,
+            mtus,
+            speeds,
+            phys_addresses,
+            oper_statuses,
+            in_octets,
+            out_octets,
+        ) = await asyncio.gather(
+            *(
+                _walk(
+                    host,
+                    SNMP_OIDS[column],
+                    community,
+                    semaphore,
+                    as_str=column in _IF_TEXT_COLUMNS,
+                    raw=column in _IF_RAW_COLUMNS,
+                )
+                for column in _IF_COLUMNS
+            )
+        )
 
-        for oid, index_value in indices:
+        for index_value in indices.values():
             try:
                 if_index = int(index_value)
             except ValueError:
                 continue
 
-            # Interface adatok lekérdezése egyenként
-            # (BULK használata index-enként nem praktikus)
-            if_descr = await snmp_get(
-                host, f"{SNMP_OIDS['ifDescr']}.{if_index}", community
-            )
-            if_type = await snmp_get(
-                host, f"{SNMP_OIDS['ifType']}.{if_index}", community
-            )
-            if_mtu = await snmp_get(host, f"{SNMP_OIDS['ifMtu']}.{if_index}", community)
-            if_speed = await snmp_get(
-                host, f"{SNMP_OIDS['ifSpeed']}.{if_index}", community
-            )
-            if_phys = await snmp_get(
-                host, f"{SNMP_OIDS['ifPhysAddress']}.{if_index}", community
-            )
-            if_oper = await snmp_get(
-                host, f"{SNMP_OIDS['ifOperStatus']}.{if_index}", community
-            )
-            if_in_octets = await snmp_get(
-                host, f"{SNMP_OIDS['ifInOctets']}.{if_index}", community
-            )
-            if_out_octets = await snmp_get(
-                host, f"{SNMP_OIDS['ifOutOctets']}.{if_index}", community
-            )
-
-            # Operációs státusz konvertálása
-            # 1=up, 2=down, 3=testing, 4=unknown, 5=dormant, 6=notPresent, 7=lowerLayerDown
-            status_map = {
-                "1": "up",
-                "2": "down",
-                "3": "testing",
-                "4": "unknown",
-                "5": "dormant",
-                "6": "notPresent",
-                "7": "lowerLayerDown",
-            }
-            oper_status = status_map.get(str(if_oper), "unknown") if if_oper else None
+            if_oper = oper_statuses.get(if_index)
+            oper_status = _OPER_STATUS_MAP.get(str(if_oper), "unknown") if if_oper else None
 
             interfaces.append(
                 SNMPInterface(
                     index=if_index,
-                    name=if_descr,
-                    type=_safe_int(if_type),
-                    mtu=_safe_int(if_mtu),
-                    speed=_safe_int(if_speed),
-                    phys_address=if_phys,
+                    name=descrs.get(if_index),
+                    type=_safe_int(types.get(if_index)),
+                    mtu=_safe_int(mtus.get(if_index)),
+                    speed=_safe_int(speeds.get(if_index)),
+                    phys_address=_format_phys_address(phys_addresses.get(if_index)),
                     oper_status=oper_status,
-                    in_octets=_safe_int(if_in_octets),
-                    out_octets=_safe_int(if_out_octets),
+                    in_octets=_safe_int(in_octets.get(if_index)),
+                    out_octets=_safe_int(out_octets.get(if_index)),
                 )
             )
 
@@ -309,6 +521,83 @@ async def get_interfaces(
     return interfaces
 
 
+async def _walk(
+    host: str,
+    base_oid: str,
+    community: str | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    as_str: bool = True,
+    raw: bool = False,
+) -> Dict[int, Any]:
+    """
+    Egy SNMP táblázat oszlopának bejárása, index szerint kulcsolva.
+
+    Args:
+        host: Cél eszköz IP címe
+        base_oid: Az oszlop OID-ja (pl. ifDescr)
+        community: SNMP community string
+        semaphore: Egyidejű walk-ok számát korlátozó szemafor (opcionális)
+        as_str: False esetén az egész típusú értékek int-ként
+        raw: True esetén a pysnmp érték objektumok átalakítás nélkül
+
+    Returns:
+        Dictionary {utolsó OID sub-id: érték}
+    """
+    prefix = base_oid + "."
+    column: Dict[int, Any] = {}
+
+    if semaphore is None:
+        rows = await snmp_get_bulk(host, base_oid, community, as_str=as_str, raw=raw)
+    else:
+        async with semaphore:
+            rows = await snmp_get_bulk(host, base_oid, community, as_str=as_str, raw=raw)
+
+    for oid_str, value in rows:
+        if not oid_str.startswith(prefix):
+            continue
+        try:
+            column[int(oid_str.rsplit(".", 1)[1])] = value
+        except ValueError:
+            continue
+
+    return column
+
+
+def _convert(value: Any, as_str: bool) -> Any:
+    """
+    VarBind érték átalakítása a hívó által kért formára.
+
+    Args:
+        value: pysnmp érték objektum
+        as_str: True esetén mindig prettyPrint() szöveg
+
+    Returns:
+        int az egész típusú értékekre (ha as_str False), egyébként szöveg
+    """
+    if not as_str and isinstance(value, univ.Integer):
+        # Integer32, Counter32/64, Gauge32, TimeTicks: nincs szöveges kerülő
+        return int(value)
+    return value.prettyPrint()
+
+
+def _format_phys_address(value: Any) -> Optional[str]:
+    """
+    ifPhysAddress érték formázása kettőspontos hex alakra.
+
+    Args:
+        value: Nyers OctetString (vagy bytes) érték
+
+    Returns:
+        MAC cím (pl. "00:1a:2b:3c:4d:5e") vagy None ha nincs cím
+    """
+    if value is None:
+        return None
+    octets = bytes(value)
+    if not octets:
+        return None
+    return ":".join(f"{b:02x}" for b in octets)
+
+
 def _safe_int(value: Any) -> Optional[int]:
     """
     Biztonságos integer konverzió.
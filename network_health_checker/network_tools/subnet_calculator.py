@@ -10,16 +10,163 @@ Használat:
     >>> print(f"Network: {info.network}, Hosts: {info.total_hosts}")
 """
 
-import ipaddress
-from typing import Iterator, List
+import socket
+import struct
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
 
 from ..models import SubnetInfo
 
+# 32 bites maszk a bitműveletekhez
+_ALL_ONES = 0xFFFFFFFF
+
+# Előre fordított struct a 32 bites, hálózati bájtsorrendű címekhez
+_IPV4_STRUCT = struct.Struct("!I")
+
+# Oktett -> string tábla a pontozott formázáshoz (nincs köztes bytes objektum)
+_OCTETS = tuple(str(i) for i in range(256))
+
+
+def _ip_to_int(ip: str) -> int:
+    """
+    Pontozott IPv4 cím konvertálása 32 bites egész számmá.
+
+    Az inet_pton szigorú (pontosan négy oktett, nincs rövidített alak),
+    így ugyanazokat a címeket fogadja el, mint az ipaddress modul.
+
+    Args:
+        ip: IPv4 cím (pl. "192.168.1.1")
+
+    Returns:
+        A cím egész számként
+
+    Raises:
+        ValueError: Ha a cím érvénytelen
+    """
+    try:
+        return _IPV4_STRUCT.unpack(socket.inet_pton(socket.AF_INET, ip))[0]
+    except (OSError, TypeError):
+        raise ValueError(f"Invalid IPv4 address: {ip!r}") from None
+
+
+def _int_to_ip(value: int) -> str:
+    """
+    32 bites egész szám konvertálása pontozott IPv4 címmé.
+
+    Args:
+        value: A cím egész számként
+
+    Returns:
+        IPv4 cím string
+    """
+    octets = _OCTETS
+    return (
+        f"{octets[value >> 24]}.{octets[(value >> 16) & 0xFF]}."
+        f"{octets[(value >> 8) & 0xFF]}.{octets[value & 0xFF]}"
+    )
+
+
+def _prefix_to_mask(prefixlen: int) -> int:
+    """
+    Prefix hossz (0-32) konvertálása 32 bites maszkká.
+
+    Args:
+        prefixlen: Prefix hossz
+
+    Returns:
+        Maszk egész számként (/0 esetén 0)
+    """
+    return (_ALL_ONES << (32 - prefixlen)) & _ALL_ONES
+
+
+def _is_contiguous_mask(mask: int) -> bool:
+    """
+    Ellenőrzi, hogy a maszk folytonos-e (felső 1-esek, alsó 0-k).
+
+    A host rész (invertált maszk) csak alsó 1-es bitekből állhat,
+    vagyis host + 1 kettő hatványa.
+
+    Args:
+        mask: Maszk egész számként
+
+    Returns:
+        True ha a maszk folytonos
+    """
+    host_bits = ~mask & _ALL_ONES
+    return host_bits & (host_bits + 1) == 0
+
+
+def _mask_to_prefix(mask: int) -> int:
+    """
+    Folytonos maszk konvertálása prefix hosszra.
+
+    Args:
+        mask: Folytonos maszk egész számként (lásd _is_contiguous_mask)
+
+    Returns:
+        Prefix hossz (0-32)
+    """
+    return 32 - (~mask & _ALL_ONES).bit_length()
+
+
+@lru_cache(maxsize=4096)
+def _parse_cidr(cidr: str) -> Tuple[int, int, int, int]:
+    """
+    CIDR string felbontása (hálózat, broadcast, maszk, prefix hossz) egészekre.
+
+    Minden CIDR-t fogadó függvény ezen keresztül dolgozik, így ugyanarra
+    az alhálózatra ismételt hívásnál (pl. konfigurációs lista bejárása)
+    csak egy cache keresés fut. Egy bejegyzés mindössze négy egész szám;
+    hibás CIDR nem kerül a cache-be.
+
+    A prefix nélküli cím /32-nek számít. Maszk formátumú prefix
+    (pl. "10.0.0.0/255.0.0.0" vagy host maszk: "10.0.0.0/0.255.255.255")
+    is elfogadott, az ipaddress modullal azonos módon.
+
+    Args:
+        cidr: CIDR formátumú cím (pl. "192.168.1.0/24")
+
+    Returns:
+        (hálózati cím, broadcast cím, maszk, prefix hossz) tuple;
+        a host bitek a hálózati címben nullázva vannak
+
+    Raises:
+        ValueError: Ha a cím vagy a prefix érvénytelen
+    """
+    address, slash, prefix = cidr.partition("/")
+
+    if "." in prefix:
+        mask = _ip_to_int(prefix)
+        if _is_contiguous_mask(mask):
+            prefixlen = _mask_to_prefix(mask)
+        else:
+            # Host maszk (invertált maszk) formátum
+            inverted = ~mask & _ALL_ONES
+            if not _is_contiguous_mask(inverted):
+                raise ValueError(f"Invalid netmask: {prefix!r}")
+            prefixlen = _mask_to_prefix(inverted)
+    elif not slash:
+        prefixlen = 32
+    elif prefix.isascii() and prefix.isdigit():
+        prefixlen = int(prefix)
+    else:
+        prefixlen = -1
+
+    if not 0 <= prefixlen <= 32:
+        raise ValueError(f"Invalid prefix length: {prefix!r}")
+
+    netmask = _prefix_to_mask(prefixlen)
+    network = _ip_to_int(address) & netmask
+    return network, network | (~netmask & _ALL_ONES), netmask, prefixlen
+
 
 def calculate_subnet(cidr: str) -> SubnetInfo:
     """
     Alhálózat információk kiszámítása CIDR notation alapján.
 
+    Tisztán egész aritmetikával számol (maszk, hálózat, broadcast),
+    a host címek felsorolása nélkül, így a prefix méretétől független.
+
     Args:
         cidr: CIDR formátumú hálózati cím (pl. "192.168.1.0/24")
 
@@ -35,28 +182,45 @@ def calculate_subnet(cidr: str) -> SubnetInfo:
         >>> print(f"Usable hosts: {info.total_hosts}")
     """
     try:
-        # IPv4Network objektum létrehozása
-        network = ipaddress.IPv4Network(cidr, strict=False)
+        network, _, netmask, prefixlen = _parse_cidr(cidr)
     except ValueError as e:
         raise ValueError(f"Invalid CIDR notation: {cidr} - {e}")
 
-    # Hostok számának kiszámítása
-    # A hálózati és broadcast cím nem használható host-ként
-    total_hosts = network.num_addresses - 2 if network.prefixlen < 31 else network.num_addresses
+    return _subnet_info(network, prefixlen, _int_to_ip(netmask))
 
-    # Első és utolsó host meghatározása
-    hosts = list(network.hosts())
-    first_host = str(hosts[0]) if hosts else str(network.network_address)
-    last_host = str(hosts[-1]) if hosts else str(network.broadcast_address)
+
+def _subnet_info(network: int, prefixlen: int, netmask_ip: str) -> SubnetInfo:
+    """
+    SubnetInfo összeállítása egész számként megadott hálózati címből.
+
+    Args:
+        network: Hálózati cím egész számként (már maszkolva)
+        prefixlen: Prefix hossz (0-32)
+        netmask_ip: A prefixhez tartozó maszk pontozott formában
+
+    Returns:
+        SubnetInfo objektum
+    """
+    num_addresses = 1 << (32 - prefixlen)
+    broadcast = network + num_addresses - 1
+
+    if prefixlen >= 31:
+        # /31 (RFC 3021) és /32: nincs hálózati/broadcast cím, minden cím host
+        first_host, last_host = network, broadcast
+        total_hosts = num_addresses
+    else:
+        # A hálózati és broadcast cím nem használható host-ként
+        first_host, last_host = network + 1, broadcast - 1
+        total_hosts = num_addresses - 2
 
     return SubnetInfo(
-        network=str(network.network_address),
-        netmask=str(network.netmask),
-        broadcast=str(network.broadcast_address),
-        first_host=first_host,
-        last_host=last_host,
-        total_hosts=max(0, total_hosts),
-        cidr=network.prefixlen,
+        network=_int_to_ip(network),
+        netmask=netmask_ip,
+        broadcast=_int_to_ip(broadcast),
+        first_host=_int_to_ip(first_host),
+        last_host=_int_to_ip(last_host),
+        total_hosts=total_hosts,
+        cidr=prefixlen,
     )
 
 
@@ -78,13 +242,49 @@ def ip_in_subnet(ip: str, cidr: str) -> bool:
         False
     """
     try:
-        ip_obj = ipaddress.IPv4Address(ip)
-        network = ipaddress.IPv4Network(cidr, strict=False)
-        return ip_obj in network
+        network, _, netmask, _ = _parse_cidr(cidr)
+        return (_ip_to_int(ip) & netmask) == network
     except ValueError:
         return False
 
 
+def ips_in_subnet(ips: Iterable[str], cidr: str) -> List[bool]:
+    """
+    Több IP cím tagságának ellenőrzése ugyanabban az alhálózatban.
+
+    A CIDR-t egyszer dolgozza fel, utána címenként csak egy konverzió
+    és egy AND + összehasonlítás fut (pl. tűzfal log osztályozáshoz).
+
+    Args:
+        ips: Ellenőrizendő IP címek
+        cidr: Alhálózat CIDR formátumban
+
+    Returns:
+        Bool lista az ips sorrendjében (érvénytelen IP vagy CIDR: False)
+
+    Example:
+        >>> ips_in_subnet(["192.168.1.10", "10.0.0.1"], "192.168.1.0/24")
+        [True, False]
+    """
+    try:
+        network, _, netmask, _ = _parse_cidr(cidr)
+    except ValueError:
+        return [False for _ in ips]
+
+    pton = socket.inet_pton
+    unpack = _IPV4_STRUCT.unpack
+    results: List[bool] = []
+    append = results.append
+
+    for ip in ips:
+        try:
+            append((unpack(pton(socket.AF_INET, ip))[0] & netmask) == network)
+        except (OSError, TypeError, ValueError):
+            append(False)
+
+    return results
+
+
 def get_subnet_hosts(cidr: str, limit: int | None = None) -> List[str]:
     """
     Alhálózat összes használható host címének listázása.
@@ -105,23 +305,24 @@ def get_subnet_hosts(cidr: str, limit: int | None = None) -> List[str]:
         >>> print(hosts)  # ['192.168.1.1', '192.168.1.2']
     """
     try:
-        network = ipaddress.IPv4Network(cidr, strict=False)
-        hosts = list(network.hosts())
-
-        if limit:
-            hosts = hosts[:limit]
-
-        return [str(h) for h in hosts]
+        hosts = _host_range(cidr)
     except ValueError:
         return []
 
+    # A range szeletelése O(1), így limit esetén csak limit darab cím készül
+    if limit:
+        hosts = hosts[:limit]
+
+    return [_int_to_ip(host) for host in hosts]
+
 
 def iterate_subnet_hosts(cidr: str) -> Iterator[str]:
     """
     Alhálózat host címeinek iterálása.
 
     Generator függvény, ami egyenként adja vissza a host címeket.
-    Memória-hatékony nagy alhálózatokhoz.
+    Memória-hatékony nagy alhálózatokhoz: egész számokon iterál,
+    IPv4Address objektumok létrehozása nélkül.
 
     Args:
         cidr: Alhálózat CIDR formátumban
@@ -134,12 +335,38 @@ def iterate_subnet_hosts(cidr: str) -> Iterator[str]:
         ...     print(f"Checking {ip}...")
     """
     try:
-        network = ipaddress.IPv4Network(cidr, strict=False)
-        for host in network.hosts():
-            yield str(host)
+        hosts = _host_range(cidr)
     except ValueError:
         return
 
+    octets = _OCTETS
+    for host in hosts:
+        yield (
+            f"{octets[host >> 24]}.{octets[(host >> 16) & 0xFF]}."
+            f"{octets[(host >> 8) & 0xFF]}.{octets[host & 0xFF]}"
+        )
+
+
+def _host_range(cidr: str) -> range:
+    """
+    Alhálózat használható host címei egész szám tartományként.
+
+    Args:
+        cidr: Alhálózat CIDR formátumban
+
+    Returns:
+        range a host címekkel (/31 és /32 esetén minden cím)
+
+    Raises:
+        ValueError: Ha a CIDR formátum érvénytelen
+    """
+    network, broadcast, _, prefixlen = _parse_cidr(cidr)
+
+    if prefixlen >= 31:
+        return range(network, broadcast + 1)
+    # Hálózati és broadcast cím nélkül
+    return range(network + 1, broadcast)
+
 
 def netmask_to_cidr(netmask: str) -> int:
     """
@@ -151,6 +378,9 @@ def netmask_to_cidr(netmask: str) -> int:
     Returns:
         CIDR prefix hossz (pl. 24)
 
+    Raises:
+        ValueError: Ha a maszk érvénytelen vagy nem folytonos (pl. "255.0.255.0")
+
     Example:
         >>> netmask_to_cidr("255.255.255.0")
         24
@@ -158,14 +388,15 @@ def netmask_to_cidr(netmask: str) -> int:
         16
     """
     try:
-        # IP cím objektumként értelmezve a maszk
-        mask = ipaddress.IPv4Address(netmask)
-        # Bináris reprezentáció 1-eseinek számlálása
-        binary = bin(int(mask))
-        return binary.count("1")
+        mask = _ip_to_int(netmask)
     except ValueError:
         raise ValueError(f"Invalid netmask: {netmask}")
 
+    if not _is_contiguous_mask(mask):
+        raise ValueError(f"Invalid netmask: {netmask} (not contiguous)")
+
+    return _mask_to_prefix(mask)
+
 
 def cidr_to_netmask(cidr: int) -> str:
     """
@@ -186,9 +417,7 @@ def cidr_to_netmask(cidr: int) -> str:
     if not 0 <= cidr <= 32:
         raise ValueError(f"Invalid CIDR prefix: {cidr}. Must be 0-32.")
 
-    # Hálózat létrehozása és maszk kinyerése
-    network = ipaddress.IPv4Network(f"0.0.0.0/{cidr}")
-    return str(network.netmask)
+    return _int_to_ip(_prefix_to_mask(cidr))
 
 
 def split_subnet(cidr: str, new_prefix: int) -> List[SubnetInfo]:
@@ -208,17 +437,25 @@ def split_subnet(cidr: str, new_prefix: int) -> List[SubnetInfo]:
         ...     print(f"{s.network}/{s.cidr}: {s.total_hosts} hosts")
     """
     try:
-        network = ipaddress.IPv4Network(cidr, strict=False)
+        network, broadcast, _, prefixlen = _parse_cidr(cidr)
 
-        if new_prefix <= network.prefixlen:
-            raise ValueError(f"New prefix must be larger than {network.prefixlen}")
-
-        subnets = list(network.subnets(new_prefix=new_prefix))
-        return [calculate_subnet(str(s)) for s in subnets]
+        if new_prefix <= prefixlen:
+            raise ValueError(f"New prefix must be larger than {prefixlen}")
+        if new_prefix > 32:
+            raise ValueError(f"Invalid new prefix: {new_prefix}. Must be at most 32.")
 
     except ValueError as e:
         raise ValueError(f"Cannot split subnet: {e}")
 
+    # A részhálózatok egymást követő, step méretű blokkok; a maszk közös
+    step = 1 << (32 - new_prefix)
+    netmask_ip = _int_to_ip(_prefix_to_mask(new_prefix))
+
+    return [
+        _subnet_info(child, new_prefix, netmask_ip)
+        for child in range(network, broadcast + 1, step)
+    ]
+
 
 def is_private_ip(ip: str) -> bool:
     """
@@ -229,6 +466,10 @@ def is_private_ip(ip: str) -> bool:
     - 172.16.0.0/12
     - 192.168.0.0/16
 
+    Valamint a nem route-olható helyi tartományok:
+    - 127.0.0.0/8 (loopback)
+    - 169.254.0.0/16 (link-local)
+
     Args:
         ip: Ellenőrizendő IP cím
 
@@ -242,11 +483,19 @@ def is_private_ip(ip: str) -> bool:
         False
     """
     try:
-        ip_obj = ipaddress.IPv4Address(ip)
-        return ip_obj.is_private
+        value = _ip_to_int(ip)
     except ValueError:
         return False
 
+    # Tartományonként egy maszkolás és összehasonlítás
+    return (
+        (value & 0xFF000000) == 0x0A000000  # 10.0.0.0/8
+        or (value & 0xFFF00000) == 0xAC100000  # 172.16.0.0/12
+        or (value & 0xFFFF0000) == 0xC0A80000  # 192.168.0.0/16
+        or (value & 0xFF000000) == 0x7F000000  # 127.0.0.0/8
+        or (value & 0xFFFF0000) == 0xA9FE0000  # 169.254.0.0/16
+    )
+
 
 def is_valid_ip(ip: str) -> bool:
     """
@@ -259,7 +508,10 @@ def is_valid_ip(ip: str) -> bool:
         True ha érvényes IPv4 cím
     """
     try:
-        ipaddress.IPv4Address(ip)
+        # Az inet_pton szigorú pontozott formát vár (az inet_aton-nal
+        # ellentétben nem fogad el "10" vagy "1.2.3.4 x" alakot)
+        socket.inet_pton(socket.AF_INET, ip)
         return True
-    except ValueError:
+    except (OSError, TypeError, ValueError):
+        # ValueError: beágyazott NUL karakter (pl. "1.2.3.4\x00")
         return False
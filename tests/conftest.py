@@ -5,17 +5,17 @@ Ez a fájl tartalmazza a tesztekhez használt közös beállításokat,
 fixture-öket és mock konfigurációkat.
 """
 
-import os
-import sys
+import errno
+import ipaddress
+import socket
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Projekt gyökérkönyvtár hozzáadása a Python path-hoz
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+# A projekt gyökér és az alprojektek import útvonalát a pyproject.toml
+# [tool.pytest.ini_options] pythonpath beállítása adja.
 
 
 # ============================================
@@ -23,32 +23,118 @@ sys.path.insert(0, str(PROJECT_ROOT))
 # ============================================
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def setup_test_environment() -> Generator[None, None, None]:
     """
-    Teszt környezet beállítása minden teszthez.
+    Teszt környezet beállítása a teljes teszt futáshoz.
 
-    Beállítja a szükséges környezeti változókat és
-    a teszt végén visszaállítja az eredeti állapotot.
+    A környezeti változók statikusak és egyetlen teszt sem módosítja
+    őket, ezért session szinten egyszer állítjuk be, és a futás végén
+    visszaállítjuk az eredeti állapotot (nem tesztenként másoljuk
+    a teljes környezetet).
     """
-    # Eredeti környezet mentése
-    original_env = os.environ.copy()
-
-    # Teszt környezeti változók beállítása
-    os.environ.update(
-        {
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Teszt környezeti változók beállítása
+        for name, value in {
             "SNMP_COMMUNITY": "public",
             "SNMP_VERSION": "2c",
             "DEFAULT_TIMEOUT": "5.0",
             "LOG_LEVEL": "DEBUG",
-        }
-    )
+        }.items():
+            monkeypatch.setenv(name, value)
+
+        yield
+
+
+# ============================================
+# Hálózati hozzáférés tiltása
+# ============================================
+
+
+class NetworkAccessBlocked(OSError):
+    """Egy teszt mock nélkül próbált a loopback-en kívülre kapcsolódni."""
 
-    yield
 
-    # Eredeti környezet visszaállítása
-    os.environ.clear()
-    os.environ.update(original_env)
+def _is_loopback(host: Any) -> bool:
+    """True, ha a cím loopback IP, "localhost" vagy Unix socket útvonal."""
+    if not isinstance(host, str):
+        return True  # Unix socket (bytes útvonal) vagy ismeretlen cím forma
+    if host == "localhost" or host.startswith("/"):
+        return True
+    try:
+        return ipaddress.ip_address(host.split("%", 1)[0]).is_loopback
+    except ValueError:
+        return False
+
+
+def _check_address(address: Any) -> None:
+    """NetworkAccessBlocked, ha a cél nem loopback."""
+    host = address[0] if isinstance(address, tuple) else address
+    if not _is_loopback(host):
+        raise NetworkAccessBlocked(
+            errno.ENETUNREACH, f"Network access blocked in tests: {host!r} (mock it)"
+        )
+
+
+def _check_hostname(host: Any) -> None:
+    """NetworkAccessBlocked, ha a név feloldása DNS-t igényelne (nem IP literál)."""
+    if host is None or _is_loopback(host):
+        return
+    try:
+        ipaddress.ip_address(host.split("%", 1)[0] if isinstance(host, str) else host)
+    except ValueError:
+        raise NetworkAccessBlocked(
+            errno.ENETUNREACH, f"DNS resolution blocked in tests: {host!r} (mock it)"
+        ) from None
+
+
+@pytest.fixture(autouse=True, scope="session")
+def block_network_access() -> Generator[None, None, None]:
+    """
+    Valós hálózati forgalom tiltása a teljes teszt futásra.
+
+    A loopback-en kívüli connect/connect_ex/sendto és az IP literálnak
+    nem minősülő nevek feloldása azonnal NetworkAccessBlocked (OSError,
+    ENETUNREACH) hibát ad, így egy hiányzó mock nem vár hálózati timeout-ra.
+    A loopback (valós figyelő socketes tesztek) és az IP literálok
+    feloldása továbbra is működik. A tesztek saját patch-ei erre épülnek
+    rá, és a végükön ide állnak vissza.
+    """
+    real_socket = socket.socket
+    real_connect = real_socket.connect
+    real_connect_ex = real_socket.connect_ex
+    real_sendto = real_socket.sendto
+    real_getaddrinfo = socket.getaddrinfo
+    real_gethostbyname = socket.gethostbyname
+
+    def connect(sock: socket.socket, address: Any) -> None:
+        _check_address(address)
+        return real_connect(sock, address)
+
+    def connect_ex(sock: socket.socket, address: Any) -> int:
+        _check_address(address)
+        return real_connect_ex(sock, address)
+
+    def sendto(sock: socket.socket, data: bytes, *args: Any) -> int:
+        # sendto(data, address) vagy sendto(data, flags, address)
+        _check_address(args[-1])
+        return real_sendto(sock, data, *args)
+
+    def getaddrinfo(host: Any, *args: Any, **kwargs: Any) -> Any:
+        _check_hostname(host)
+        return real_getaddrinfo(host, *args, **kwargs)
+
+    def gethostbyname(host: str) -> str:
+        _check_hostname(host)
+        return real_gethostbyname(host)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(real_socket, "connect", connect)
+        monkeypatch.setattr(real_socket, "connect_ex", connect_ex)
+        monkeypatch.setattr(real_socket, "sendto", sendto)
+        monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+        monkeypatch.setattr(socket, "gethostbyname", gethostbyname)
+        yield
 
 
 # ============================================
@@ -9,9 +9,6 @@ from pathlib import Path
 
 import pytest
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/tests/", 1)[0] + "/5-backup-automation")
-
 from backup_manager.models import (
     BackupConfig,
     BackupJob,
@@ -4,16 +4,13 @@ DNS Lookup tesztek.
 Tesztek a DNS lekérdezési funkciókhoz.
 """
 
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Projekt gyökér hozzáadása a path-hoz
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from network_health_checker.network_tools.dns_lookup import (
+    _lookup_any,
     get_mx_records,
     get_nameservers,
     lookup_all_records,
@@ -75,6 +72,13 @@ class TestLookupDns:
 
         assert result.values == []
 
+    def test_repeated_lookup_sees_same_answer(self, mock_dns_resolver):
+        """Ugyanaz a válasz objektum ismételten is bejárható (nem egyszeri iterátor)."""
+        first = lookup_dns("example.com", "A")
+        second = lookup_dns("example.com", "A")
+
+        assert first.values == second.values == ["93.184.216.34"]
+
     def test_custom_nameserver(self, mock_dns_resolver):
         """Egyedi nameserver használata."""
         result = lookup_dns("example.com", "A", nameserver="8.8.8.8")
@@ -102,6 +106,62 @@ class TestLookupAllRecords:
         for result in results:
             assert len(result.values) > 0
 
+    def test_any_query_fast_path(self, mock_dns_any):
+        """ANY válaszban szereplő típusokat nem kérdezi le újra."""
+        results = lookup_all_records("example.com")
+
+        by_type = {r.record_type: r for r in results}
+        assert by_type["A"].values == ["93.184.216.34"]
+        assert by_type["A"].ttl == 3600
+        assert by_type["MX"].values == ["10 mail.example.com."]
+
+        # Csak a hiányzó típusokhoz volt külön lekérdezés
+        queried = [c.args[1] for c in mock_dns_any.return_value.resolve.call_args_list]
+        assert sorted(queried) == ["AAAA", "CNAME", "NS", "TXT"]
+
+    def test_any_nxdomain_skips_per_type_queries(self, mock_any_query):
+        """NXDOMAIN ANY válasz esetén nincs típusonkénti lekérdezés."""
+        import dns.rcode
+
+        mock_any_query.return_value = (_any_response(rcode=dns.rcode.NXDOMAIN), False)
+
+        assert _lookup_any("missing.example.com", ["A", "MX"]) == {}
+        assert lookup_all_records("missing.example.com") == []
+
+    @pytest.mark.parametrize("rcode_name", ["REFUSED", "NOTIMP"])
+    def test_any_rejected_falls_back(self, mock_any_query, rcode_name):
+        """REFUSED / NOTIMP válasz esetén None (típusonkénti lekérdezés)."""
+        import dns.rcode
+
+        rcode = dns.rcode.from_text(rcode_name)
+        mock_any_query.return_value = (_any_response(rcode=rcode), False)
+
+        assert _lookup_any("example.com", ["A", "MX"]) is None
+
+    def test_any_timeout_falls_back(self, mock_any_query):
+        """Időtúllépés / hálózati hiba esetén None."""
+        import dns.exception
+
+        mock_any_query.side_effect = dns.exception.Timeout()
+
+        assert _lookup_any("example.com", ["A", "MX"]) is None
+
+    def test_any_minimal_response_falls_back(self, mock_any_query):
+        """RFC 8482 minimális (HINFO) válasz esetén None."""
+        mock_any_query.return_value = (
+            _any_response(("HINFO", '"RFC8482" ""')),
+            False,
+        )
+
+        assert _lookup_any("example.com", ["A", "MX"]) is None
+
+    def test_any_skips_non_string_nameserver(self, mock_any_query, patched_resolver):
+        """Nem sima címként megadott nameserver (pl. DoH) esetén nincs ANY kérés."""
+        patched_resolver.return_value.nameservers = [object()]
+
+        assert _lookup_any("example.com", ["A", "MX"]) is None
+        mock_any_query.assert_not_called()
+
 
 class TestReverseLookup:
     """reverse_lookup függvény tesztjei."""
@@ -148,159 +208,216 @@ class TestGetMxRecords:
 # =============================================================================
 
 
-@pytest.fixture
-def mock_dns_resolver():
-    """Mock a sikeres DNS A rekord lekérdezéshez."""
-    with patch("network_health_checker.network_tools.dns_lookup.dns.resolver.Resolver") as mock_resolver:
-        # Mock resolver instance
-        resolver_instance = MagicMock()
-        mock_resolver.return_value = resolver_instance
+_DNS_LOOKUP = "network_health_checker.network_tools.dns_lookup"
+
+
+class _Rdata(SimpleNamespace):
+    """Rdata mock: a str() a megadott szöveget adja, mock hívás nélkül."""
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class _Answer(list):
+    """Resolver válasz mock: iterálható rdata lista rrset.ttl-lel."""
+
+    rrset: SimpleNamespace
 
-        # Mock answer
-        mock_answer = MagicMock()
-        mock_rdata = MagicMock()
-        mock_rdata.__str__ = MagicMock(return_value="93.184.216.34")
 
-        # rrset TTL
-        mock_rrset = MagicMock()
-        mock_rrset.ttl = 3600
-        mock_answer.rrset = mock_rrset
-        mock_answer.__iter__ = MagicMock(return_value=iter([mock_rdata]))
+@pytest.fixture(scope="session")
+def dns_answer_factory():
+    """
+    Közös factory a DNS válasz mock-okhoz.
 
-        resolver_instance.resolve.return_value = mock_answer
+    A szöveges értékekből _Rdata, a többi (pl. MX rdata) változatlanul
+    kerül a válaszba. A válasz többször is bejárható.
+    """
 
+    def make_answer(rdatas, ttl=3600):
+        answer = _Answer(_Rdata(text=r) if isinstance(r, str) else r for r in rdatas)
+        answer.rrset = SimpleNamespace(ttl=ttl)
+        return answer
+
+    return make_answer
+
+
+@pytest.fixture
+def patched_resolver():
+    """A dns.resolver.Resolver patch-elése (csak az azt kérő tesztekben)."""
+    with patch(f"{_DNS_LOOKUP}.dns.resolver.Resolver") as mock_resolver:
         yield mock_resolver
 
 
 @pytest.fixture
-def mock_dns_resolver_mx():
-    """Mock MX rekord lekérdezéshez."""
-    with patch("network_health_checker.network_tools.dns_lookup.dns.resolver.Resolver") as mock_resolver:
-        resolver_instance = MagicMock()
-        mock_resolver.return_value = resolver_instance
+def mock_dns_resolver(patched_resolver, dns_answer_factory):
+    """Mock a sikeres DNS A rekord lekérdezéshez."""
+    import dns.resolver
 
-        mock_answer = MagicMock()
-        mock_rdata = MagicMock()
-        mock_rdata.preference = 10
-        mock_rdata.exchange = "mail.example.com."
+    mock_resolver = patched_resolver
+    # Mock resolver instance
+    resolver_instance = MagicMock()
+    mock_resolver.return_value = resolver_instance
 
-        mock_rrset = MagicMock()
-        mock_rrset.ttl = 3600
-        mock_answer.rrset = mock_rrset
-        mock_answer.__iter__ = MagicMock(return_value=iter([mock_rdata]))
+    a_answer = dns_answer_factory(["93.184.216.34"])
 
-        resolver_instance.resolve.return_value = mock_answer
+    def resolve_side_effect(domain, record_type):
+        # Csak A rekord létezik; a válasz többször is bejárható
+        if record_type == "A":
+            return a_answer
+        raise dns.resolver.NoAnswer()
 
-        yield mock_resolver
+    resolver_instance.resolve.side_effect = resolve_side_effect
+
+    yield mock_resolver
+
+
+@pytest.fixture
+def mock_dns_resolver_mx(patched_resolver, dns_answer_factory):
+    """Mock MX rekord lekérdezéshez."""
+    mock_resolver = patched_resolver
+    resolver_instance = MagicMock()
+    mock_resolver.return_value = resolver_instance
+
+    mx_rdata = SimpleNamespace(preference=10, exchange="mail.example.com.")
+    resolver_instance.resolve.return_value = dns_answer_factory([mx_rdata])
+
+    yield mock_resolver
 
 
 @pytest.fixture
-def mock_dns_nxdomain():
+def mock_dns_nxdomain(patched_resolver):
     """Mock NXDOMAIN válaszhoz."""
     import dns.resolver
 
-    with patch("network_health_checker.network_tools.dns_lookup.dns.resolver.Resolver") as mock_resolver:
-        resolver_instance = MagicMock()
-        mock_resolver.return_value = resolver_instance
-        resolver_instance.resolve.side_effect = dns.resolver.NXDOMAIN()
+    mock_resolver = patched_resolver
+    resolver_instance = MagicMock()
+    mock_resolver.return_value = resolver_instance
+    resolver_instance.resolve.side_effect = dns.resolver.NXDOMAIN()
 
-        yield mock_resolver
+    yield mock_resolver
 
 
 @pytest.fixture
-def mock_dns_no_answer():
+def mock_dns_no_answer(patched_resolver):
     """Mock NoAnswer válaszhoz."""
     import dns.resolver
 
-    with patch("network_health_checker.network_tools.dns_lookup.dns.resolver.Resolver") as mock_resolver:
-        resolver_instance = MagicMock()
-        mock_resolver.return_value = resolver_instance
-        resolver_instance.resolve.side_effect = dns.resolver.NoAnswer()
+    mock_resolver = patched_resolver
+    resolver_instance = MagicMock()
+    mock_resolver.return_value = resolver_instance
+    resolver_instance.resolve.side_effect = dns.resolver.NoAnswer()
 
-        yield mock_resolver
+    yield mock_resolver
 
 
 @pytest.fixture
-def mock_dns_timeout():
+def mock_dns_timeout(patched_resolver):
     """Mock timeout-hoz."""
     import dns.exception
 
-    with patch("network_health_checker.network_tools.dns_lookup.dns.resolver.Resolver") as mock_resolver:
-        resolver_instance = MagicMock()
-        mock_resolver.return_value = resolver_instance
-        resolver_instance.resolve.side_effect = dns.exception.Timeout()
+    mock_resolver = patched_resolver
+    resolver_instance = MagicMock()
+    mock_resolver.return_value = resolver_instance
+    resolver_instance.resolve.side_effect = dns.exception.Timeout()
 
-        yield mock_resolver
+    yield mock_resolver
 
 
 @pytest.fixture
-def mock_dns_partial():
+def mock_dns_partial(patched_resolver, dns_answer_factory):
     """Mock részleges eredményekhez."""
     import dns.resolver
 
-    with patch("network_health_checker.network_tools.dns_lookup.dns.resolver.Resolver") as mock_resolver:
-        resolver_instance = MagicMock()
-        mock_resolver.return_value = resolver_instance
+    mock_resolver = patched_resolver
+    resolver_instance = MagicMock()
+    mock_resolver.return_value = resolver_instance
 
-        def resolve_side_effect(domain, record_type):
-            if record_type == "A":
-                mock_answer = MagicMock()
-                mock_rdata = MagicMock()
-                mock_rdata.__str__ = MagicMock(return_value="93.184.216.34")
-                mock_rrset = MagicMock()
-                mock_rrset.ttl = 3600
-                mock_answer.rrset = mock_rrset
-                mock_answer.__iter__ = MagicMock(return_value=iter([mock_rdata]))
-                return mock_answer
-            raise dns.resolver.NoAnswer()
+    def resolve_side_effect(domain, record_type):
+        if record_type == "A":
+            return dns_answer_factory(["93.184.216.34"])
+        raise dns.resolver.NoAnswer()
 
-        resolver_instance.resolve.side_effect = resolve_side_effect
+    resolver_instance.resolve.side_effect = resolve_side_effect
 
-        yield mock_resolver
+    yield mock_resolver
 
 
 @pytest.fixture
-def mock_dns_ptr():
-    """Mock PTR rekord lekérdezéshez."""
-    with patch("network_health_checker.network_tools.dns_lookup.dns.resolver.Resolver") as mock_resolver:
-        with patch("network_health_checker.network_tools.dns_lookup.dns.reversename.from_address") as mock_reverse:
-            mock_reverse.return_value = "8.8.8.8.in-addr.arpa."
+def mock_dns_any(patched_resolver):
+    """Mock ANY lekérdezéshez (A és MX rekord egy válaszban)."""
+    import dns.message
+    import dns.resolver
+    import dns.rrset
+
+    mock_resolver = patched_resolver
+    query = dns.message.make_query("example.com", "ANY")
+    response = dns.message.make_response(query)
+    response.answer.append(dns.rrset.from_text("example.com.", 3600, "IN", "A", "93.184.216.34"))
+    response.answer.append(
+        dns.rrset.from_text("example.com.", 3600, "IN", "MX", "10 mail.example.com.")
+    )
+
+    with patch(f"{_DNS_LOOKUP}.dns.query.udp_with_fallback") as mock_udp:
+        mock_udp.return_value = (response, False)
+        resolver_instance = MagicMock()
+        mock_resolver.return_value = resolver_instance
+        resolver_instance.nameservers = ["192.0.2.53"]
+        resolver_instance.resolve.side_effect = dns.resolver.NoAnswer()
+
+        yield mock_resolver
 
-            resolver_instance = MagicMock()
-            mock_resolver.return_value = resolver_instance
 
-            mock_answer = MagicMock()
-            mock_rdata = MagicMock()
-            mock_rdata.__str__ = MagicMock(return_value="dns.google.")
+def _any_response(*records, rcode=0):
+    """ANY lekérdezésre adott válasz összeállítása (rekord típus, szöveg) párokból."""
+    import dns.message
+    import dns.rrset
 
-            mock_rrset = MagicMock()
-            mock_rrset.ttl = 3600
-            mock_answer.rrset = mock_rrset
-            mock_answer.__iter__ = MagicMock(return_value=iter([mock_rdata]))
+    response = dns.message.make_response(dns.message.make_query("example.com", "ANY"))
+    response.set_rcode(rcode)
+    for record_type, text in records:
+        response.answer.append(dns.rrset.from_text("example.com.", 3600, "IN", record_type, text))
+    return response
 
-            resolver_instance.resolve.return_value = mock_answer
 
-            yield mock_resolver
+@pytest.fixture
+def mock_any_query(patched_resolver):
+    """Mock az ANY kéréshez: a teszt állítja be a dns.query válaszát."""
+    import dns.resolver
+
+    resolver_instance = MagicMock()
+    patched_resolver.return_value = resolver_instance
+    resolver_instance.nameservers = ["192.0.2.53"]
+    resolver_instance.resolve.side_effect = dns.resolver.NoAnswer()
+
+    with patch(f"{_DNS_LOOKUP}.dns.query.udp_with_fallback") as mock_udp:
+        yield mock_udp
 
 
 @pytest.fixture
-def mock_dns_ns():
-    """Mock NS rekord lekérdezéshez."""
-    with patch("network_health_checker.network_tools.dns_lookup.dns.resolver.Resolver") as mock_resolver:
-        resolver_instance = MagicMock()
-        mock_resolver.return_value = resolver_instance
+def mock_dns_ptr(patched_resolver, dns_answer_factory, monkeypatch):
+    """Mock PTR rekord lekérdezéshez."""
+    mock_resolver = patched_resolver
+    # A reverse név képzése egyszerű csere, MagicMock nélkül
+    monkeypatch.setattr(
+        f"{_DNS_LOOKUP}.dns.reversename.from_address",
+        lambda ip_address: "8.8.8.8.in-addr.arpa.",
+    )
 
-        mock_answer = MagicMock()
-        mock_rdata1 = MagicMock()
-        mock_rdata1.__str__ = MagicMock(return_value="ns1.example.com.")
-        mock_rdata2 = MagicMock()
-        mock_rdata2.__str__ = MagicMock(return_value="ns2.example.com.")
+    resolver_instance = MagicMock()
+    mock_resolver.return_value = resolver_instance
+    resolver_instance.resolve.return_value = dns_answer_factory(["dns.google."])
 
-        mock_rrset = MagicMock()
-        mock_rrset.ttl = 3600
-        mock_answer.rrset = mock_rrset
-        mock_answer.__iter__ = MagicMock(return_value=iter([mock_rdata1, mock_rdata2]))
+    yield mock_resolver
 
-        resolver_instance.resolve.return_value = mock_answer
 
-        yield mock_resolver
+@pytest.fixture
+def mock_dns_ns(patched_resolver, dns_answer_factory):
+    """Mock NS rekord lekérdezéshez."""
+    mock_resolver = patched_resolver
+    resolver_instance = MagicMock()
+    mock_resolver.return_value = resolver_instance
+    resolver_instance.resolve.return_value = dns_answer_factory(
+        ["ns1.example.com.", "ns2.example.com."]
+    )
+
+    yield mock_resolver
@@ -5,16 +5,14 @@ Tesztek a helyi hálózati információk lekérdezéséhez.
 """
 
 import socket
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from collections import namedtuple
+from unittest.mock import DEFAULT, patch
 
 import pytest
 
-# Projekt gyökér hozzáadása a path-hoz
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from network_health_checker.network_tools.network_info import (
+    _is_link_local_v6,
+    clear_dns_cache,
     get_active_connections,
     get_default_gateway,
     get_fqdn,
@@ -63,6 +61,27 @@ class TestGetLocalInterfaces:
         names = [i.name for i in interfaces]
         assert "lo" in names
 
+    def test_skips_link_local_ipv6(self, mock_psutil_interfaces_ipv6):
+        """A teljes fe80::/10 link-local tartomány kimarad."""
+        interfaces = get_local_interfaces()
+
+        assert interfaces[0].ipv6_address == "2001:db8::1"
+
+    @pytest.mark.parametrize(
+        "address, expected",
+        [
+            ("fe80::1", True),
+            ("FEBF::1%eth0", True),
+            ("fe8::1", False),  # 0fe8::1, nem link-local
+            ("fe9::", False),
+            ("fec0::1", False),
+            ("2001:db8::1", False),
+        ],
+    )
+    def test_link_local_v6_detection(self, address, expected):
+        """Csak a teljes, 4 jegyű fe80::/10 első csoport link-local."""
+        assert _is_link_local_v6(address) is expected
+
 
 class TestGetInterfaceByName:
     """get_interface_by_name függvény tesztjei."""
@@ -190,12 +209,35 @@ class TestResolveHostname:
 
         assert ip == "93.184.216.34"
 
+    def test_caches_result(self, mock_socket_resolve):
+        """Ismételt feloldás a cache-ből jön, nincs újabb DNS hívás."""
+        resolve_hostname("example.com")
+        resolve_hostname("example.com")
+
+        assert mock_socket_resolve.call_count == 1
+
     def test_returns_none_for_invalid(self, mock_socket_resolve_fail):
         """None visszaadása érvénytelen hostname-re."""
         ip = resolve_hostname("nonexistent.invalid")
 
         assert ip is None
 
+    def test_failure_is_not_cached(self, mock_socket_resolve):
+        """Átmeneti hiba után a következő hívás újra feloldja a nevet."""
+        mock_socket_resolve.side_effect = [socket.gaierror(-3, "Temporary failure"), DEFAULT]
+
+        assert resolve_hostname("example.com") is None
+        assert resolve_hostname("example.com") == "93.184.216.34"
+        assert mock_socket_resolve.call_count == 2
+
+    def test_clear_dns_cache(self, mock_socket_resolve):
+        """clear_dns_cache után a név újra feloldásra kerül."""
+        resolve_hostname("example.com")
+        clear_dns_cache()
+        resolve_hostname("example.com")
+
+        assert mock_socket_resolve.call_count == 2
+
 
 class TestReverseResolve:
     """reverse_resolve függvény tesztjei."""
@@ -212,163 +254,220 @@ class TestReverseResolve:
 
         assert hostname is None
 
+    def test_failure_is_not_cached(self, mock_socket_reverse_fail):
+        """Sikertelen reverse lookup nem kerül a cache-be."""
+        reverse_resolve("192.168.1.1")
+        reverse_resolve("192.168.1.1")
+
+        assert mock_socket_reverse_fail.call_count == 2
+
 
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
 
+_NETWORK_INFO = "network_health_checker.network_tools.network_info"
+
+# A psutil rekordok egyszerű namedtuple megfelelői (snicaddr, snicstats,
+# sconn, addr, snetio): a mezőelérés sima attribútum, nincs MagicMock
+Addr = namedtuple("Addr", "family address netmask")
+Stat = namedtuple("Stat", "isup speed mtu")
+Conn = namedtuple("Conn", "type laddr raddr status pid")
+LAddr = namedtuple("LAddr", "ip port")
+IoCounters = namedtuple(
+    "IoCounters",
+    "bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout",
+)
+
+
 @pytest.fixture
-def mock_psutil_interfaces():
-    """Mock psutil interfész lekérdezéshez."""
-    with patch("network_health_checker.network_tools.network_info.psutil.net_if_addrs") as mock_addrs:
-        with patch("network_health_checker.network_tools.network_info.psutil.net_if_stats") as mock_stats:
-            # Mock interfész címek
-            mock_addr_ipv4 = MagicMock()
-            mock_addr_ipv4.family = socket.AF_INET
-            mock_addr_ipv4.address = "192.168.1.100"
-            mock_addr_ipv4.netmask = "255.255.255.0"
+def patched_psutil():
+    """A network_info psutil függvényeinek patch-elése egyetlen patch.multiple-lel."""
+    with patch.multiple(
+        f"{_NETWORK_INFO}.psutil",
+        net_if_addrs=DEFAULT,
+        net_if_stats=DEFAULT,
+        net_connections=DEFAULT,
+        net_io_counters=DEFAULT,
+        Process=DEFAULT,
+    ) as mocks:
+        yield mocks
+
 
-            mock_addr_mac = MagicMock()
-            mock_addr_mac.family = 17  # AF_LINK
-            mock_addr_mac.address = "00:11:22:33:44:55"
+@pytest.fixture
+def patched_socket():
+    """A network_info socket függvényeinek patch-elése egyetlen patch.multiple-lel."""
+    with patch.multiple(
+        f"{_NETWORK_INFO}.socket",
+        gethostname=DEFAULT,
+        getfqdn=DEFAULT,
+        getaddrinfo=DEFAULT,
+        getnameinfo=DEFAULT,
+    ) as mocks:
+        yield mocks
 
-            mock_addrs.return_value = {"eth0": [mock_addr_ipv4, mock_addr_mac]}
 
-            # Mock interfész státusz
-            mock_stat = MagicMock()
-            mock_stat.isup = True
-            mock_stat.speed = 1000
-            mock_stat.mtu = 1500
-            mock_stats.return_value = {"eth0": mock_stat}
+@pytest.fixture
+def mock_psutil_interfaces(patched_psutil):
+    """Mock psutil interfész lekérdezéshez."""
+    mock_addrs = patched_psutil["net_if_addrs"]
+    mock_stats = patched_psutil["net_if_stats"]
 
-            yield mock_addrs
+    # Mock interfész címek (17 = AF_LINK)
+    mock_addrs.return_value = {
+        "eth0": [
+            Addr(socket.AF_INET, "192.168.1.100", "255.255.255.0"),
+            Addr(17, "00:11:22:33:44:55", None),
+        ]
+    }
+
+    # Mock interfész státusz
+    mock_stats.return_value = {"eth0": Stat(isup=True, speed=1000, mtu=1500)}
+
+    yield mock_addrs
 
 
 @pytest.fixture
-def mock_psutil_interfaces_with_lo():
+def mock_psutil_interfaces_with_lo(patched_psutil):
     """Mock psutil interfész lekérdezéshez loopback-kel."""
-    with patch("network_health_checker.network_tools.network_info.psutil.net_if_addrs") as mock_addrs:
-        with patch("network_health_checker.network_tools.network_info.psutil.net_if_stats") as mock_stats:
-            mock_addr_eth = MagicMock()
-            mock_addr_eth.family = socket.AF_INET
-            mock_addr_eth.address = "192.168.1.100"
-            mock_addr_eth.netmask = "255.255.255.0"
-
-            mock_addr_lo = MagicMock()
-            mock_addr_lo.family = socket.AF_INET
-            mock_addr_lo.address = "127.0.0.1"
-            mock_addr_lo.netmask = "255.0.0.0"
-
-            mock_addrs.return_value = {
-                "eth0": [mock_addr_eth],
-                "lo": [mock_addr_lo],
-            }
-
-            mock_stat = MagicMock()
-            mock_stat.isup = True
-            mock_stat.speed = 1000
-            mock_stat.mtu = 1500
-            mock_stats.return_value = {
-                "eth0": mock_stat,
-                "lo": mock_stat,
-            }
-
-            yield mock_addrs
+    mock_addrs = patched_psutil["net_if_addrs"]
+    mock_stats = patched_psutil["net_if_stats"]
+
+    mock_addrs.return_value = {
+        "eth0": [Addr(socket.AF_INET, "192.168.1.100", "255.255.255.0")],
+        "lo": [Addr(socket.AF_INET, "127.0.0.1", "255.0.0.0")],
+    }
+
+    mock_stat = Stat(isup=True, speed=1000, mtu=1500)
+    mock_stats.return_value = {
+        "eth0": mock_stat,
+        "lo": mock_stat,
+    }
+
+    yield mock_addrs
 
 
 @pytest.fixture
-def mock_psutil_connections():
-    """Mock psutil kapcsolat lekérdezéshez."""
-    with patch("network_health_checker.network_tools.network_info.psutil.net_connections") as mock_conn:
-        with patch("network_health_checker.network_tools.network_info.psutil.Process"):
-            # Mock kapcsolatok
-            conn_listen = MagicMock()
-            conn_listen.type = socket.SOCK_STREAM
-            conn_listen.laddr = MagicMock(ip="0.0.0.0", port=80)
-            conn_listen.raddr = None
-            conn_listen.status = "LISTEN"
-            conn_listen.pid = 1234
+def mock_psutil_interfaces_ipv6(patched_psutil):
+    """Mock psutil interfész lekérdezéshez IPv6 címekkel."""
+    mock_addrs = patched_psutil["net_if_addrs"]
+    mock_stats = patched_psutil["net_if_stats"]
+
+    mock_addrs.return_value = {
+        "eth0": [
+            Addr(socket.AF_INET6, address, None)
+            for address in ("2001:db8::1", "fe80::1%eth0", "febf::1")
+        ]
+    }
+    mock_stats.return_value = {}
+
+    yield mock_addrs
 
-            conn_established = MagicMock()
-            conn_established.type = socket.SOCK_STREAM
-            conn_established.laddr = MagicMock(ip="192.168.1.100", port=54321)
-            conn_established.raddr = MagicMock(ip="93.184.216.34", port=443)
-            conn_established.status = "ESTABLISHED"
-            conn_established.pid = 5678
 
-            mock_conn.return_value = [conn_listen, conn_established]
+@pytest.fixture
+def mock_psutil_connections(patched_psutil):
+    """Mock psutil kapcsolat lekérdezéshez."""
+    mock_conn = patched_psutil["net_connections"]
 
-            yield mock_conn
+    # Mock kapcsolatok
+    mock_conn.return_value = [
+        Conn(socket.SOCK_STREAM, LAddr("0.0.0.0", 80), None, "LISTEN", 1234),
+        Conn(
+            socket.SOCK_STREAM,
+            LAddr("192.168.1.100", 54321),
+            LAddr("93.184.216.34", 443),
+            "ESTABLISHED",
+            5678,
+        ),
+    ]
+
+    yield mock_conn
 
 
 @pytest.fixture
-def mock_psutil_io_counters():
+def mock_psutil_io_counters(patched_psutil):
     """Mock psutil I/O számláló lekérdezéshez."""
-    with patch("network_health_checker.network_tools.network_info.psutil.net_io_counters") as mock_io:
-        mock_counters = MagicMock()
-        mock_counters.bytes_sent = 1000000
-        mock_counters.bytes_recv = 2000000
-        mock_counters.packets_sent = 1000
-        mock_counters.packets_recv = 2000
-        mock_counters.errin = 0
-        mock_counters.errout = 0
-        mock_counters.dropin = 0
-        mock_counters.dropout = 0
+    mock_io = patched_psutil["net_io_counters"]
+
+    mock_counters = IoCounters(
+        bytes_sent=1000000,
+        bytes_recv=2000000,
+        packets_sent=1000,
+        packets_recv=2000,
+        errin=0,
+        errout=0,
+        dropin=0,
+        dropout=0,
+    )
 
-        def side_effect(pernic=False):
-            if pernic:
-                return {"eth0": mock_counters}
-            return mock_counters
+    def side_effect(pernic=False):
+        if pernic:
+            return {"eth0": mock_counters}
+        return mock_counters
 
-        mock_io.side_effect = side_effect
+    mock_io.side_effect = side_effect
 
-        yield mock_io
+    yield mock_io
 
 
 @pytest.fixture
-def mock_socket_hostname():
+def mock_socket_hostname(patched_socket):
     """Mock socket hostname-hez."""
-    with patch("network_health_checker.network_tools.network_info.socket.gethostname") as mock_hostname:
-        mock_hostname.return_value = "testhost"
-        yield mock_hostname
+    mock_hostname = patched_socket["gethostname"]
+    get_hostname.cache_clear()
+    mock_hostname.return_value = "testhost"
+    yield mock_hostname
+    get_hostname.cache_clear()
 
 
 @pytest.fixture
-def mock_socket_fqdn():
+def mock_socket_fqdn(patched_socket):
     """Mock socket FQDN-hez."""
-    with patch("network_health_checker.network_tools.network_info.socket.getfqdn") as mock_fqdn:
-        mock_fqdn.return_value = "testhost.example.com"
-        yield mock_fqdn
+    mock_fqdn = patched_socket["getfqdn"]
+    get_fqdn.cache_clear()
+    mock_fqdn.return_value = "testhost.example.com"
+    yield mock_fqdn
+    get_fqdn.cache_clear()
 
 
 @pytest.fixture
-def mock_socket_resolve():
+def mock_socket_resolve(patched_socket):
     """Mock socket hostname feloldáshoz."""
-    with patch("network_health_checker.network_tools.network_info.socket.gethostbyname") as mock_resolve:
-        mock_resolve.return_value = "93.184.216.34"
-        yield mock_resolve
+    mock_resolve = patched_socket["getaddrinfo"]
+    clear_dns_cache()
+    mock_resolve.return_value = [
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))
+    ]
+    yield mock_resolve
+    clear_dns_cache()
 
 
 @pytest.fixture
-def mock_socket_resolve_fail():
+def mock_socket_resolve_fail(patched_socket):
     """Mock sikertelen hostname feloldáshoz."""
-    with patch("network_health_checker.network_tools.network_info.socket.gethostbyname") as mock_resolve:
-        mock_resolve.side_effect = socket.gaierror(8, "Name not resolved")
-        yield mock_resolve
+    mock_resolve = patched_socket["getaddrinfo"]
+    clear_dns_cache()
+    mock_resolve.side_effect = socket.gaierror(8, "Name not resolved")
+    yield mock_resolve
+    clear_dns_cache()
 
 
 @pytest.fixture
-def mock_socket_reverse():
+def mock_socket_reverse(patched_socket):
     """Mock reverse DNS lookup-hoz."""
-    with patch("network_health_checker.network_tools.network_info.socket.gethostbyaddr") as mock_reverse:
-        mock_reverse.return_value = ("dns.google", [], ["8.8.8.8"])
-        yield mock_reverse
+    mock_reverse = patched_socket["getnameinfo"]
+    clear_dns_cache()
+    mock_reverse.return_value = ("dns.google", "0")
+    yield mock_reverse
+    clear_dns_cache()
 
 
 @pytest.fixture
-def mock_socket_reverse_fail():
+def mock_socket_reverse_fail(patched_socket):
     """Mock sikertelen reverse lookup-hoz."""
-    with patch("network_health_checker.network_tools.network_info.socket.gethostbyaddr") as mock_reverse:
-        mock_reverse.side_effect = socket.herror(1, "Host not found")
-        yield mock_reverse
+    mock_reverse = patched_socket["getnameinfo"]
+    clear_dns_cache()
+    mock_reverse.side_effect = socket.gaierror(8, "Name not resolved")
+    yield mock_reverse
+    clear_dns_cache()
@@ -4,38 +4,45 @@ Ping Monitor tesztek.
 Tesztek az ICMP ping funkciókhoz.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import asyncio
+import errno
+import socket
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Projekt gyökér hozzáadása a path-hoz
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from network_health_checker.models import HostStatus
-from network_health_checker.network_tools.ping_monitor import is_host_reachable, ping_host, ping_hosts
+from network_health_checker.network_tools.network_info import clear_dns_cache
+from network_health_checker.network_tools.ping_monitor import (
+    _ping_ip_async,
+    is_host_reachable,
+    ping_host,
+    ping_hosts,
+)
 
 
 class TestPingHost:
     """ping_host függvény tesztjei."""
 
-    def test_successful_ping(self, mock_ping_success, mock_socket_resolve):
-        """Sikeres ping válasz."""
-        result = ping_host("8.8.8.8", timeout=2.0, count=1)
-
-        assert result.host == "8.8.8.8"
-        assert result.status == HostStatus.UP
-        assert result.latency_ms is not None
-        assert result.latency_ms > 0
-        assert result.ip_address == "8.8.8.8"
-
-    def test_ping_timeout(self, mock_ping_timeout, mock_socket_resolve):
-        """Ping timeout esetén TIMEOUT státusz."""
-        result = ping_host("192.168.1.1", timeout=0.5, count=1)
+    @pytest.mark.parametrize(
+        "ping_scenario, host, count, expect_status, expect_latency",
+        [
+            ("success", "8.8.8.8", 1, HostStatus.UP, 15.5),  # sikeres ping
+            ("timeout", "192.168.1.1", 1, HostStatus.TIMEOUT, None),  # nincs válasz
+            ("variable", "8.8.8.8", 3, HostStatus.UP, 20.0),  # 10, 20, 30 ms átlaga
+        ],
+        indirect=["ping_scenario"],
+    )
+    def test_ping_outcome(
+        self, ping_scenario, mock_socket_resolve, host, count, expect_status, expect_latency
+    ):
+        """Ping státusz és átlagos latency a válaszok szerint."""
+        result = ping_host(host, timeout=1.0, count=count)
 
-        assert result.status == HostStatus.TIMEOUT
-        assert result.latency_ms is None
+        assert result.host == host
+        assert result.ip_address == host
+        assert result.status == expect_status
+        assert result.latency_ms == expect_latency
 
     def test_hostname_resolution_failure(self, mock_socket_resolve_fail):
         """Hostname feloldási hiba ERROR státuszt ad."""
@@ -44,14 +51,6 @@ class TestPingHost:
         assert result.status == HostStatus.ERROR
         assert "Could not resolve hostname" in result.error_message
 
-    def test_multiple_pings_average(self, mock_ping_variable, mock_socket_resolve):
-        """Több ping átlagolása."""
-        result = ping_host("8.8.8.8", count=3)
-
-        assert result.status == HostStatus.UP
-        # Az átlag 10, 20, 30 ms-ból = 20ms
-        assert result.latency_ms == 20.0
-
     def test_permission_error(self, mock_ping_permission, mock_socket_resolve):
         """Permission denied hiba kezelése."""
         result = ping_host("8.8.8.8")
@@ -59,17 +58,40 @@ class TestPingHost:
         assert result.status == HostStatus.ERROR
         assert "Permission denied" in result.error_message
 
+    def test_falls_back_to_ping3(self, mock_ping3_fallback, mock_socket_resolve):
+        """ICMP socket hiányában a ping3 fallback adja az eredményt."""
+        result = ping_host("8.8.8.8", count=2)
+
+        assert result.status == HostStatus.UP
+        assert result.latency_ms == 12.0
+        assert mock_ping3_fallback.call_count == 2
+
+    def test_no_route_returns_error(self, mock_icmp_socket_unreachable, mock_socket_resolve):
+        """Nem jogosultsági socket hiba (ENETUNREACH) ERROR státuszt ad."""
+        result = ping_host("10.255.255.1", count=2)
+
+        assert result.status == HostStatus.ERROR
+        assert "unreachable" in result.error_message
+        mock_icmp_socket_unreachable.close.assert_called_once()
+
     def test_result_has_timestamp(self, mock_ping_success, mock_socket_resolve):
         """Eredmény tartalmaz timestamp-et."""
         result = ping_host("8.8.8.8")
 
         assert result.timestamp is not None
 
+    def test_resolution_is_cached(self, mock_ping_success, mock_socket_resolve):
+        """Ismételt ping ugyanarra a hostra nem old fel újra."""
+        ping_host("example.com")
+        ping_host("example.com")
+
+        assert mock_socket_resolve.call_count == 1
+
 
 class TestPingHosts:
     """ping_hosts függvény tesztjei."""
 
-    def test_multiple_hosts_success(self, mock_ping_success, mock_socket_resolve):
+    def test_multiple_hosts_success(self, mock_icmp_success):
         """Több host pingelése sikeresen."""
         hosts = ["8.8.8.8", "1.1.1.1"]
         results = ping_hosts(hosts, timeout=1.0, max_workers=2)
@@ -86,13 +108,37 @@ class TestPingHosts:
 
         assert results == []
 
-    def test_mixed_results(
-        self, mock_ping_mixed, mock_socket_resolve, mock_socket_resolve_mixed
-    ):
+    def test_mixed_results(self, mock_icmp_mixed):
         """Vegyes eredmények (UP és TIMEOUT)."""
-        # Ezt nehéz mockkolni ProcessPoolExecutor miatt
-        # Egyszerűsített teszt
-        pass
+        results = ping_hosts(["8.8.8.8", "192.168.1.1"], timeout=1.0)
+
+        # Az eredmények a bemenet sorrendjében jönnek
+        assert [r.host for r in results] == ["8.8.8.8", "192.168.1.1"]
+        assert results[0].status == HostStatus.UP
+        assert results[0].latency_ms == 10.0
+        assert results[1].status == HostStatus.TIMEOUT
+
+    def test_resolution_uses_shared_cache(self, mock_icmp_success, mock_socket_resolve):
+        """Az aszinkron út is a közös névfeloldási cache-t használja."""
+        ping_hosts(["example.com"])
+        ping_hosts(["example.com"])
+
+        assert mock_socket_resolve.call_count == 1
+
+    def test_no_route_matches_sync_path(self, mock_icmp_socket_unreachable):
+        """ENETUNREACH az aszinkron úton is hibaüzenetként jön vissza."""
+        latencies, last_error = asyncio.run(_ping_ip_async("10.255.255.1", 1.0, 2))
+
+        assert latencies == []
+        assert "unreachable" in last_error
+        mock_icmp_socket_unreachable.close.assert_called_once()
+
+    def test_permission_error(self, mock_icmp_permission):
+        """ICMP socket jogosultság hiánya ERROR státuszt ad."""
+        results = ping_hosts(["8.8.8.8"])
+
+        assert results[0].status == HostStatus.ERROR
+        assert "Permission denied" in results[0].error_message
 
 
 class TestIsHostReachable:
@@ -118,77 +164,148 @@ class TestIsHostReachable:
 # =============================================================================
 
 
+_PING_MONITOR = "network_health_checker.network_tools.ping_monitor"
+
+
+def _resolve_unchanged(host, *args, **kwargs):
+    """getaddrinfo mock: az IP-t változatlanul adja vissza."""
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (host, 0))]
+
+
 @pytest.fixture
-def mock_ping_success():
-    """Mock sikeres ping válaszhoz."""
-    with patch("network_health_checker.network_tools.ping_monitor.ping") as mock_ping:
-        # Visszaad egy latency értéket ms-ban
-        mock_ping.return_value = 15.5
+def mock_icmp_socket_unreachable():
+    """ICMP socket, amelynek connect()-je ENETUNREACH hibát ad."""
+    sock = MagicMock()
+    sock.connect.side_effect = OSError(errno.ENETUNREACH, "Network is unreachable")
+    with patch(f"{_PING_MONITOR}._open_icmp_socket", return_value=(sock, False)):
+        yield sock
+
+
+@pytest.fixture
+def patched_ping_ip():
+    """A szinkron _ping_ip patch-elése (csak az azt kérő tesztekben)."""
+    with patch(f"{_PING_MONITOR}._ping_ip") as mock_ping:
         yield mock_ping
 
 
 @pytest.fixture
-def mock_ping_timeout():
+def patched_ping_ip_async():
+    """Az aszinkron _ping_ip_async patch-elése (csak az azt kérő tesztekben)."""
+    with patch(f"{_PING_MONITOR}._ping_ip_async", new_callable=AsyncMock) as mock_icmp:
+        yield mock_icmp
+
+
+@pytest.fixture
+def patched_getaddrinfo():
+    """
+    A hostname feloldás patch-elése.
+
+    Alapállapotban az IP-t változatlanul adja vissza (IP literálokra ez
+    megegyezik a valódi feloldással).
+    """
+    with patch(
+        f"{_PING_MONITOR}.socket.getaddrinfo", side_effect=_resolve_unchanged
+    ) as mock_resolve:
+        yield mock_resolve
+
+
+@pytest.fixture
+def ping_scenario(request):
+    """
+    Ping viselkedés kiválasztása név szerint (indirekt parametrizáláshoz).
+
+    A paraméter ("success", "timeout", "variable", "permission") a megfelelő
+    mock_ping_* fixture-t aktiválja, és annak mock-ját adja vissza.
+    """
+    return request.getfixturevalue(f"mock_ping_{request.param}")
+
+
+@pytest.fixture
+def mock_ping_success(patched_ping_ip):
+    """Mock sikeres ping válaszhoz."""
+    # Visszaad egy latency értéket ms-ban
+    patched_ping_ip.return_value = ([15.5], None)
+    yield patched_ping_ip
+
+
+@pytest.fixture
+def mock_ping_timeout(patched_ping_ip):
     """Mock ping timeout-hoz."""
-    with patch("network_health_checker.network_tools.ping_monitor.ping") as mock_ping:
-        # None = timeout a ping3-ban
-        mock_ping.return_value = None
-        yield mock_ping
+    # Nincs válasz, nincs hiba = timeout
+    patched_ping_ip.return_value = ([], None)
+    yield patched_ping_ip
 
 
 @pytest.fixture
-def mock_ping_variable():
+def mock_ping_variable(patched_ping_ip):
     """Mock változó latency értékekkel."""
-    with patch("network_health_checker.network_tools.ping_monitor.ping") as mock_ping:
-        # Különböző latency értékek visszaadása
-        mock_ping.side_effect = [10.0, 20.0, 30.0]
-        yield mock_ping
+    # Különböző latency értékek visszaadása
+    patched_ping_ip.return_value = ([10.0, 20.0, 30.0], None)
+    yield patched_ping_ip
 
 
 @pytest.fixture
-def mock_ping_permission():
-    """Mock permission error-hoz."""
-    with patch("network_health_checker.network_tools.ping_monitor.ping") as mock_ping:
-        mock_ping.side_effect = PermissionError("Permission denied")
-        yield mock_ping
+def mock_ping_permission(patched_ping_ip, monkeypatch):
+    """Mock permission error-hoz (a ping3 fallback is elbukik)."""
 
+    def ping_denied(*args, **kwargs):
+        raise PermissionError("Permission denied")
 
-@pytest.fixture
-def mock_ping_mixed():
-    """Mock vegyes eredményekhez."""
-    with patch("network_health_checker.network_tools.ping_monitor.ping") as mock_ping:
+    patched_ping_ip.side_effect = PermissionError("Permission denied")
+    # A ping3 fallback egyszerű csere, MagicMock nélkül
+    monkeypatch.setattr(f"{_PING_MONITOR}.ping", ping_denied)
+    yield patched_ping_ip
 
-        def side_effect(host, **kwargs):
-            if host == "8.8.8.8":
-                return 10.0
-            return None  # timeout
 
-        mock_ping.side_effect = side_effect
+@pytest.fixture
+def mock_ping3_fallback(patched_ping_ip):
+    """Mock: ICMP socket nem nyitható, a ping3 fallback válaszol."""
+    patched_ping_ip.side_effect = PermissionError("Permission denied")
+    with patch(f"{_PING_MONITOR}.ping") as mock_ping:
+        # ping3: None = timeout
+        mock_ping.side_effect = [12.0, None]
         yield mock_ping
 
 
 @pytest.fixture
-def mock_socket_resolve():
-    """Mock hostname feloldáshoz."""
-    with patch("network_health_checker.network_tools.ping_monitor.socket.gethostbyname") as mock_resolve:
-        # Az IP-t változatlanul adja vissza
-        mock_resolve.side_effect = lambda x: x
-        yield mock_resolve
+def mock_icmp_success(patched_ping_ip_async):
+    """Mock sikeres aszinkron ICMP válaszhoz."""
+    patched_ping_ip_async.return_value = ([15.5], None)
+    yield patched_ping_ip_async
 
 
 @pytest.fixture
-def mock_socket_resolve_fail():
-    """Mock sikertelen hostname feloldáshoz."""
-    import socket
+def mock_icmp_mixed(patched_ping_ip_async):
+    """Mock vegyes aszinkron ICMP eredményekhez."""
 
-    with patch("network_health_checker.network_tools.ping_monitor.socket.gethostbyname") as mock_resolve:
-        mock_resolve.side_effect = socket.gaierror(8, "Name or service not known")
-        yield mock_resolve
+    def side_effect(ip_address, timeout, count):
+        if ip_address == "8.8.8.8":
+            return [10.0], None
+        return [], None  # timeout
+
+    patched_ping_ip_async.side_effect = side_effect
+    yield patched_ping_ip_async
 
 
 @pytest.fixture
-def mock_socket_resolve_mixed():
-    """Mock vegyes hostname feloldáshoz."""
-    with patch("network_health_checker.network_tools.ping_monitor.socket.gethostbyname") as mock_resolve:
-        mock_resolve.side_effect = lambda x: x
-        yield mock_resolve
+def mock_icmp_permission(patched_ping_ip_async):
+    """Mock ICMP socket permission error-hoz."""
+    patched_ping_ip_async.side_effect = PermissionError("Permission denied")
+    yield patched_ping_ip_async
+
+
+@pytest.fixture
+def mock_socket_resolve(patched_getaddrinfo):
+    """Mock hostname feloldáshoz."""
+    clear_dns_cache()
+    yield patched_getaddrinfo
+    clear_dns_cache()
+
+
+@pytest.fixture
+def mock_socket_resolve_fail(patched_getaddrinfo):
+    """Mock sikertelen hostname feloldáshoz."""
+    clear_dns_cache()
+    patched_getaddrinfo.side_effect = socket.gaierror(8, "Name or service not known")
+    yield patched_getaddrinfo
+    clear_dns_cache()
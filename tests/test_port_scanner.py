@@ -4,42 +4,49 @@ Port Scanner tesztek.
 Tesztek a TCP port szkennelési funkciókhoz.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import socket
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-# Projekt gyökér hozzáadása a path-hoz
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from network_health_checker.network_tools.network_info import clear_dns_cache
 from network_health_checker.network_tools.port_scanner import (
+    _COMMON_SCAN_PORTS,
+    _host_responds,
+    _nonblocking_socket,
     _parse_ports,
     scan_common_ports,
     scan_port,
     scan_ports,
+    scan_ports_selector,
 )
 
 
 class TestScanPort:
     """scan_port függvény tesztjei."""
 
-    def test_open_port(self, mock_socket_open):
-        """Nyitott port detektálása."""
-        result = scan_port("192.168.1.1", 80, timeout=1.0)
-
-        assert result.host == "192.168.1.1"
-        assert result.port == 80
-        assert result.is_open is True
-        assert result.service_name == "http"
-        assert result.latency_ms is not None
-
-    def test_closed_port(self, mock_socket_closed):
-        """Zárt port detektálása."""
-        result = scan_port("192.168.1.1", 8888, timeout=1.0)
-
-        assert result.is_open is False
-        assert result.latency_ms is None
+    @pytest.mark.parametrize(
+        "socket_scenario, host, port, expect_open, expect_service",
+        [
+            ("open", "192.168.1.1", 80, True, "http"),  # nyitott port
+            ("open", "192.168.1.1", 443, True, "https"),  # ismert szolgáltatás
+            ("open", "192.168.1.1", 54321, True, None),  # ismeretlen szolgáltatás
+            ("closed", "192.168.1.1", 8888, False, None),  # zárt port
+            ("timeout", "192.168.1.1", 12345, False, None),  # timeout = zárt
+            ("gaierror", "invalid.host", 80, False, "http"),  # feloldási hiba
+        ],
+        indirect=["socket_scenario"],
+    )
+    def test_scan_outcome(self, socket_scenario, host, port, expect_open, expect_service):
+        """Port állapot és szolgáltatás név a socket viselkedése szerint."""
+        result = scan_port(host, port, timeout=1.0)
+
+        assert result.host == host
+        assert result.port == port
+        assert result.is_open is expect_open
+        assert result.service_name == expect_service
+        # Latency csak nyitott portnál van
+        assert (result.latency_ms is not None) is expect_open
 
     def test_port_with_banner(self, mock_socket_with_banner):
         """Banner információ lekérése."""
@@ -48,130 +55,225 @@ class TestScanPort:
         assert result.is_open is True
         assert result.banner == "SSH-2.0-OpenSSH_8.0"
 
-    def test_timeout_handling(self, mock_socket_timeout):
-        """Timeout kezelése zárt portként."""
-        result = scan_port("192.168.1.1", 12345, timeout=0.5)
+    def test_fragmented_banner(self, mock_socket_with_banner):
+        """Több szegmensben érkező banner összefűzése."""
+        mock_sock = mock_socket_with_banner.return_value
+        mock_sock.recv.side_effect = [b"SSH-2.0-", b"OpenSSH_9.6\r\n", b"ignored"]
 
-        assert result.is_open is False
+        result = scan_port("192.168.1.1", 22, timeout=1.0, grab_banner=True)
 
-    def test_hostname_resolution_error(self, mock_socket_gaierror):
-        """Hostname feloldási hiba kezelése."""
-        result = scan_port("invalid.host", 80)
+        assert result.banner == "SSH-2.0-OpenSSH_9.6"
+        assert mock_sock.recv.call_count == 2
 
-        assert result.is_open is False
+    def test_banner_socket_tuning(self, mock_socket_with_banner):
+        """Banner olvasásnál TCP_NODELAY és nagyobb pufferek, hiba esetén is fut."""
+        mock_sock = mock_socket_with_banner.return_value
+        mock_sock.setsockopt.side_effect = [None, OSError("not supported"), None]
 
-    def test_known_service_name(self, mock_socket_open):
-        """Ismert port szolgáltatás neve."""
-        result = scan_port("192.168.1.1", 443)
+        result = scan_port("192.168.1.1", 22, timeout=1.0, grab_banner=True)
 
-        assert result.service_name == "https"
+        assert result.banner == "SSH-2.0-OpenSSH_8.0"
+        mock_sock.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        assert mock_sock.setsockopt.call_count == 3
 
-    def test_unknown_service_name(self, mock_socket_open):
-        """Ismeretlen port esetén None szolgáltatás."""
-        result = scan_port("192.168.1.1", 54321)
+    def test_plain_scan_keeps_default_socket(self, mock_socket_open):
+        """Banner nélkül a socket opciók változatlanok."""
+        scan_port("192.168.1.1", 80, timeout=1.0)
 
-        assert result.service_name is None
+        mock_socket_open.return_value.setsockopt.assert_not_called()
 
 
 class TestScanPorts:
     """scan_ports függvény tesztjei."""
 
-    def test_multiple_ports_list(self, mock_socket_mixed):
-        """Több port szkennelése listából."""
-        results = scan_ports("192.168.1.1", [22, 80, 443], timeout=1.0)
-
-        assert len(results) == 3
-        # Eredmények port szám szerint rendezve
-        assert results[0].port <= results[1].port <= results[2].port
-
-    def test_port_string_format(self, mock_socket_mixed):
-        """Port string formátum feldolgozása."""
-        results = scan_ports("192.168.1.1", "22,80,443")
-
-        assert len(results) == 3
-
-    def test_port_range_string(self, mock_socket_mixed):
-        """Port tartomány string feldolgozása."""
-        results = scan_ports("192.168.1.1", "20-22")
-
-        assert len(results) == 3
-        ports = [r.port for r in results]
-        assert 20 in ports
-        assert 21 in ports
-        assert 22 in ports
-
-    def test_mixed_port_string(self, mock_socket_mixed):
-        """Vegyes port string (egyedi + tartomány)."""
-        results = scan_ports("192.168.1.1", "22,80-82,443")
-
-        assert len(results) == 5
-
-    def test_returns_sorted_results(self, mock_socket_mixed):
-        """Eredmények port szám szerint rendezettek."""
-        results = scan_ports("192.168.1.1", "443,22,80")
-
-        ports = [r.port for r in results]
-        assert ports == sorted(ports)
+    @pytest.mark.parametrize(
+        "ports, expected_ports",
+        [
+            ([22, 80, 443], [22, 80, 443]),  # port lista
+            ("22,80,443", [22, 80, 443]),  # port string
+            ("20-22", [20, 21, 22]),  # tartomány string
+            ("22,80-82,443", [22, 80, 81, 82, 443]),  # egyedi + tartomány
+            ("443,22,80", [22, 80, 443]),  # rendezett eredmény
+        ],
+    )
+    def test_port_spec_formats(self, mock_connection_mixed, ports, expected_ports):
+        """Port lista és string formátumok, port szám szerint rendezve."""
+        results = scan_ports("192.168.1.1", ports, timeout=1.0)
+
+        assert [r.port for r in results] == expected_ports
+
+    def test_detects_open_ports(self, mock_connection_mixed):
+        """Nyitott és zárt portok megkülönböztetése."""
+        results = scan_ports("192.168.1.1", "21-23,80,443")
+
+        open_ports = [r.port for r in results if r.is_open]
+        assert open_ports == [22, 80, 443]
+        assert all(r.latency_ms is not None for r in results if r.is_open)
+
+    def test_max_workers_bounds_concurrency(self, mock_connection_mixed):
+        """Legfeljebb max_workers kapcsolódás fut egyszerre, sorrendtartással."""
+        import asyncio
+
+        running = 0
+        peak = 0
+        open_connection = mock_connection_mixed.side_effect
+
+        async def slow_open_connection(host, port):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await open_connection(host, port)
+
+        mock_connection_mixed.side_effect = slow_open_connection
+        results = scan_ports("192.168.1.1", "20-29", max_workers=3)
+
+        assert [r.port for r in results] == list(range(20, 30))
+        assert peak == 3
+
+    def test_dead_host_short_circuits(self, mock_host_responds, mock_connection_mixed):
+        """Nem válaszoló host esetén nincs portonkénti kapcsolódás."""
+        mock_host_responds.return_value = False
+        results = scan_ports("192.168.1.1", "1-200", timeout=1.0, preflight=True)
+
+        assert len(results) == 200
+        assert not any(r.is_open for r in results)
+        assert results[21].service_name == "ssh"
+        mock_host_responds.assert_called_once_with("192.168.1.1", 1.0)
+        mock_connection_mixed.assert_not_called()
+
+    def test_preflight_off_by_default(self, mock_host_responds, mock_connection_mixed):
+        """Alapból nincs előzetes próba, minden port ténylegesen próbálva van."""
+        mock_host_responds.return_value = False
+        scan_ports("192.168.1.1", "1-200", timeout=1.0)
+
+        mock_host_responds.assert_not_called()
+        assert mock_connection_mixed.call_count == 200
+
+    def test_small_scan_skips_preflight(self, mock_host_responds, mock_connection_mixed):
+        """Kevés port esetén nincs előzetes elérhetőségi próba."""
+        scan_ports("192.168.1.1", [22, 80, 443], preflight=True)
+
+        mock_host_responds.assert_not_called()
+
+    def test_preflight_detects_refused_connection(self):
+        """A loopback RST-vel válaszol, tehát elérhető."""
+        assert _host_responds("127.0.0.1", 0.5) is True
+
+    def test_unresolvable_host(self, mock_resolve_fail, mock_connection_mixed):
+        """Feloldhatatlan host esetén minden port zárt, kapcsolódás nélkül."""
+        results = scan_ports("invalid.host", [443, 22, 80])
+
+        assert [r.port for r in results] == [22, 80, 443]
+        assert all(not r.is_open for r in results)
+        assert all(r.host == "invalid.host" for r in results)
+        assert [r.service_name for r in results] == ["ssh", "http", "https"]
+        mock_connection_mixed.assert_not_called()
+
+
+class TestScanPortsSelector:
+    """scan_ports_selector függvény tesztjei (valós loopback socketekkel)."""
+
+    def test_detects_listening_port(self, loopback_listener):
+        """Figyelő port nyitott, a mellette lévő zárt."""
+        listen_port, closed_port = loopback_listener
+        results = scan_ports_selector("127.0.0.1", [closed_port, listen_port], timeout=1.0)
+
+        assert [r.port for r in results] == sorted([closed_port, listen_port])
+        by_port = {r.port: r for r in results}
+        assert by_port[listen_port].is_open is True
+        assert by_port[listen_port].latency_ms is not None
+        assert by_port[closed_port].is_open is False
+
+    def test_in_flight_limit(self, loopback_listener):
+        """Kis max_in_flight mellett is minden port eredményt kap."""
+        listen_port, _ = loopback_listener
+        ports = list(range(listen_port - 5, listen_port + 5))
+        results = scan_ports_selector("127.0.0.1", ports, timeout=1.0, max_in_flight=2)
+
+        assert len(results) == len(ports)
+        assert any(r.port == listen_port and r.is_open for r in results)
+
+    def test_scan_ports_dispatches_large_sweeps(self, mock_host_responds):
+        """Nagy, banner nélküli szkennelés a selector utat használja."""
+        with patch(
+            "network_health_checker.network_tools.port_scanner.scan_ports_selector",
+            return_value=[],
+        ) as mock_selector:
+            scan_ports("192.168.1.1", "1-5000", timeout=0.5)
+
+        mock_selector.assert_called_once()
+
+    def test_sockets_are_nonblocking(self):
+        """A szkenner socketjei nem-blokkoló módban jönnek létre."""
+        sock = _nonblocking_socket()
+        try:
+            assert sock.getblocking() is False
+        finally:
+            sock.close()
 
 
 class TestParsePorts:
     """_parse_ports belső függvény tesztjei."""
 
-    def test_single_port(self):
-        """Egyetlen port feldolgozása."""
-        ports = _parse_ports("80")
-        assert ports == [80]
-
-    def test_multiple_ports(self):
-        """Több port feldolgozása."""
-        ports = _parse_ports("22,80,443")
-        assert ports == [22, 80, 443]
-
-    def test_port_range(self):
-        """Port tartomány feldolgozása."""
-        ports = _parse_ports("20-25")
-        assert ports == [20, 21, 22, 23, 24, 25]
-
-    def test_mixed_format(self):
-        """Vegyes formátum feldolgozása."""
-        ports = _parse_ports("22,80-82,443")
-        assert ports == [22, 80, 81, 82, 443]
-
-    def test_removes_duplicates(self):
-        """Duplikátumok eltávolítása."""
-        ports = _parse_ports("22,22,80")
-        assert ports == [22, 80]
-
-    def test_returns_sorted(self):
-        """Rendezett lista visszaadása."""
-        ports = _parse_ports("443,22,80")
-        assert ports == [22, 80, 443]
-
-    def test_with_spaces(self):
-        """Szóközök kezelése."""
-        ports = _parse_ports("22, 80, 443")
-        assert ports == [22, 80, 443]
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            ("80", [80]),  # egyetlen port
+            ("22,80,443", [22, 80, 443]),  # több port
+            ("20-25", [20, 21, 22, 23, 24, 25]),  # tartomány
+            ("22,80-82,443", [22, 80, 81, 82, 443]),  # vegyes formátum
+            ("22,22,80", [22, 80]),  # duplikátumok eltávolítása
+            ("443,22,80", [22, 80, 443]),  # rendezett eredmény
+            ("22, 80, 443", [22, 80, 443]),  # szóközök kezelése
+        ],
+    )
+    def test_parses_spec(self, spec, expected):
+        """Port specifikációk feldolgozása."""
+        assert _parse_ports(spec) == expected
+
+    def test_wide_overlapping_ranges(self):
+        """Széles, átfedő tartományok összevonása (rendezett intervallumok)."""
+        ports = _parse_ports("1500-3000,1-2000,5,2999-3001")
+        assert ports == list(range(1, 3002))
+
+    def test_full_port_range(self):
+        """Teljes port tartomány."""
+        ports = _parse_ports("1-65535")
+        assert len(ports) == 65535
+        assert ports[0] == 1
+        assert ports[-1] == 65535
+
+    def test_repeated_spec_is_cached(self):
+        """Ismételt specifikáció a cache-ből jön, a hívó mégis saját listát kap."""
+        from network_health_checker.network_tools.port_scanner import _parse_port_spec
+
+        _parse_port_spec.cache_clear()
+        first = _parse_ports("22,80-82")
+        first.append(9999)
+        second = _parse_ports("22,80-82")
+
+        assert second == [22, 80, 81, 82]
+        assert _parse_port_spec.cache_info().hits == 1
 
 
 class TestScanCommonPorts:
     """scan_common_ports függvény tesztjei."""
 
-    def test_scans_predefined_ports(self, mock_socket_mixed):
+    def test_scans_predefined_ports(self, mock_connection_mixed):
         """Előre definiált portok szkennelése."""
         results = scan_common_ports("192.168.1.1", timeout=1.0)
 
-        # Tartalmazza a gyakori portokat
-        ports = [r.port for r in results]
-        assert 22 in ports  # SSH
-        assert 80 in ports  # HTTP
-        assert 443 in ports  # HTTPS
+        # Tartalmazza a gyakori portokat (SSH, HTTP, HTTPS)
+        assert {22, 80, 443} <= {r.port for r in results}
 
-    def test_returns_correct_count(self, mock_socket_mixed):
+    def test_returns_correct_count(self, mock_connection_mixed):
         """Helyes számú eredmény."""
         results = scan_common_ports("192.168.1.1")
 
-        # A COMMON_PORTS listában 17 port van
-        assert len(results) == 17
+        # Minden előre definiált porthoz pontosan egy eredmény
+        assert [r.port for r in results] == list(_COMMON_SCAN_PORTS)
 
 
 # =============================================================================
@@ -179,77 +281,156 @@ class TestScanCommonPorts:
 # =============================================================================
 
 
+_SOCKET_CLASS = "network_health_checker.network_tools.port_scanner.socket.socket"
+
+# Előre létrehozott kivételpéldányok; a fixture-ök side_effect-ként újrahasznosítják
+_GAI_ERROR = socket.gaierror(8, "Name not resolved")
+_TIMEOUT_ERROR = socket.timeout()
+
+
+@pytest.fixture(scope="session")
+def make_socket_mock():
+    """
+    Közös factory a scan_port socket mock-jaihoz.
+
+    A factory egyszer készül el; tesztenként csak a patch és egy friss
+    socket mock jön létre (a tesztek módosíthatják a saját példányukat).
+    A Mock(spec_set=socket.socket) nem készít dunder metódusokat, és
+    hibát ad, ha a kód nem létező socket API-t használna.
+    """
+    # A valódi osztály már itt rögzül (a hívás pillanatában lehet patch-elve)
+    socket_class = socket.socket
+
+    def make(connect_ex=0, recv=None):
+        mock_sock = Mock(spec_set=socket_class)
+        if isinstance(connect_ex, BaseException):
+            mock_sock.connect_ex.side_effect = connect_ex
+        else:
+            mock_sock.connect_ex.return_value = connect_ex
+        if recv is not None:
+            mock_sock.recv.return_value = recv
+        return mock_sock
+
+    return make
+
+
 @pytest.fixture
-def mock_socket_open():
+def mock_socket_open(make_socket_mock):
     """Mock nyitott porthoz."""
-    with patch("network_health_checker.network_tools.port_scanner.socket.socket") as mock_socket_class:
-        mock_sock = MagicMock()
-        mock_socket_class.return_value = mock_sock
-        # connect_ex visszatér 0-val (success)
-        mock_sock.connect_ex.return_value = 0
+    # connect_ex visszatér 0-val (success)
+    with patch(_SOCKET_CLASS, return_value=make_socket_mock(connect_ex=0)) as mock_socket_class:
         yield mock_socket_class
 
 
 @pytest.fixture
-def mock_socket_closed():
+def socket_scenario(request):
+    """
+    Socket viselkedés kiválasztása név szerint (indirekt parametrizáláshoz).
+
+    A paraméter ("open", "closed", "timeout", "gaierror") a megfelelő
+    mock_socket_* fixture-t aktiválja, és annak mock-ját adja vissza.
+    """
+    return request.getfixturevalue(f"mock_socket_{request.param}")
+
+
+@pytest.fixture
+def mock_socket_closed(make_socket_mock):
     """Mock zárt porthoz."""
-    with patch("network_health_checker.network_tools.port_scanner.socket.socket") as mock_socket_class:
-        mock_sock = MagicMock()
-        mock_socket_class.return_value = mock_sock
-        # connect_ex visszatér nem 0-val (connection refused)
-        mock_sock.connect_ex.return_value = 111  # ECONNREFUSED
+    # connect_ex visszatér nem 0-val (111 = ECONNREFUSED)
+    with patch(_SOCKET_CLASS, return_value=make_socket_mock(connect_ex=111)) as mock_socket_class:
         yield mock_socket_class
 
 
 @pytest.fixture
-def mock_socket_with_banner():
+def mock_socket_with_banner(make_socket_mock):
     """Mock banner-es porthoz."""
-    with patch("network_health_checker.network_tools.port_scanner.socket.socket") as mock_socket_class:
-        mock_sock = MagicMock()
-        mock_socket_class.return_value = mock_sock
-        mock_sock.connect_ex.return_value = 0
-        # Banner válasz
-        mock_sock.recv.return_value = b"SSH-2.0-OpenSSH_8.0\r\n"
+    mock_sock = make_socket_mock(connect_ex=0, recv=b"SSH-2.0-OpenSSH_8.0\r\n")
+    with patch(_SOCKET_CLASS, return_value=mock_sock) as mock_socket_class:
         yield mock_socket_class
 
 
 @pytest.fixture
-def mock_socket_timeout():
+def mock_socket_timeout(make_socket_mock):
     """Mock timeout-hoz."""
-    import socket
-
-    with patch("network_health_checker.network_tools.port_scanner.socket.socket") as mock_socket_class:
-        mock_sock = MagicMock()
-        mock_socket_class.return_value = mock_sock
-        mock_sock.connect_ex.side_effect = socket.timeout()
+    mock_sock = make_socket_mock(connect_ex=_TIMEOUT_ERROR)
+    with patch(_SOCKET_CLASS, return_value=mock_sock) as mock_socket_class:
         yield mock_socket_class
 
 
 @pytest.fixture
-def mock_socket_gaierror():
+def mock_socket_gaierror(make_socket_mock):
     """Mock hostname feloldási hibához."""
-    import socket
-
-    with patch("network_health_checker.network_tools.port_scanner.socket.socket") as mock_socket_class:
-        mock_sock = MagicMock()
+    clear_dns_cache()
+    # Egy patch.multiple hívás a socket modul mindkét attribútumára
+    with patch.multiple(
+        "network_health_checker.network_tools.port_scanner.socket",
+        socket=DEFAULT,
+        getaddrinfo=DEFAULT,
+    ) as mocks:
+        mock_socket_class = mocks["socket"]
+        mock_sock = make_socket_mock()
         mock_socket_class.return_value = mock_sock
-        mock_sock.connect_ex.side_effect = socket.gaierror(8, "Name not resolved")
+        mocks["getaddrinfo"].side_effect = _GAI_ERROR
         yield mock_socket_class
+        # A feloldás hibája miatt kapcsolódás nem is történik
+        mock_sock.connect_ex.assert_not_called()
+
+
+# A mock_connection_mixed szerint nyitott portok; minden más port zárt
+_OPEN_PORTS = frozenset({22, 80, 443})
+
+
+async def _open_connection_mixed(host, port):
+    """asyncio.open_connection helyettesítő: csak az _OPEN_PORTS portjai nyitottak."""
+    if port not in _OPEN_PORTS:
+        raise ConnectionRefusedError(111, "Connection refused")
+    writer = MagicMock()
+    writer.wait_closed = AsyncMock()
+    return MagicMock(), writer
 
 
 @pytest.fixture
-def mock_socket_mixed():
-    """Mock vegyes eredményekhez (nyitott és zárt portok)."""
-    with patch("network_health_checker.network_tools.port_scanner.socket.socket") as mock_socket_class:
-        mock_sock = MagicMock()
-        mock_socket_class.return_value = mock_sock
+def mock_connection_mixed():
+    """Mock vegyes eredményekhez (nyitott és zárt portok) az async szkennerhez."""
+    with patch(
+        "network_health_checker.network_tools.port_scanner.asyncio.open_connection",
+        side_effect=_open_connection_mixed,
+    ) as mock_open:
+        yield mock_open
 
-        # Bizonyos portok nyitottak, mások zártak
-        open_ports = {22, 80, 443}
 
-        def connect_ex_side_effect(address):
-            host, port = address
-            return 0 if port in open_ports else 111
+@pytest.fixture
+def loopback_listener():
+    """Valós figyelő socket a loopback-en, és egy (valószínűleg) zárt port."""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(16)
 
-        mock_sock.connect_ex.side_effect = connect_ex_side_effect
-        yield mock_socket_class
+    # Egy lefoglalt, de nem figyelő port zártnak számít
+    unused = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    unused.bind(("127.0.0.1", 0))
+
+    yield listener.getsockname()[1], unused.getsockname()[1]
+
+    unused.close()
+    listener.close()
+
+
+@pytest.fixture
+def mock_host_responds():
+    """Mock a szkennelés előtti elérhetőségi próbához."""
+    with patch(
+        "network_health_checker.network_tools.port_scanner._host_responds",
+        return_value=True,
+    ) as mock_probe:
+        yield mock_probe
+
+
+@pytest.fixture
+def mock_resolve_fail(monkeypatch):
+    """Mock sikertelen hostname feloldáshoz a szkenner szintjén."""
+    def resolve_fail(host):
+        raise _GAI_ERROR
+
+    # Egyszerű csere, MagicMock nélkül
+    monkeypatch.setattr("network_health_checker.network_tools.port_scanner._resolve", resolve_fail)
@@ -5,49 +5,45 @@ Tesztek az SNMP lekérdezési funkciókhoz.
 Async függvények teszteléséhez pytest-asyncio használata.
 """
 
-import sys
-from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Projekt gyökér hozzáadása a path-hoz
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from network_health_checker.network_tools.snmp_query import (
+    _get_engine,
+    _get_transport,
     _safe_int,
     check_snmp_reachable,
+    close_snmp,
     get_interface_stats,
     get_interfaces,
     get_system_info,
     snmp_get,
     snmp_get_bulk,
+    snmp_get_many,
 )
 
 
 class TestSafeInt:
     """_safe_int helper függvény tesztjei."""
 
-    def test_valid_integer(self):
-        """Érvényes integer konverzió."""
-        assert _safe_int(42) == 42
-        assert _safe_int("42") == 42
-
-    def test_none_returns_none(self):
-        """None bemenet None kimenetet ad."""
-        assert _safe_int(None) is None
-
-    def test_invalid_string_returns_none(self):
-        """Érvénytelen string None-t ad."""
-        assert _safe_int("invalid") is None
-        assert _safe_int("") is None
-
-    def test_float_converts(self):
-        """Float integer-re konvertálódik."""
-        assert _safe_int(42.7) == 42
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (42, 42),  # érvényes integer
+            ("42", 42),  # numerikus string
+            (None, None),  # None bemenet
+            ("invalid", None),  # érvénytelen string
+            ("", None),  # üres string
+            (42.7, 42),  # float csonkolva
+        ],
+    )
+    def test_safe_int(self, value, expected):
+        """Biztonságos integer konverzió, hiba esetén None."""
+        assert _safe_int(value) == expected
 
 
-@pytest.mark.asyncio
 class TestSnmpGet:
     """snmp_get async függvény tesztjei."""
 
@@ -57,19 +53,80 @@ class TestSnmpGet:
         # Mock hiba esetén None
         assert result is None
 
-    async def test_returns_none_on_timeout(self):
+    async def test_returns_none_on_timeout(self, mock_snmp_timeout):
         """Timeout esetén None visszaadása."""
-        # Rövid timeout nem létező host-ra
         result = await snmp_get("192.168.254.254", "1.3.6.1.2.1.1.1.0", timeout=0.1)
-        # Valós hálózat nélkül valószínűleg None
-        # Reason: Ez integrációs teszt lenne, mockkolni kellene
-        pass
+
+        assert result is None
+        mock_snmp_timeout.assert_awaited_once()
+
+
+class TestSnmpGetMany:
+    """snmp_get_many async függvény tesztjei."""
+
+    async def test_single_request_for_all_oids(self, mock_snmp_get_many_response):
+        """Minden OID egyetlen GET kérésben, az értékek sorrendben."""
+        oids = ["1.3.6.1.2.1.1.1.0", "1.3.6.1.2.1.1.5.0"]
+        result = await snmp_get_many("192.168.1.1", oids)
+
+        assert result == ["Linux router 5.4.0", "router01"]
+        assert mock_snmp_get_many_response.call_count == 1
+
+    async def test_native_integers(self, mock_snmp_get_many_response):
+        """as_str=False esetén az egész típusok int-ként, a szöveg változatlan."""
+        from pysnmp.proto.rfc1902 import OctetString, TimeTicks
+
+        mock_snmp_get_many_response.return_value = (
+            None,
+            0,
+            0,
+            [
+                ("1.3.6.1.2.1.1.3.0", TimeTicks(123456700)),
+                ("1.3.6.1.2.1.1.5.0", OctetString("router01")),
+            ],
+        )
+        oids = ["1.3.6.1.2.1.1.3.0", "1.3.6.1.2.1.1.5.0"]
+
+        assert await snmp_get_many("192.168.1.1", oids, as_str=False) == [123456700, "router01"]
+        assert await snmp_get_many("192.168.1.1", oids) == ["123456700", "router01"]
+
+    async def test_returns_nones_on_error(self, mock_snmp_error):
+        """Hiba esetén minden értékhez None."""
+        result = await snmp_get_many("192.168.1.1", ["1.3.6.1.2.1.1.1.0", "1.3.6.1.2.1.1.5.0"])
+
+        assert result == [None, None]
+
+
+class TestSharedTransport:
+    """Megosztott SnmpEngine és transport cache tesztjei."""
+
+    async def test_transport_created_once(self, mock_transport_create):
+        """Ugyanarra a célra a transport csak egyszer jön létre."""
+        first = await _get_transport("192.168.1.1", 161, 1.0)
+        second = await _get_transport("192.168.1.1", 161, 1.0)
+
+        assert first is second
+        assert mock_transport_create.call_count == 1
+        assert _get_engine() is _get_engine()
+
+    async def test_close_snmp_clears_cache(self, mock_transport_create):
+        """close_snmp után új transport és engine jön létre."""
+        engine = _get_engine()
+        await _get_transport("192.168.1.1", 161, 1.0)
+        close_snmp()
+        await _get_transport("192.168.1.1", 161, 1.0)
+
+        assert mock_transport_create.call_count == 2
+        assert _get_engine() is not engine
 
 
-@pytest.mark.asyncio
 class TestSnmpGetBulk:
     """snmp_get_bulk async függvény tesztjei."""
 
+    async def test_returns_empty_list_on_symbolic_oid(self):
+        """Nem numerikus OID esetén üres lista, kivétel nélkül."""
+        assert await snmp_get_bulk("192.168.1.1", "IF-MIB::ifDescr") == []
+
     async def test_returns_empty_list_on_error(self):
         """Hiba esetén üres lista visszaadása."""
         # Nem létező host
@@ -79,53 +136,100 @@ class TestSnmpGetBulk:
         # Timeout vagy hiba esetén üres lista
         assert isinstance(result, list)
 
+    async def test_stops_at_column_boundary(self, mock_bulk_walk):
+        """A walk az OID prefixen túl megáll (...1.1 nem illeszkedik ...1.10-re)."""
+        result = await snmp_get_bulk("192.168.1.1", "1.3.6.1.2.1.2.2.1.1")
+
+        assert result == [
+            ("1.3.6.1.2.1.2.2.1.1.1", "1"),
+            ("1.3.6.1.2.1.2.2.1.1.2", "2"),
+        ]
+
 
-@pytest.mark.asyncio
 class TestGetSystemInfo:
     """get_system_info async függvény tesztjei."""
 
-    async def test_returns_none_on_unreachable(self):
+    async def test_returns_none_on_unreachable(self, mock_snmp_timeout):
         """Nem elérhető host esetén None."""
         result = await get_system_info("192.168.254.254")
-        # Valószínűleg timeout vagy None
-        # Reason: Integrációs teszt lenne
-        pass
+
+        assert result is None
 
     async def test_returns_network_device_on_success(self, mock_snmp_system_info):
         """Sikeres lekérdezés NetworkDevice objektumot ad."""
         # Mock a sikeres SNMP válaszhoz
-        with patch("network_health_checker.network_tools.snmp_query.snmp_get", new=mock_snmp_system_info):
+        with patch("network_health_checker.network_tools.snmp_query.snmp_get_many", new=mock_snmp_system_info):
             result = await get_system_info("192.168.1.1")
-            # Ha a mock működik, NetworkDevice objektumot kapunk
-            if result:
-                assert result.host == "192.168.1.1"
+
+        assert result is not None
+        assert result.host == "192.168.1.1"
+        assert result.sys_name == "router01"
+        assert result.sys_location == "Server Room"
+        assert result.uptime_seconds == 1234567
 
 
-@pytest.mark.asyncio
 class TestGetInterfaces:
     """get_interfaces async függvény tesztjei."""
 
-    async def test_returns_list(self):
+    async def test_returns_list(self, mock_snmp_walk_empty):
         """Lista visszaadása (üres is lehet)."""
         result = await get_interfaces("192.168.254.254")
         assert isinstance(result, list)
 
+    async def test_joins_columns_by_index(self, mock_if_table):
+        """Az oszlop walk-ok eredményei index szerint összefésülve."""
+        result = await get_interfaces("192.168.1.1")
+
+        assert [iface.index for iface in result] == [1, 2]
+        assert result[0].name == "ether1"
+        assert result[0].oper_status == "up"
+        assert result[0].in_octets == 1000
+        assert result[1].name == "ether2"
+        assert result[1].oper_status == "down"
+        assert result[1].speed == 100000000
+        assert result[0].phys_address == "00:1a:2b:3c:4d:5e"
+        assert result[1].phys_address == "72:6f:75:74:65:72"
+        # 1 ifIndex walk + 8 oszlop walk, nem interfészenkénti GET-ek
+        assert mock_if_table.call_count == 9
+
+    async def test_column_walks_are_bounded(self, mock_if_table):
+        """Az oszlop walk-ok párhuzamosan, de korlátozott számban futnak."""
+        import asyncio
+
+        from network_health_checker.network_tools import snmp_query
+
+        running = 0
+        peak = 0
+        fetch_rows = mock_if_table.side_effect
+
+        async def slow_snmp_get_bulk(host, oid, community=None, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await fetch_rows(host, oid, community)
+
+        mock_if_table.side_effect = slow_snmp_get_bulk
+        result = await get_interfaces("192.168.1.1")
+
+        assert len(result) == 2
+        assert 1 < peak <= snmp_query._MAX_CONCURRENT_WALKS
+
 
-@pytest.mark.asyncio
 class TestGetInterfaceStats:
     """get_interface_stats async függvény tesztjei."""
 
-    async def test_returns_dict(self):
+    async def test_returns_dict(self, mock_snmp_walk_empty):
         """Dictionary visszaadása."""
         result = await get_interface_stats("192.168.254.254")
         assert isinstance(result, dict)
 
 
-@pytest.mark.asyncio
 class TestCheckSnmpReachable:
     """check_snmp_reachable async függvény tesztjei."""
 
-    async def test_returns_false_for_unreachable(self):
+    async def test_returns_false_for_unreachable(self, mock_snmp_timeout):
         """Nem elérhető host False-t ad."""
         result = await check_snmp_reachable("192.168.254.254", timeout=0.1)
         assert result is False
@@ -140,27 +244,137 @@ class TestCheckSnmpReachable:
 def mock_snmp_error():
     """Mock SNMP hiba esetéhez."""
     with patch("network_health_checker.network_tools.snmp_query.get_cmd") as mock_get:
-        # SNMP error szimulálása
-        async def mock_result(*args, **kwargs):
-            return ("Error", None, None, [])
+        # SNMP error szimulálása (a get_cmd async, így a patch AsyncMock-ot
+        # ad, amelynek return_value-ja maga az await eredménye)
+        mock_get.return_value = ("Error", None, None, [])
+        yield mock_get
 
-        mock_get.return_value = mock_result()
+
+@pytest.fixture
+def mock_snmp_timeout():
+    """Mock nem válaszoló eszközhöz (valós hálózati timeout kivárása nélkül)."""
+    with patch("network_health_checker.network_tools.snmp_query.get_cmd") as mock_get:
+        # A pysnmp timeout esetén error_indication-t ad vissza, kivételt nem dob
+        mock_get.return_value = ("No SNMP response received before timeout", 0, 0, [])
         yield mock_get
 
 
 @pytest.fixture
+def mock_snmp_get_many_response():
+    """Mock sikeres több OID-os GET válaszhoz."""
+    with patch("network_health_checker.network_tools.snmp_query.get_cmd") as mock_get, patch(
+        "network_health_checker.network_tools.snmp_query.UdpTransportTarget.create",
+        new=AsyncMock(),
+    ):
+        var_binds = [
+            ("1.3.6.1.2.1.1.1.0", MagicMock(prettyPrint=lambda: "Linux router 5.4.0")),
+            ("1.3.6.1.2.1.1.5.0", MagicMock(prettyPrint=lambda: "router01")),
+        ]
+        # A get_cmd async függvény, így a patch AsyncMock-ot ad
+        mock_get.return_value = (None, 0, 0, var_binds)
+        yield mock_get
+
+
+@pytest.fixture
+def mock_transport_create():
+    """Mock UDP transport létrehozáshoz, tiszta cache-sel."""
+    close_snmp()
+    with patch(
+        "network_health_checker.network_tools.snmp_query.UdpTransportTarget.create",
+        new=AsyncMock(side_effect=lambda *args, **kwargs: MagicMock()),
+    ) as mock_create:
+        yield mock_create
+    close_snmp()
+
+
+@pytest.fixture
+def mock_bulk_walk(mock_transport_create):
+    """Mock GETBULK walk, amely a kért oszlopon túl is ad sort."""
+
+    def var_bind(oid, value):
+        name = MagicMock()
+        name.asTuple.return_value = tuple(int(x) for x in oid.split("."))
+        return name, MagicMock(prettyPrint=lambda: value)
+
+    async def mock_walk(*args, **kwargs):
+        yield None, 0, 0, [var_bind("1.3.6.1.2.1.2.2.1.1.1", "1")]
+        yield None, 0, 0, [var_bind("1.3.6.1.2.1.2.2.1.1.2", "2")]
+        yield None, 0, 0, [var_bind("1.3.6.1.2.1.2.2.1.10.1", "1000")]
+
+    with patch(
+        "network_health_checker.network_tools.snmp_query.bulk_walk_cmd",
+        new=mock_walk,
+    ):
+        yield
+
+
+@pytest.fixture
+def mock_snmp_walk_empty():
+    """Mock nem válaszoló eszközhöz (üres GETBULK walk)."""
+    with patch(
+        "network_health_checker.network_tools.snmp_query.snmp_get_bulk",
+        new=AsyncMock(return_value=[]),
+    ) as mock_bulk:
+        yield mock_bulk
+
+
+@pytest.fixture(scope="session")
+def if_table_responder():
+    """
+    IF-MIB ifTable két interfésszel: snmp_get_bulk helyettesítő függvény.
+
+    Tiszta adat + függvény, patch nélkül, így session szinten egyszer készül.
+    """
+    from pysnmp.proto.rfc1902 import OctetString
+
+    if_table = {
+        "1.3.6.1.2.1.2.2.1.1": ["1", "2"],  # ifIndex
+        "1.3.6.1.2.1.2.2.1.2": ["ether1", "ether2"],  # ifDescr
+        "1.3.6.1.2.1.2.2.1.3": ["6", "6"],  # ifType
+        "1.3.6.1.2.1.2.2.1.4": ["1500", "1500"],  # ifMtu
+        "1.3.6.1.2.1.2.2.1.5": ["1000000000", "100000000"],  # ifSpeed
+        # ifPhysAddress: nyers 6 bájtos OctetString (a második csupa nyomtatható bájt)
+        "1.3.6.1.2.1.2.2.1.6": [OctetString(hexValue="001a2b3c4d5e"), OctetString(b"router")],
+        "1.3.6.1.2.1.2.2.1.8": ["1", "2"],  # ifOperStatus
+        "1.3.6.1.2.1.2.2.1.10": ["1000", "2000"],  # ifInOctets
+        "1.3.6.1.2.1.2.2.1.16": ["3000", "4000"],  # ifOutOctets
+    }
+
+    async def mock_snmp_get_bulk(host, oid, community=None, **kwargs):
+        return [(f"{oid}.{i}", value) for i, value in enumerate(if_table.get(oid, []), start=1)]
+
+    return mock_snmp_get_bulk
+
+
+@pytest.fixture
+def mock_if_table(if_table_responder):
+    """Mock IF-MIB ifTable két interfésszel, oszloponkénti walk válaszokkal."""
+    with patch(
+        "network_health_checker.network_tools.snmp_query.snmp_get_bulk",
+        new=AsyncMock(side_effect=if_table_responder),
+    ) as mock_bulk:
+        yield mock_bulk
+
+
+# A system MIB válaszai; csak olvasható, minden hívás ugyanazt a dict-et használja
+_SYSTEM_OID_VALUES = MappingProxyType(
+    {
+        "1.3.6.1.2.1.1.1.0": "Linux router 5.4.0",  # sysDescr
+        "1.3.6.1.2.1.1.2.0": "1.3.6.1.4.1.9999",  # sysObjectID
+        "1.3.6.1.2.1.1.3.0": "123456700",  # sysUpTime (timeticks)
+        "1.3.6.1.2.1.1.4.0": "admin@example.com",  # sysContact
+        "1.3.6.1.2.1.1.5.0": "router01",  # sysName
+        "1.3.6.1.2.1.1.6.0": "Server Room",  # sysLocation
+    }
+)
+
+
+async def _mock_system_get_many(host, oids, community=None, **kwargs):
+    """snmp_get_many helyettesítő a _SYSTEM_OID_VALUES alapján."""
+    return [_SYSTEM_OID_VALUES.get(oid) for oid in oids]
+
+
+@pytest.fixture(scope="session")
 def mock_snmp_system_info():
-    """Mock sikeres SNMP system info lekérdezéshez."""
-
-    async def mock_snmp_get(host, oid, community=None, **kwargs):
-        oid_values = {
-            "1.3.6.1.2.1.1.1.0": "Linux router 5.4.0",  # sysDescr
-            "1.3.6.1.2.1.1.2.0": "1.3.6.1.4.1.9999",  # sysObjectID
-            "1.3.6.1.2.1.1.3.0": "123456700",  # sysUpTime (timeticks)
-            "1.3.6.1.2.1.1.4.0": "admin@example.com",  # sysContact
-            "1.3.6.1.2.1.1.5.0": "router01",  # sysName
-            "1.3.6.1.2.1.1.6.0": "Server Room",  # sysLocation
-        }
-        return oid_values.get(oid)
-
-    return mock_snmp_get
+    """Mock sikeres SNMP system info lekérdezéshez (patch nélküli függvény)."""
+    return _mock_system_get_many
@@ -4,19 +4,16 @@ Subnet Calculator tesztek.
 Tesztek az IP és alhálózat számítási funkciókhoz.
 """
 
-import sys
-from pathlib import Path
+from itertools import islice
 
 import pytest
 
-# Projekt gyökér hozzáadása a path-hoz
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from network_health_checker.network_tools.subnet_calculator import (
     calculate_subnet,
     cidr_to_netmask,
     get_subnet_hosts,
     ip_in_subnet,
+    ips_in_subnet,
     is_private_ip,
     is_valid_ip,
     iterate_subnet_hosts,
@@ -89,33 +86,83 @@ class TestCalculateSubnet:
         assert info.network == "192.168.1.1"
         assert info.total_hosts == 1
 
+    def test_whole_address_space(self):
+        """/0 hálózat host felsorolás nélkül."""
+        info = calculate_subnet("0.0.0.0/0")
+
+        assert info.netmask == "0.0.0.0"
+        assert info.broadcast == "255.255.255.255"
+        assert info.first_host == "0.0.0.1"
+        assert info.last_host == "255.255.255.254"
+        assert info.total_hosts == 2**32 - 2
+
+    def test_netmask_prefix_and_bare_address(self):
+        """Maszk formátumú prefix és prefix nélküli cím."""
+        assert calculate_subnet("10.1.2.3/255.255.0.0").network == "10.1.0.0"
+        assert calculate_subnet("10.1.2.3").cidr == 32
+
+    def test_invalid_prefix_raises_error(self):
+        """Érvénytelen prefix hosszra hibát dob."""
+        for cidr in ("10.0.0.0/33", "10.0.0.0/", "10.0.0.0/+8", "10.0.0/8"):
+            with pytest.raises(ValueError, match="Invalid CIDR"):
+                calculate_subnet(cidr)
+
 
 class TestIpInSubnet:
     """ip_in_subnet függvény tesztjei."""
 
-    def test_ip_in_subnet_true(self):
-        """IP benne van az alhálózatban."""
-        assert ip_in_subnet("192.168.1.100", "192.168.1.0/24") is True
+    @pytest.mark.parametrize(
+        "ip, cidr, expected",
+        [
+            ("192.168.1.100", "192.168.1.0/24", True),  # benne van
+            ("192.168.2.100", "192.168.1.0/24", False),  # nincs benne
+            ("192.168.1.0", "192.168.1.0/24", True),  # hálózati cím
+            ("192.168.1.255", "192.168.1.0/24", True),  # broadcast cím
+            ("invalid", "192.168.1.0/24", False),  # érvénytelen IP
+            ("192.168.1.100", "invalid", False),  # érvénytelen CIDR
+        ],
+    )
+    def test_ip_in_subnet(self, ip, cidr, expected):
+        """IP tagság ellenőrzése; érvénytelen bemenet False-t ad."""
+        assert ip_in_subnet(ip, cidr) is expected
+
+    def test_repeated_cidr_is_parsed_once(self):
+        """Ugyanaz a CIDR ismételt ellenőrzésnél a cache-ből jön."""
+        from network_health_checker.network_tools.subnet_calculator import _parse_cidr
+
+        _parse_cidr.cache_clear()
+        for last_octet in range(10):
+            assert ip_in_subnet(f"10.20.0.{last_octet}", "10.20.0.0/16") is True
+
+        assert _parse_cidr.cache_info().misses == 1
+        assert _parse_cidr.cache_info().hits == 9
 
-    def test_ip_not_in_subnet(self):
-        """IP nincs benne az alhálózatban."""
-        assert ip_in_subnet("192.168.2.100", "192.168.1.0/24") is False
+    def test_cidr_cache_is_shared(self):
+        """A CIDR feldolgozás cache-e közös a modul függvényei között."""
+        from network_health_checker.network_tools.subnet_calculator import _parse_cidr
 
-    def test_network_address_in_subnet(self):
-        """Hálózati cím benne van az alhálózatban."""
-        assert ip_in_subnet("192.168.1.0", "192.168.1.0/24") is True
+        _parse_cidr.cache_clear()
+        calculate_subnet("10.30.0.0/30")
+        get_subnet_hosts("10.30.0.0/30")
+        split_subnet("10.30.0.0/30", 31)
+        ip_in_subnet("10.30.0.1", "10.30.0.0/30")
 
-    def test_broadcast_address_in_subnet(self):
-        """Broadcast cím benne van az alhálózatban."""
-        assert ip_in_subnet("192.168.1.255", "192.168.1.0/24") is True
+        assert _parse_cidr.cache_info().misses == 1
+        assert _parse_cidr.cache_info().hits == 3
 
-    def test_invalid_ip_returns_false(self):
-        """Érvénytelen IP False-t ad vissza."""
-        assert ip_in_subnet("invalid", "192.168.1.0/24") is False
 
-    def test_invalid_cidr_returns_false(self):
-        """Érvénytelen CIDR False-t ad vissza."""
-        assert ip_in_subnet("192.168.1.100", "invalid") is False
+class TestIpsInSubnet:
+    """ips_in_subnet függvény tesztjei."""
+
+    def test_batch_membership(self):
+        """Több IP egyszerre, sorrendtartóan, érvénytelen IP False."""
+        ips = ["192.168.1.10", "10.0.0.1", "invalid", "192.168.1.1\x00", "192.168.1.255"]
+
+        assert ips_in_subnet(ips, "192.168.1.0/24") == [True, False, False, False, True]
+
+    def test_invalid_cidr_all_false(self):
+        """Érvénytelen CIDR esetén minden érték False."""
+        assert ips_in_subnet(["192.168.1.10", "10.0.0.1"], "invalid") == [False, False]
 
 
 class TestGetSubnetHosts:
@@ -136,6 +183,12 @@ class TestGetSubnetHosts:
         assert len(hosts) == 10
         assert hosts[0] == "192.168.1.1"
 
+    def test_limit_on_large_network(self):
+        """Nagy hálózatnál is csak a limitnyi cím készül el."""
+        hosts = get_subnet_hosts("10.0.0.0/8", limit=3)
+
+        assert hosts == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
     def test_invalid_cidr_returns_empty(self):
         """Érvénytelen CIDR üres listát ad."""
         hosts = get_subnet_hosts("invalid")
@@ -159,62 +212,68 @@ class TestIterateSubnetHosts:
 
         assert hosts == []
 
+    def test_iterate_is_lazy(self):
+        """A generátor lusta: egy /0 hálózat első címei azonnal elérhetők."""
+        # Ha az összes (~4 milliárd) cím előre elkészülne, ez a teszt elakadna
+        hosts = iterate_subnet_hosts("0.0.0.0/0")
 
-class TestNetmaskToCidr:
-    """netmask_to_cidr függvény tesztjei."""
-
-    def test_class_c_mask(self):
-        """Class C maszk konvertálása."""
-        assert netmask_to_cidr("255.255.255.0") == 24
+        assert list(islice(hosts, 3)) == ["0.0.0.1", "0.0.0.2", "0.0.0.3"]
+        assert next(hosts) == "0.0.0.4"
 
-    def test_class_b_mask(self):
-        """Class B maszk konvertálása."""
-        assert netmask_to_cidr("255.255.0.0") == 16
 
-    def test_class_a_mask(self):
-        """Class A maszk konvertálása."""
-        assert netmask_to_cidr("255.0.0.0") == 8
-
-    def test_small_subnet_mask(self):
-        """/30 maszk konvertálása."""
-        assert netmask_to_cidr("255.255.255.252") == 30
+class TestNetmaskToCidr:
+    """netmask_to_cidr függvény tesztjei."""
 
-    def test_invalid_mask_raises_error(self):
-        """Érvénytelen maszk hibát dob."""
+    @pytest.mark.parametrize(
+        "netmask, expected",
+        [
+            ("255.255.255.0", 24),  # Class C
+            ("255.255.0.0", 16),  # Class B
+            ("255.0.0.0", 8),  # Class A
+            ("255.255.255.252", 30),  # kis alhálózat
+            ("0.0.0.0", 0),  # /0
+            ("255.255.255.255", 32),  # /32
+        ],
+    )
+    def test_converts_mask(self, netmask, expected):
+        """Maszk konvertálása prefix hosszra."""
+        assert netmask_to_cidr(netmask) == expected
+
+    @pytest.mark.parametrize(
+        "netmask",
+        [
+            "invalid",  # nem cím
+            "255.0.255.0",  # nem folytonos
+        ],
+    )
+    def test_invalid_mask_raises_error(self, netmask):
+        """Érvénytelen vagy nem folytonos maszk hibát dob."""
         with pytest.raises(ValueError, match="Invalid netmask"):
-            netmask_to_cidr("invalid")
+            netmask_to_cidr(netmask)
 
 
 class TestCidrToNetmask:
     """cidr_to_netmask függvény tesztjei."""
 
-    def test_cidr_24(self):
-        """/24 konvertálása."""
-        assert cidr_to_netmask(24) == "255.255.255.0"
-
-    def test_cidr_16(self):
-        """/16 konvertálása."""
-        assert cidr_to_netmask(16) == "255.255.0.0"
-
-    def test_cidr_8(self):
-        """/8 konvertálása."""
-        assert cidr_to_netmask(8) == "255.0.0.0"
-
-    def test_cidr_0(self):
-        """/0 konvertálása (default route)."""
-        assert cidr_to_netmask(0) == "0.0.0.0"
-
-    def test_cidr_32(self):
-        """/32 konvertálása (host route)."""
-        assert cidr_to_netmask(32) == "255.255.255.255"
-
-    def test_invalid_cidr_raises_error(self):
+    @pytest.mark.parametrize(
+        "cidr, expected",
+        [
+            (24, "255.255.255.0"),
+            (16, "255.255.0.0"),
+            (8, "255.0.0.0"),
+            (0, "0.0.0.0"),  # default route
+            (32, "255.255.255.255"),  # host route
+        ],
+    )
+    def test_converts_prefix(self, cidr, expected):
+        """Prefix hossz konvertálása maszkra."""
+        assert cidr_to_netmask(cidr) == expected
+
+    @pytest.mark.parametrize("cidr", [33, -1])
+    def test_invalid_cidr_raises_error(self, cidr):
         """Érvénytelen CIDR érték hibát dob."""
         with pytest.raises(ValueError, match="Invalid CIDR prefix"):
-            cidr_to_netmask(33)
-
-        with pytest.raises(ValueError, match="Invalid CIDR prefix"):
-            cidr_to_netmask(-1)
+            cidr_to_netmask(cidr)
 
 
 class TestSplitSubnet:
@@ -248,45 +307,48 @@ class TestSplitSubnet:
 class TestIsPrivateIp:
     """is_private_ip függvény tesztjei."""
 
-    def test_class_a_private(self):
-        """10.x.x.x privát tartomány."""
-        assert is_private_ip("10.0.0.1") is True
-        assert is_private_ip("10.255.255.255") is True
-
-    def test_class_b_private(self):
-        """172.16-31.x.x privát tartomány."""
-        assert is_private_ip("172.16.0.1") is True
-        assert is_private_ip("172.31.255.255") is True
-        # 172.32.x.x már nem privát
-        assert is_private_ip("172.32.0.1") is False
-
-    def test_class_c_private(self):
-        """192.168.x.x privát tartomány."""
-        assert is_private_ip("192.168.0.1") is True
-        assert is_private_ip("192.168.255.255") is True
-
-    def test_public_ip(self):
-        """Publikus IP cím."""
-        assert is_private_ip("8.8.8.8") is False
-        assert is_private_ip("1.1.1.1") is False
-
-    def test_invalid_ip_returns_false(self):
-        """Érvénytelen IP False-t ad vissza."""
-        assert is_private_ip("invalid") is False
+    @pytest.mark.parametrize(
+        "ip, expected",
+        [
+            ("10.0.0.1", True),  # 10.x.x.x
+            ("10.255.255.255", True),
+            ("172.16.0.1", True),  # 172.16-31.x.x
+            ("172.31.255.255", True),
+            ("172.32.0.1", False),  # 172.32.x.x már nem privát
+            ("192.168.0.1", True),  # 192.168.x.x
+            ("192.168.255.255", True),
+            ("8.8.8.8", False),  # publikus
+            ("1.1.1.1", False),
+            ("127.0.0.1", True),  # loopback
+            ("169.254.10.20", True),  # link-local
+            ("169.255.0.1", False),
+            ("invalid", False),  # érvénytelen IP
+        ],
+    )
+    def test_is_private_ip(self, ip, expected):
+        """Privát, loopback és link-local tartományok felismerése."""
+        assert is_private_ip(ip) is expected
 
 
 class TestIsValidIp:
     """is_valid_ip függvény tesztjei."""
 
-    def test_valid_ip(self):
-        """Érvényes IPv4 címek."""
-        assert is_valid_ip("192.168.1.1") is True
-        assert is_valid_ip("0.0.0.0") is True
-        assert is_valid_ip("255.255.255.255") is True
-
-    def test_invalid_ip(self):
-        """Érvénytelen címek."""
-        assert is_valid_ip("invalid") is False
-        assert is_valid_ip("256.1.1.1") is False
-        assert is_valid_ip("1.1.1") is False
-        assert is_valid_ip("") is False
+    @pytest.mark.parametrize(
+        "ip, expected",
+        [
+            ("192.168.1.1", True),
+            ("0.0.0.0", True),
+            ("255.255.255.255", True),
+            ("invalid", False),
+            ("256.1.1.1", False),  # oktett túl nagy
+            ("1.1.1", False),  # hiányzó oktett
+            ("", False),
+            ("10", False),  # rövidített alak
+            ("01.2.3.4", False),  # vezető nulla
+            ("1.2.3.4 x", False),  # szeméttel zárt
+            ("1.2.3.4\x00", False),  # beágyazott NUL karakter
+        ],
+    )
+    def test_is_valid_ip(self, ip, expected):
+        """IPv4 cím formátum validálása."""
+        assert is_valid_ip(ip) is expected
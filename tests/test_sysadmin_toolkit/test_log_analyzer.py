@@ -6,15 +6,17 @@ Tesztek a log elemző modulhoz.
 
 import tempfile
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/tests/", 1)[0] + "/1-sysadmin-toolkit")
-
 from toolkit.log_analyzer import (
+    AUTH_FAILURE_PATTERNS,
+    AUTH_SUCCESS_PATTERNS,
     LogAnalyzer,
+    _match_syslog_line,
+    _parse_syslog_header,
+    _parse_syslog_timestamp,
+    _scan_syslog_line,
     analyze_logs,
     parse_auth_log,
     parse_syslog,
@@ -85,6 +87,92 @@ class TestLogAnalyzer:
         assert analyzer._detect_level("Warning: disk full") == LogLevel.WARNING
         assert analyzer._detect_level("Normal message") == LogLevel.INFO
 
+    @pytest.mark.parametrize(
+        "message, expected",
+        [
+            ("error: disk critical", LogLevel.CRITICAL),  # priority, not position
+            ("WARNING: retrying", LogLevel.WARNING),  # case-insensitive
+            ("errors=0 warned=1", LogLevel.INFO),  # whole words only
+            ("sda: I/O error (hibás szektor)", LogLevel.ERROR),  # non-ASCII message
+        ],
+    )
+    def test_detect_level_keywords(self, message, expected):
+        """Test keyword matching rules of level detection."""
+        assert LogAnalyzer._detect_level(message) == expected
+
+    def test_detect_level_is_cached(self):
+        """Test that repeated messages reuse the cached level."""
+        LogAnalyzer._detect_level.cache_clear()
+        for _ in range(3):
+            assert LogAnalyzer._detect_level("disk error on sda") == LogLevel.ERROR
+
+        assert LogAnalyzer._detect_level.cache_info().misses == 1
+        assert LogAnalyzer._detect_level.cache_info().hits == 2
+
+    @pytest.mark.parametrize("line", SAMPLE_SYSLOG_LINES + SAMPLE_AUTH_LOG_LINES)
+    def test_fast_path_matches_regex(self, line):
+        """Test that the regex-free scanner agrees with SYSLOG_PATTERN."""
+        fields = _scan_syslog_line(line, 2024)
+
+        assert fields is not None
+        assert fields == _match_syslog_line(line, 2024)
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Dec 4 10:30:15 server01 sshd[1234]: unpadded day",
+            "dec  4 10:30:15 server01 sshd[1234]: lowercase month",
+            "Dec  4 10:30:15  server01\tsshd[1234]: extra whitespace",
+        ],
+    )
+    def test_nonstandard_line_falls_back_to_regex(self, line):
+        """Test that lines outside the fixed layout are still parsed by the regex."""
+        analyzer = LogAnalyzer(year=2024)
+
+        assert _scan_syslog_line(line, 2024) is None
+        entry = analyzer.parse_syslog_line(line)
+        assert entry is not None
+        assert entry.timestamp == datetime(2024, 12, 4, 10, 30, 15)
+        assert entry.program == "sshd"
+        assert entry.pid == 1234
+
+    def test_shared_timestamp_is_parsed_once(self):
+        """Test that lines logged in the same second reuse the parsed timestamp."""
+        analyzer = LogAnalyzer(year=2024)
+        _parse_syslog_timestamp.cache_clear()
+
+        first = analyzer.parse_syslog_line(SAMPLE_AUTH_LOG_LINES[0])
+        second = analyzer.parse_syslog_line(SAMPLE_SYSLOG_LINES[0].replace("1234", "1240"))
+
+        assert first.timestamp == second.timestamp
+        assert _parse_syslog_timestamp.cache_info().hits == 1
+
+    def test_repeated_header_is_parsed_once(self):
+        """Test that lines from the same process reuse the parsed header."""
+        analyzer = LogAnalyzer(year=2024)
+        _parse_syslog_header.cache_clear()
+
+        for line in SAMPLE_SYSLOG_LINES[:2] * 2:
+            analyzer.parse_syslog_line(line)
+
+        assert _parse_syslog_header.cache_info().misses == 2
+        assert _parse_syslog_header.cache_info().hits == 2
+
+    def test_parse_hostname_with_colons(self):
+        """Test that the program is found after an IPv6 hostname."""
+        analyzer = LogAnalyzer(year=2024)
+        entry = analyzer.parse_syslog_line("Dec  4 10:30:15 fe80::1 sshd[42]: hello")
+
+        assert entry.hostname == "fe80::1"
+        assert entry.program == "sshd"
+        assert entry.pid == 42
+        assert entry.message == "hello"
+
+    def test_parse_invalid_date_returns_none(self):
+        """Test that an impossible date is rejected."""
+        analyzer = LogAnalyzer(year=2023)
+        assert analyzer.parse_syslog_line("Feb 29 10:30:15 server01 cron: msg") is None
+
 
 class TestParseSyslog:
     """Tests for parse_syslog function."""
@@ -147,6 +235,47 @@ class TestAnalyzeLogs:
             assert result.successful_logins >= 1
             assert result.failed_logins >= 1
 
+    def test_auth_prefilter_matches_patterns(self):
+        """Test that keyword dispatch counts the same as trying every pattern."""
+        analyzer = LogAnalyzer(year=2024)
+        lines = SAMPLE_SYSLOG_LINES + SAMPLE_AUTH_LOG_LINES + [
+            "Dec  4 10:30:20 server01 sshd[1238]: Accepted publickey for deploy from 10.0.0.4",
+            "Dec  4 10:30:21 server01 login: pam_unix(login:auth): authentication failure; user=bob",
+            "Dec  4 10:30:22 server01 app[1]: Failed to start worker",
+            "Dec  4 10:30:23 server01 app[1]: Accepted connection",
+        ]
+        entries = [analyzer.parse_syslog_line(line) for line in lines]
+
+        result = analyzer.analyze(entries)
+
+        assert result.successful_logins == sum(
+            any(p.search(e.message) for p in AUTH_SUCCESS_PATTERNS) for e in entries
+        )
+        assert result.failed_logins == sum(
+            any(p.search(e.message) for p in AUTH_FAILURE_PATTERNS) for e in entries
+        )
+        assert (result.successful_logins, result.failed_logins) == (4, 5)
+
+    def test_analyze_level_counts(self):
+        """Test per-level counts: only seen levels, plain int values."""
+        analyzer = LogAnalyzer(year=2024)
+        entries = [
+            analyzer.parse_syslog_line(line)
+            for line in SAMPLE_SYSLOG_LINES + SAMPLE_AUTH_LOG_LINES
+        ]
+        expected: dict[str, int] = {}
+        for entry in entries:
+            expected[entry.level.value] = expected.get(entry.level.value, 0) + 1
+
+        result = analyzer.analyze(entries)
+
+        assert result.entries_by_level == expected
+        assert all(type(count) is int for count in result.entries_by_level.values())
+        assert result.error_count == sum(
+            expected.get(level, 0) for level in ("error", "critical", "emergency")
+        )
+        assert result.warning_count == expected.get("warning", 0)
+
     def test_analyze_empty_file(self):
         """Test analyzing empty file."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
@@ -157,6 +286,18 @@ class TestAnalyzeLogs:
 
             assert result.total_entries == 0
 
+    def test_time_range_with_unordered_entries(self):
+        """Test that the time range does not assume chronological input."""
+        analyzer = LogAnalyzer(year=2024)
+        entries = [
+            analyzer.parse_syslog_line(SAMPLE_SYSLOG_LINES[i]) for i in (2, 4, 0, 3)
+        ]
+
+        result = analyzer.analyze(entries)
+
+        assert result.time_range_start == datetime(2024, 12, 4, 10, 30, 15)
+        assert result.time_range_end == datetime(2024, 12, 4, 10, 30, 19)
+
 
 class TestLogAnalyzerIntegration:
     """Integration tests for log analyzer."""
@@ -8,9 +8,6 @@ from datetime import datetime
 
 import pytest
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/tests/", 1)[0] + "/1-sysadmin-toolkit")
-
 from toolkit.models import (
     DirectorySize,
     DiskUsage,
@@ -8,11 +8,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/tests/", 1)[0] + "/1-sysadmin-toolkit")
-
 from toolkit.service_manager import (
     check_critical_services,
+    clear_service_cache,
     get_failed_services,
     get_service_logs,
     get_service_status,
@@ -21,6 +19,30 @@ from toolkit.service_manager import (
 from toolkit.models import ServiceState, ServiceStatus
 
 
+LIST_UNITS_OUTPUT = (
+    "nginx.service loaded active running nginx server\n"
+    "sshd.service loaded failed failed SSH daemon\n",
+    0,
+)
+
+SHOW_OUTPUT = (
+    "MainPID=1234\nDescription=nginx server\nLoadState=loaded\n"
+    "SubState=running\nActiveState=active\nUnitFileState=enabled\n"
+    "\n"
+    "MainPID=0\nDescription=SSH daemon\nLoadState=loaded\n"
+    "SubState=failed\nActiveState=failed\nUnitFileState=disabled\n",
+    0,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_service_cache():
+    """Each test sees its own mocked systemctl output, not a cached status."""
+    clear_service_cache()
+    yield
+    clear_service_cache()
+
+
 class TestGetServiceStatus:
     """Tests for get_service_status function."""
 
@@ -84,46 +106,97 @@ class TestGetServiceStatus:
         assert status.pid == 1234
         assert status.memory_bytes == 52428800
 
+    @patch("toolkit.service_manager._run_systemctl")
+    def test_service_status_is_cached(self, mock_run):
+        """Test that a repeated query within the TTL reuses the status."""
+        mock_run.side_effect = [("enabled", 0), ("active", 0), ("MainPID=1234\n", 0)]
+
+        first = get_service_status("test-service")
+        second = get_service_status("test-service")
+
+        assert second is first
+        assert mock_run.call_count == 3
+
+    @patch("toolkit.service_manager._run_systemctl")
+    def test_service_status_zero_ttl_refreshes(self, mock_run):
+        """Test that ttl=0 always queries systemctl again."""
+        mock_run.side_effect = [
+            ("enabled", 0), ("active", 0), ("MainPID=1234\n", 0),
+            ("enabled", 0), ("failed", 1), ("MainPID=0\n", 0),
+        ]
+
+        get_service_status("test-service", ttl=0)
+        status = get_service_status("test-service", ttl=0)
+
+        assert status.state == ServiceState.FAILED
+        assert mock_run.call_count == 6
+
 
 class TestListServices:
     """Tests for list_services function."""
 
-    @patch("toolkit.service_manager.get_service_status")
     @patch("toolkit.service_manager._run_systemctl")
-    def test_list_services_returns_list(self, mock_run, mock_status):
+    def test_list_services_returns_list(self, mock_run):
         """Test that list_services returns a list."""
-        mock_run.return_value = (
-            "nginx.service loaded active running nginx server\n"
-            "sshd.service loaded active running SSH daemon\n",
-            0,
-        )
-        mock_status.return_value = ServiceStatus(
-            name="test",
-            state=ServiceState.RUNNING,
-            is_enabled=True,
-            is_active=True,
-        )
+        mock_run.side_effect = [LIST_UNITS_OUTPUT, SHOW_OUTPUT]
 
         services = list_services()
         assert isinstance(services, list)
+        assert [s.name for s in services] == ["nginx", "sshd"]
 
-    @patch("toolkit.service_manager.get_service_status")
     @patch("toolkit.service_manager._run_systemctl")
-    def test_list_services_filter_by_state(self, mock_run, mock_status):
+    def test_list_services_single_show_call(self, mock_run):
+        """Test that all unit details come from one systemctl show call."""
+        mock_run.side_effect = [LIST_UNITS_OUTPUT, SHOW_OUTPUT]
+
+        nginx, sshd = list_services()
+
+        assert mock_run.call_count == 2
+        show_args = mock_run.call_args_list[1].args[0]
+        assert show_args[0] == "show"
+        assert show_args[-2:] == ["nginx.service", "sshd.service"]
+        assert nginx.state == ServiceState.RUNNING
+        assert nginx.is_enabled is True
+        assert nginx.pid == 1234
+        assert nginx.description == "nginx server"
+        assert sshd.state == ServiceState.FAILED
+        assert sshd.is_enabled is False
+
+    @patch("toolkit.service_manager._run_systemctl")
+    def test_list_services_filter_by_state(self, mock_run):
         """Test filtering by state."""
-        mock_run.return_value = (
-            "nginx.service loaded active running nginx\n",
-            0,
-        )
+        mock_run.side_effect = [LIST_UNITS_OUTPUT, SHOW_OUTPUT]
+
+        services = list_services(filter_state=ServiceState.RUNNING)
+        assert [s.name for s in services] == ["nginx"]
+        assert all(s.state == ServiceState.RUNNING for s in services)
+
+    @patch("toolkit.service_manager._run_systemctl")
+    def test_list_services_fills_status_cache(self, mock_run):
+        """Test that a follow-up get_service_status reuses the listed status."""
+        mock_run.side_effect = [LIST_UNITS_OUTPUT, SHOW_OUTPUT]
+
+        nginx, _ = list_services()
+
+        assert get_service_status("nginx") is nginx
+        assert mock_run.call_count == 2
+
+    @patch("toolkit.service_manager.get_service_status")
+    @patch("toolkit.service_manager._run_systemctl")
+    def test_list_services_falls_back_per_unit(self, mock_run, mock_status):
+        """Test per-unit queries when the batched show output is unusable."""
+        mock_run.side_effect = [LIST_UNITS_OUTPUT, ("", 1)]
         mock_status.return_value = ServiceStatus(
-            name="nginx",
+            name="test",
             state=ServiceState.RUNNING,
             is_enabled=True,
             is_active=True,
         )
 
-        services = list_services(filter_state=ServiceState.RUNNING)
-        assert all(s.state == ServiceState.RUNNING for s in services)
+        services = list_services()
+
+        assert len(services) == 2
+        assert [c.args[0] for c in mock_status.call_args_list] == ["nginx", "sshd"]
 
     @patch("toolkit.service_manager._run_systemctl")
     def test_list_services_empty_on_error(self, mock_run):
@@ -181,6 +254,26 @@ class TestCheckCriticalServices:
         # Should contain some default services
         assert len(results) > 0
 
+    @patch("toolkit.service_manager.get_service_status")
+    def test_check_critical_services_keeps_order(self, mock_status):
+        """Test that concurrent checks map each name to its own status."""
+        mock_status.side_effect = lambda name: ServiceStatus(
+            name=name,
+            state=ServiceState.RUNNING,
+            is_enabled=True,
+            is_active=True,
+        )
+
+        names = [f"svc{i}" for i in range(20)]
+        results = check_critical_services(names)
+
+        assert list(results) == names
+        assert all(results[name].name == name for name in names)
+
+    def test_check_critical_services_empty_list(self):
+        """Test that an empty list returns an empty dict."""
+        assert check_critical_services([]) == {}
+
 
 class TestGetFailedServices:
     """Tests for get_failed_services function."""
@@ -4,15 +4,18 @@ Tests for system health module.
 Tesztek a rendszer egészség modulhoz.
 """
 
+import sys
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import psutil
 import pytest
 
-import sys
-sys.path.insert(0, str(__file__).rsplit("/tests/", 1)[0] + "/1-sysadmin-toolkit")
-
 from toolkit.system_health import (
+    _cpu_count,
+    _hostname,
+    _physical_fstypes,
+    _read_proc_mounts,
     get_cpu_info,
     get_disk_info,
     get_memory_info,
@@ -22,6 +25,18 @@ from toolkit.system_health import (
 from toolkit.models import DiskUsage, ProcessInfo, SystemHealth
 
 
+@pytest.fixture(autouse=True)
+def fresh_static_cache():
+    """Clear the cached hostname and CPU count so patches take effect."""
+    _hostname.cache_clear()
+    _cpu_count.cache_clear()
+    _physical_fstypes.cache_clear()
+    yield
+    _hostname.cache_clear()
+    _cpu_count.cache_clear()
+    _physical_fstypes.cache_clear()
+
+
 class TestGetCPUInfo:
     """Tests for get_cpu_info function."""
 
@@ -102,6 +117,44 @@ class TestGetDiskInfo:
         # Filtered list should be same or smaller
         assert len(disks_filtered) <= len(disks_all)
 
+    def test_proc_mounts_parsing(self, tmp_path, monkeypatch):
+        """Test mount table parsing: virtual filesystems and escapes."""
+        filesystems = tmp_path / "filesystems"
+        filesystems.write_text("nodev\tsysfs\nnodev\ttmpfs\n\text4\nnodev\tzfs\n")
+        mounts = tmp_path / "mounts"
+        mounts.write_text(
+            "sysfs /sys sysfs rw 0 0\n"
+            "/dev/sda1 / ext4 rw 0 0\n"
+            "/dev/sdb1 /mnt/my\\040disk ext4 rw 0 0\n"
+            "tmpfs /run tmpfs rw 0 0\n"
+            "tank /tank zfs rw 0 0\n"
+            "none /none ext4 rw 0 0\n"
+        )
+        monkeypatch.setattr("toolkit.system_health._PROC_FILESYSTEMS", str(filesystems))
+        monkeypatch.setattr("toolkit.system_health._PROC_MOUNTS", str(mounts))
+        monkeypatch.setattr("toolkit.system_health.sys.platform", "linux")
+
+        assert _read_proc_mounts() == [
+            ("/dev/sda1", "/", "ext4"),
+            ("/dev/sdb1", "/mnt/my disk", "ext4"),
+            ("tank", "/tank", "zfs"),
+        ]
+
+    def test_proc_mounts_unavailable(self, monkeypatch):
+        """Test that a non-Linux platform falls back to psutil."""
+        monkeypatch.setattr("toolkit.system_health.sys.platform", "darwin")
+        assert _read_proc_mounts() is None
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+    def test_fast_path_matches_psutil(self):
+        """Test that the /proc fast path reports the same partitions as psutil."""
+        fast = get_disk_info(exclude_types=[])
+        with patch("toolkit.system_health._read_proc_mounts", return_value=None):
+            slow = get_disk_info(exclude_types=[])
+
+        assert [d.mountpoint for d in fast] == [d.mountpoint for d in slow]
+        assert [d.total_bytes for d in fast] == [d.total_bytes for d in slow]
+
 
 class TestGetTopProcesses:
     """Tests for get_top_processes function."""
@@ -136,6 +189,40 @@ class TestGetTopProcesses:
             # First should have >= memory than second
             assert procs[0].memory_percent >= procs[1].memory_percent
 
+    @patch("toolkit.system_health.psutil.process_iter")
+    def test_top_processes_stable_selection(self, mock_process_iter):
+        """Test that only the top entries are kept, ties in iteration order."""
+        cpu_by_pid = {1: 5.0, 2: 50.0, 3: None, 4: 50.0, 5: 20.0}
+        mock_process_iter.return_value = [
+            MagicMock(
+                info={"pid": pid, "name": f"proc{pid}", "cpu_percent": cpu},
+                **{"cmdline.return_value": [f"proc{pid}", "--flag"]},
+            )
+            for pid, cpu in cpu_by_pid.items()
+        ]
+
+        procs = get_top_processes(count=3, sort_by="cpu")
+
+        assert [p.pid for p in procs] == [2, 4, 5]
+        assert all(isinstance(p, ProcessInfo) for p in procs)
+        assert procs[0].cmdline == "proc2 --flag"
+
+    @patch("toolkit.system_health.psutil.process_iter")
+    def test_top_processes_cmdline_only_for_top(self, mock_process_iter):
+        """Test that cmdline is read only for the selected processes."""
+        procs_mock = [
+            MagicMock(info={"pid": pid, "cpu_percent": float(pid)})
+            for pid in range(1, 6)
+        ]
+        procs_mock[4].cmdline.side_effect = psutil.AccessDenied(5)
+        mock_process_iter.return_value = procs_mock
+
+        procs = get_top_processes(count=2, sort_by="cpu")
+
+        assert [p.pid for p in procs] == [5, 4]
+        assert procs[0].cmdline is None
+        assert all(not m.cmdline.called for m in procs_mock[:3])
+
 
 class TestGetSystemHealth:
     """Tests for get_system_health function."""
@@ -185,12 +272,31 @@ class TestGetSystemHealth:
         assert health.process_count > 0
 
 
+class TestStaticInfoCache:
+    """Tests for the cached hostname and CPU count."""
+
+    @patch("toolkit.system_health.socket.gethostname", return_value="cached-host")
+    def test_hostname_is_cached(self, mock_gethostname):
+        """Test that the hostname is looked up only once."""
+        assert _hostname() == "cached-host"
+        assert _hostname() == "cached-host"
+        assert mock_gethostname.call_count == 1
+
+    @patch("toolkit.system_health.psutil.cpu_count", return_value=8)
+    def test_cpu_count_is_cached(self, mock_cpu_count):
+        """Test that the CPU count is queried only once."""
+        assert _cpu_count() == 8
+        assert _cpu_count() == 8
+        assert mock_cpu_count.call_count == 1
+
+
 class TestSystemHealthMocked:
     """Tests for system health with mocked psutil."""
 
+    @patch("toolkit.system_health._read_proc_mounts", return_value=None)
     @patch("toolkit.system_health.psutil")
     @patch("toolkit.system_health.socket")
-    def test_system_health_with_mocked_psutil(self, mock_socket, mock_psutil):
+    def test_system_health_with_mocked_psutil(self, mock_socket, mock_psutil, _mounts):
         """Test system health with mocked values."""
         # Setup mocks
         mock_socket.gethostname.return_value = "test-host"